@@ -1,5 +1,5 @@
 # Type Definitions
-AbstractField = type('AbstractField', (object,), {})
+AbstractField = type('AbstractField', (object,), {'__slots__': ()})
 AbstractSchema = type('AbstractSchema', (object,), {})
 AbstractPolySchema = type('AbstractPolySchema', (AbstractSchema,), {})
 SchemaFieldDefault = type('SchemaFieldDefault', (object,), {})
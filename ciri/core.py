@@ -1,5 +1,12 @@
+import asyncio
+import inspect
 import logging
+import threading
+import weakref
 from abc import ABCMeta
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 from ciri.abstract import (AbstractField,
                            AbstractSchema,
@@ -7,17 +14,30 @@ from ciri.abstract import (AbstractField,
                            SchemaFieldDefault,
                            SchemaFieldMissing, UseSchemaOption)
 from ciri.encoder import JSONEncoder
-from ciri.exception import (SerializationError,
+from ciri.exception import (SchemaException,
+                            SerializationError,
                             ValidationError,
                             FieldValidationError,
                             RegistryError,
                             FieldError)
-from ciri.fields import Schema as SchemaField
+from ciri.fields import (FIELD_CALLABLES,
+                         Child as ChildField,
+                         List as ListField,
+                         Schema as SchemaField,
+                         SelfReference as SelfReferenceField)
+from ciri.profiler import active_profiler, profiled
 from ciri.registry import schema_registry
+from ciri.util.accessors import ObjectView, compile_getters, get_value, is_accessible, shared_resolver
+from ciri.util.patch import apply_patch, parse_patch
+from ciri.util.pending import PendingValidators, pending_validators
+from ciri.util.projection import compile_projection
 
 
 logger = logging.getLogger('ciri')
 
+#: Fields which hold nested values and accept a projection subtree
+NESTED_FIELDS = (ListField, SchemaField, SelfReferenceField)
+
 
 class ErrorHandler(object):
     """
@@ -50,6 +70,34 @@ class ErrorHandler(object):
                 handler.add(k, v)
             self.errors[key]['errors'] = handler.errors
 
+    def add_nested(self, path, field_error):
+        """Adds a `FieldError` below nested keys, e.g. for a field of a list item.
+        The errors of the parent keys are created if they don't exist yet.
+
+        :param path: ``(key, field)`` pairs from the top level key down to the key
+            of `field_error`
+        :type path: list
+        """
+        key, field = path[0]
+        if len(path) == 1:
+            return self.add(key, field_error)
+        top = node = self._raw_errors.get(key) or self._parent_error(field)
+        for k, field in path[1:-1]:
+            if node.errors is None:
+                node.errors = {}
+            if k not in node.errors:
+                node.errors[k] = self._parent_error(field)
+            node = node.errors[k]
+        if node.errors is None:
+            node.errors = {}
+        node.errors[path[-1][0]] = field_error
+        self.add(key, top)
+
+    @staticmethod
+    def _parent_error(field):
+        # lists report the errors of their items, other fields those of their nested schema
+        return FieldError(field, 'invalid_item' if isinstance(field, ListField) else 'invalid', errors={})
+
 
 class SchemaOptions(object):
     """
@@ -62,6 +110,21 @@ class SchemaOptions(object):
     :param encoder: Schema encoding handler
     :param registry: Schema registry
     :param output_missing: Include :class:`~ciri.core.SchemaFieldMissing` values in serialization output
+    :param record_output: Deserialize into the schema's :class:`~ciri.core.Record` class instead of a schema instance
+    :param frozen_records: Make deserialized records immutable and hashable
+    :param track_changes: Track field changes on schema instances so :meth:`Schema.serialize`
+        only recomputes changed fields
+    :param profiler: Records timings of every schema operation
+    :param pool_size: Maximum number of released instances kept by :meth:`Schema.release`
+    :param async_chunk_size: Number of list items the async API handles between yields to the event loop
+    :param async_offload_size: Number of top level list items from which the async API runs the
+        whole operation in `async_executor`. `None` (the default) disables offloading
+    :param async_executor: Executor for offloaded operations, the event loop's default executor
+        if `None`. A :class:`~concurrent.futures.ProcessPoolExecutor` runs the operation on a new
+        instance of the schema class, which has to be importable by the worker processes. Thread
+        executors share the field objects with other operations of the schema classes
+    :param async_concurrency: Maximum number of coroutine `post_validate` validators the async API
+        runs at the same time
 
     :type allow_none: bool
     :type raise_errors: bool
@@ -69,6 +132,15 @@ class SchemaOptions(object):
     :type encoder: :class:`~ciri.encoder.SchemaEncoder`
     :type registry: :class:`~ciri.registry.SchemaRegistry`
     :type output_missing: bool
+    :type record_output: bool
+    :type frozen_records: bool
+    :type track_changes: bool
+    :type profiler: :class:`~ciri.profiler.Profiler`
+    :type pool_size: int
+    :type async_chunk_size: int
+    :type async_offload_size: int
+    :type async_executor: :class:`~concurrent.futures.Executor`
+    :type async_concurrency: int
     """
 
     def __init__(self, *args, **kwargs):
@@ -78,7 +150,16 @@ class SchemaOptions(object):
             'error_handler': ErrorHandler,
             'encoder': JSONEncoder(),
             'registry': schema_registry,
-            'output_missing': False
+            'output_missing': False,
+            'record_output': False,
+            'frozen_records': False,
+            'track_changes': False,
+            'profiler': None,
+            'pool_size': 32,
+            'async_chunk_size': 1000,
+            'async_offload_size': None,
+            'async_executor': None,
+            'async_concurrency': 10
         }
         options = dict((k, v) if k in defaults else ('_unknown', 1) for (k, v) in kwargs.items())
         options.pop('_unknown', None)
@@ -90,6 +171,42 @@ class SchemaOptions(object):
 DEFAULT_SCHEMA_OPTIONS = SchemaOptions()
 
 
+def _run_in_process(schema_class, method, data, kwargs):
+    """Runs a schema operation offloaded to a process executor. Returns the
+    output and the packed errors, schema instances stay in the worker."""
+    schema = schema_class()
+    try:
+        output = getattr(schema, method)(data, **kwargs)
+    except ValidationError:
+        output = None
+    return output, dict((k, _pack_error(error)) for k, error in schema._raw_errors.items())
+
+
+def _pack_error(error):
+    """Plain version of a `FieldError`, which can be sent back without its field"""
+    errors = error.errors
+    if errors is not None:
+        errors = dict((k, _pack_error(v)) for k, v in errors.items())
+    return error.message_key, error.message, errors
+
+
+def _unpack_error(schema_class, field, packed):
+    """Rebuilds a `FieldError` packed by `_pack_error` with the local `field`
+    of `schema_class`, nested errors get the fields they were raised for."""
+    message_key, message, errors = packed
+    if errors is not None:
+        nested_class, nested = schema_class, {}
+        if isinstance(field, SchemaField):
+            nested_class = field._get_schema().__class__
+        for k, v in errors.items():
+            if isinstance(field, ListField):
+                nested[k] = _unpack_error(schema_class, field.field, v)
+            else:
+                nested[k] = _unpack_error(nested_class, nested_class._fields.get(k), v)
+        errors = nested
+    return FieldError(field, message_key, errors=errors, message=message)
+
+
 class SchemaCallableObject(object):
 
     def __init__(self, *args, **kwargs):
@@ -97,6 +214,8 @@ class SchemaCallableObject(object):
                           'post_validate', 'post_serialize', 'post_deserialize']
         for c in self.callables:
             setattr(self, c, kwargs.get(c, []))
+        #: Index of the first coroutine `post_validate` callable
+        self.async_post_validate = None
 
     def find(self, schema):
         lookup = getattr(schema, '__schema_callables__', None)
@@ -115,6 +234,10 @@ class SchemaCallableObject(object):
                         if callable(method):
                             updated_callables.append(method.__get__(schema, None))
                 setattr(self, c, updated_callables)
+        for idx, c in enumerate(self.post_validate):
+            if asyncio.iscoroutinefunction(c):
+                self.async_post_validate = idx
+                break
 
 
 class FieldCallableObject(object):
@@ -124,6 +247,8 @@ class FieldCallableObject(object):
                           'post_validate', 'post_serialize', 'post_deserialize']
         for c in self.callables:
             setattr(self, c, kwargs.get(c, {}))
+        #: Index of the first coroutine `post_validate` validator, by field key
+        self.async_post_validate = {}
 
     def find(self, schema):
         for key, field in schema._fields.items():
@@ -141,6 +266,170 @@ class FieldCallableObject(object):
                             if callable(method):
                                 updated_callables.append(method.__get__(schema, None))
                     getattr(self, c)[key] = updated_callables
+            for idx, validator in enumerate(self.post_validate.get(key, [])):
+                if asyncio.iscoroutinefunction(validator):
+                    self.async_post_validate[key] = idx
+                    break
+
+
+class _AwaitedValidator(object):
+    """Stands in for a validator which, called synchronously, returned an awaitable
+    (e.g. a `functools.partial` of a coroutine function or an object with an
+    ``async def __call__``). The awaitable is awaited with the deferred validators."""
+
+    __slots__ = ['awaitable']
+
+    def __init__(self, awaitable):
+        self.awaitable = awaitable
+
+    def __call__(self, value, **kwargs):
+        return self.awaitable
+
+    def close(self):
+        close = getattr(self.awaitable, 'close', None)
+        if close is not None:
+            close()
+
+
+def _close_awaited(validators):
+    # awaitables which will never be awaited, closed to avoid "never awaited" warnings
+    if validators and isinstance(validators[0], _AwaitedValidator):
+        validators[0].close()
+
+
+def _tracked_setattr(self, name, value):
+    object.__setattr__(self, name, value)
+    if name in self._fields:
+        self.__dict__.setdefault('_dirty', set()).add(name)
+
+
+def _tracked_delattr(self, name):
+    object.__delattr__(self, name)
+    if name in self._fields:
+        self.__dict__.setdefault('_dirty', set()).add(name)
+
+
+class Record(object):
+    """
+    Base class of the lightweight `__slots__` records generated by
+    :meth:`Schema.record_class`. Records hold deserialized values without
+    the per instance overhead of a schema.
+    """
+
+    __slots__ = ()
+
+    #: The schema class the record was generated for
+    __schema__ = None
+
+    def __init__(self, **kwargs):
+        for k, v in kwargs.items():
+            setattr(self, k, v)
+
+    @classmethod
+    def _make(cls, values):
+        """Builds a record straight from a mapping of field values"""
+        record = cls.__new__(cls)
+        for k, v in values.items():
+            object.__setattr__(record, k, v)
+        return record
+
+    def _astuple(self):
+        return tuple(getattr(self, k, SchemaFieldMissing) for k in self.__slots__)
+
+    def _asdict(self):
+        """Returns the set record values as a dict"""
+        return dict((k, getattr(self, k)) for k in self.__slots__ if hasattr(self, k))
+
+    def __eq__(self, other):
+        if type(other) is type(self):
+            return self._astuple() == other._astuple()
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '{}({})'.format(
+            self.__class__.__name__,
+            ', '.join('{}={}'.format(k, repr(v)) for k, v in self._asdict().items())
+        )
+
+
+class FrozenRecord(Record):
+    """Immutable :class:`Record`. The hash is computed once and cached."""
+
+    __slots__ = ('_hash',)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("'{}' records are frozen".format(self.__class__.__name__))
+
+    def __delattr__(self, name):
+        raise AttributeError("'{}' records are frozen".format(self.__class__.__name__))
+
+    def __init__(self, **kwargs):
+        for k, v in kwargs.items():
+            object.__setattr__(self, k, v)
+
+    def __hash__(self):
+        try:
+            return self._hash
+        except AttributeError:
+            object.__setattr__(self, '_hash', hash(self._astuple()))
+            return self._hash
+
+
+class DeferredValue(object):
+    """A field value held back by lazy deserialization until it is first accessed"""
+
+    __slots__ = ['field', 'key', 'value']
+
+    def __init__(self, field, key, value):
+        self.field = field
+        self.key = key
+        self.value = value
+
+    def resolve(self, schema):
+        self.field._schema = schema
+        return schema._deserialize_element(self.field, self.key, self.value)
+
+
+#: Class attributes built by :meth:`ABCSchema.process_class`
+COMPILED_ATTRIBUTES = ('_fields', '_tags', '_subschemas', '_pending_schemas', '_load_keys', '_child_fields',
+                       '_input_getters', '_record_classes', '_schema_callables', '_field_callables', '_config',
+                       '_check_elements', '_registry', '_encoder', '_pool')
+
+
+class CompileOnAccess(object):
+    """Placeholder for the class attributes of a lazy schema which has not been
+    compiled yet. The first access compiles the schema and returns the real value."""
+
+    __slots__ = ['name']
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        for klass in owner.__mro__:
+            if klass.__dict__.get(self.name) is self:
+                klass.compile()
+                break
+        return getattr(owner if instance is None else instance, self.name)
+
+
+class CreateOnAccess(object):
+    """Schema class attribute for per instance state which is only created
+    when first used, keeping the schema constructor cheap."""
+
+    __slots__ = ['name', 'factory']
+
+    def __init__(self, name, factory):
+        self.name = name
+        self.factory = factory
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        value = instance.__dict__[self.name] = self.factory(instance)
+        return value
 
 
 class ABCSchema(ABCMeta):
@@ -153,12 +442,58 @@ class ABCSchema(ABCMeta):
 
     def __new__(cls, name, bases, attrs):
         cls, name, bases, attrs = cls.prepare_class(cls, name, bases, attrs)
+        lazy = attrs.get('__schema_lazy__', any(getattr(base, '__schema_lazy__', False) for base in bases))
+        # poly parents collect their variants as they are defined, so they always compile eagerly
+        if lazy and '__poly_on__' not in attrs:
+            namespace = dict(attrs)
+            namespace.update((attr, CompileOnAccess(attr)) for attr in COMPILED_ATTRIBUTES)
+            klass = ABCMeta.__new__(cls, name, bases, namespace)
+            klass._lazy_declaration = (cls, name, bases, attrs)
+            klass._compile_lock = threading.Lock()
+            return klass
         klass = ABCMeta.__new__(cls, name, bases, dict(attrs))
+        return klass.process_class(cls, name, bases, attrs)
+
+    def compile(self):
+        """Runs the class processing deferred by a lazy schema. Lazy schemas
+        compile on first use, calling this only controls when the work is done.
+
+        The class is processed in place while holding the class' compile lock.
+        Other threads wait on the lock when they instantiate or subclass the
+        schema, or read one of the placeholders, until it is complete."""
+        if '_lazy_declaration' not in self.__dict__:
+            return self
+        with self._compile_lock:
+            declaration = self.__dict__.get('_lazy_declaration')
+            if declaration is None:
+                return self
+            cls, name, bases, attrs = declaration
+            self.process_class(cls, name, bases, attrs)
+            del self._lazy_declaration
+        return self
+
+    def resolve_schemas(self):
+        """Resolves the nested schemas of fields which refer to a schema that
+        was not available when the class was defined (e.g. a registry name).
+        Schemas still missing are left pending."""
+        for k in list(self._pending_schemas):
+            try:
+                self._subschemas[k] = self._pending_schemas[k]._get_schema()
+                self._pending_schemas.pop(k)
+            except (AttributeError, RegistryError):
+                pass
+        return self
+
+    def process_class(klass, cls, name, bases, attrs):
+        """Finds and processes the schema fields, options and callables"""
         klass._fields = {}
         klass._tags = {}
         klass._subschemas = {}
         klass._pending_schemas = {}
         klass._load_keys = {}
+        klass._child_fields = []
+        klass._input_getters = {}
+        klass._record_classes = {}
         klass._schema_callables = SchemaCallableObject()
         klass._field_callables = FieldCallableObject()
         klass._config = DEFAULT_SCHEMA_OPTIONS
@@ -204,6 +539,10 @@ class ABCSchema(ABCMeta):
             if getattr(attrs['Meta'], 'tags', None):
                 attrs['__field_tags__'] = getattr(attrs['Meta'], 'tags')
 
+            # Meta : lazy
+            if getattr(attrs['Meta'], 'lazy', None):
+                attrs['__schema_lazy__'] = True
+
             # Meta : Callables
             attrs['__schema_callables__'] = attrs.get('__schema_callables__') or {}
             callables = SchemaCallableObject().callables
@@ -251,6 +590,8 @@ class ABCSchema(ABCMeta):
         """Handles the Schema inheritance, specifically bringing in the inherited
         field attributes"""
         for base in bases:
+            if isinstance(base, ABCSchema):
+                base.compile()
             if hasattr(base, '_fields'):
                 self._fields.update(base._fields)
 
@@ -260,13 +601,19 @@ class ABCSchema(ABCMeta):
         for base in bases:
             if issubclass(base, AbstractPolySchema):
                 if '__poly_on__' in attrs:
-                    self.__poly_mapping__ = {}
+                    self.__poly_mapping__ = weakref.WeakValueDictionary() if attrs.get('__poly_weak__') else {}
                     self.__poly_inherit__ = [x if not x.startswith('__poly') else None for x in attrs]
 
     def handle_config(self):
         """Handles the schema options magic method"""
         if hasattr(self, '__schema_options__'):
             self._config = getattr(self, '__schema_options__')
+        self._registry = self._config.registry
+        self._encoder = self._config.encoder
+        self._pool = []
+        if self._config.track_changes:
+            self.__setattr__ = _tracked_setattr
+            self.__delattr__ = _tracked_delattr
 
     def handle_tags(self):
         """Handles the field tags magic method"""
@@ -304,10 +651,16 @@ class ABCSchema(ABCMeta):
           * Tracking nested fields (aka, sub schemas)
           * Tracking deferred schema fields
           * Converting :class:`ciri.fields.Schema` fields to Schemas
+          * Grouping :class:`ciri.fields.Child` fields which share a path prefix
         """
         self._check_elements = []
+        resolvers = {}
         for k, v in self._fields.items():
             if isinstance(v, AbstractField):
+                if isinstance(v, ChildField):
+                    # children reading paths off the same value share the resolvers of common prefixes
+                    v.resolver = shared_resolver(resolvers, v.load or k, v.path)
+                    self._child_fields.append(k)
                 if isinstance(v, SchemaField):
                     self._check_elements.append(k)
                     self._pending_schemas[k] = v
@@ -328,24 +681,51 @@ class ABCSchema(ABCMeta):
 
 class Schema(AbstractSchema, metaclass=ABCSchema):
 
+    _profiler = None
+
+    # per instance state, created on first use
+    _error_handler = CreateOnAccess('_error_handler', lambda schema: schema._config.error_handler())
+    context = CreateOnAccess('context', lambda schema: {})
+    halt_on_error = False
+
     def __init__(self, *args, **kwargs):
-        for k, v in kwargs.items():
-            if self._fields.get(k):
-                setattr(self, k, v)
-                if isinstance(self._fields[k], SchemaField) and isinstance(v, AbstractSchema):
-                    self._fields[k].cached = v
-        for k in self._fields:
-            if k in self._pending_schemas:
-                try:
-                    self._subschemas[k] = self._fields[k]._get_schema()
-                    self._pending_schemas.pop(k)
-                except (AttributeError, RegistryError):
-                    pass
-            self._fields[k]._schema = self
-            self._fields[k]._og_schema = self._og_schema
-        self.config({})
-        self.context = {}
-        self.halt_on_error = False
+        # lazy schemas compile first, or wait for the thread compiling them
+        if '_lazy_declaration' in self.__class__.__dict__:
+            self.__class__.compile()
+        # fields are bound to the instance using them when an operation runs,
+        # so a schema without values is free to construct
+        if kwargs:
+            fields = self._fields
+            for k, v in kwargs.items():
+                if fields.get(k):
+                    setattr(self, k, v)
+                    if isinstance(fields[k], SchemaField) and isinstance(v, AbstractSchema):
+                        fields[k].cached = v
+
+    @classmethod
+    def acquire(cls):
+        """Returns an instance from the schema's pool, or a new one if the
+        pool is empty. Hand it back with :meth:`release` when done."""
+        try:
+            return cls._pool.pop()
+        except IndexError:
+            return cls()
+
+    def release(self):
+        """Resets the instance and returns it to the schema's pool. The
+        instance must not be used after it is released."""
+        cls = self.__class__
+        pool = cls._pool
+        if len(pool) < self._config.pool_size:
+            state = self.__dict__
+            error_handler = state.get('_error_handler')
+            # an instance without values holds no state, see `__init__`
+            state.clear()
+            # keep the error handler unless it came from an instance level config
+            if error_handler is not None and type(error_handler) is cls._config.error_handler:
+                error_handler.reset()
+                state['_error_handler'] = error_handler
+            pool.append(self)
 
     def __eq__(self, other):
         if isinstance(other, AbstractSchema):
@@ -354,12 +734,51 @@ class Schema(AbstractSchema, metaclass=ABCSchema):
             return False
         return NotImplemented
 
+    @classmethod
+    def from_spec(cls, spec):
+        """Builds a schema class from a declarative dict (or JSON) spec. Classes
+        are cached by the content of the spec, see :mod:`ciri.spec`.
+
+        ::
+
+            Person = Schema.from_spec({
+                'name': 'Person',
+                'fields': {
+                    'name': {'type': 'string', 'required': True},
+                    'tags': {'type': 'list', 'of': {'type': 'string'}}
+                }
+            })
+
+        :param spec: dict or JSON string
+        """
+        from ciri.spec import schema_from_spec
+        return schema_from_spec(spec, base=cls)
+
+    @classmethod
+    def record_class(cls, frozen=False):
+        """Returns the generated :class:`Record` subclass holding this schema's fields.
+        The class is generated once per schema and cached.
+
+        :param frozen: Return the immutable, hashable variant
+        :type frozen: bool
+        """
+        record_cls = cls._record_classes.get(frozen)
+        if record_cls is None:
+            base = FrozenRecord if frozen else Record
+            record_cls = type(cls.__name__ + 'Record', (base,), {
+                '__slots__': tuple(cls._fields),
+                '__schema__': cls,
+                '__module__': cls.__module__
+            })
+            cls._record_classes[frozen] = record_cls
+        return record_cls
+
     def config(self, cfg):
         if cfg.get('options') is not None:
             self._config = cfg['options']
+            self._registry = self._config.registry
+            self._encoder = self._config.encoder
         self._error_handler = self._config.error_handler()
-        self._registry = self._config.registry
-        self._encoder = self._config.encoder
 
     @property
     def errors(self):
@@ -369,7 +788,58 @@ class Schema(AbstractSchema, metaclass=ABCSchema):
     def _raw_errors(self):
         return self._error_handler._raw_errors
 
-    def _validate_element(self, field, key, klass_value, output_missing, allow_none):
+    def __getattr__(self, name):
+        # only called for missing attributes, resolves values deferred by lazy deserialization
+        deferred = self.__dict__.get('_deferred')
+        if deferred and name in deferred:
+            value = deferred.pop(name).resolve(self)
+            setattr(self, name, value)
+            return value
+        raise AttributeError("'{}' object has no attribute '{}'".format(self.__class__.__name__, name))
+
+    def _make_lazy(self, output):
+        eager = {}
+        deferred = {}
+        for k, v in output.items():
+            if isinstance(v, DeferredValue):
+                deferred[k] = v
+            else:
+                eager[k] = v
+        instance = self.__class__(**eager)
+        instance._deferred = deferred
+        return instance
+
+    def _resolve_deferred(self):
+        """Resolves any values still pending from lazy deserialization"""
+        deferred = self.__dict__.get('_deferred')
+        if deferred:
+            for name in list(deferred):
+                getattr(self, name)
+
+    def _get_input(self, data):
+        """Returns `data` in a form `_iterate` can read. Mappings are used as is,
+        other objects are read through getters compiled once per input type."""
+        if isinstance(data, Mapping):
+            return data
+        if isinstance(data, AbstractSchema):
+            data._resolve_deferred()
+            return vars(data)
+        data_type = type(data)
+        getters = self._input_getters.get(data_type)
+        if getters is None:
+            keys = set(self._fields) | set(self._load_keys)
+            if not is_accessible(data, keys):
+                return data
+            getters = self._input_getters[data_type] = compile_getters(data_type, keys)
+        return ObjectView(data, getters)
+
+    def _is_input(self, value):
+        """Whether `value` can be read as the input of this schema, see :meth:`_get_input`"""
+        if isinstance(value, Mapping) or type(value) in self._input_getters:
+            return True
+        return is_accessible(value, set(self._fields) | set(self._load_keys))
+
+    def _validate_element(self, field, key, klass_value, output_missing, allow_none, projection=None):
         # run pre validation functions
         pre_validate = self._field_callables.pre_validate
         if pre_validate:
@@ -398,23 +868,59 @@ class Schema(AbstractSchema, metaclass=ABCSchema):
                 self._error_handler.add(key, FieldError(field, 'required' if field.required else 'invalid'))
         else:
             try:
-                klass_value = field.validate(klass_value)
+                if projection:
+                    klass_value = field.validate(klass_value, projection=projection)
+                else:
+                    klass_value = field.validate(klass_value)
             except FieldValidationError as field_exc:
                 self._error_handler.add(key, field_exc.error)
 
         # run post validation functions
         post_validate = self._field_callables.post_validate
         if post_validate:
-            for validator in post_validate.get(key, []):
+            validators = post_validate.get(key, [])
+            split = self._field_callables.async_post_validate.get(key)
+            for idx, validator in enumerate(validators if split is None else validators[:split]):
                 try:
-                    klass_value = validator(klass_value, schema=self, field=field)
+                    value = validator(klass_value, schema=self, field=field)
                 except FieldValidationError as field_exc:
                     self._error_handler.add(key, field_exc.error)
                     break
+                if inspect.isawaitable(value):
+                    self._defer_validators(key, field, [_AwaitedValidator(value)] + validators[idx + 1:], klass_value)
+                    break
+                klass_value = value
+            else:
+                if split is not None:
+                    self._defer_validators(key, field, validators[split:], klass_value)
 
         return klass_value
 
-    def _serialize_element(self, field, key, klass_value):
+    def _defer_validators(self, key, field, validators, klass_value):
+        # coroutine validators, and the validators after them, run once the async API
+        # finished validating synchronously
+        pending = pending_validators()
+        if pending is None:
+            _close_awaited(validators)
+            raise SchemaException("[{}] Coroutine validators of '{}' require the async API, e.g. avalidate()".format(
+                self.__class__.__name__, key))
+        pending.add(validators, klass_value, self, field)
+
+    def _defer_schema_validators(self, validators, output, context):
+        # as coroutine validators of fields, the output they receive is complete once
+        # the field validators ran
+        pending = pending_validators()
+        if pending is None:
+            _close_awaited(validators)
+            raise SchemaException(
+                "[{}] Coroutine post_validate callables require the async API, e.g. avalidate()".format(
+                    self.__class__.__name__))
+        if not pending.path:
+            # the outputs of nested schemas are replaced within the top level output
+            pending.values = output
+        pending.add_schema(validators, output, self, context)
+
+    def _serialize_element(self, field, key, klass_value, projection=None):
         # run pre serialization functions
         pre_serialize = self._field_callables.pre_serialize
         if pre_serialize:
@@ -428,7 +934,10 @@ class Schema(AbstractSchema, metaclass=ABCSchema):
         if missing or klass_value is None:
             klass_value = None
         else:
-            klass_value = field.serialize(klass_value)
+            if projection:
+                klass_value = field.serialize(klass_value, projection=projection)
+            else:
+                klass_value = field.serialize(klass_value)
 
         # run post serialization functions
         post_serialize = self._field_callables.post_serialize
@@ -470,16 +979,33 @@ class Schema(AbstractSchema, metaclass=ABCSchema):
         tags=None,
         do_validate=False,
         do_deserialize=False,
-        do_serialize=False
+        do_serialize=False,
+        lazy=False,
+        projection=None
     ):
-        output_missing = self._config.output_missing
-        allow_none = self._config.allow_none
+        schema_output_missing = self._config.output_missing
+        schema_allow_none = self._config.allow_none
+        profiler = self._profiler
+        # large lists handed over by the async API, for this run only
+        processed = self.__dict__.pop('_processed', None)
+        # values validated by a previous run of the async API, used as they are
+        rerun = self.__dict__.pop('_rerun', None)
+        if rerun is not None:
+            data = rerun.data
+            if not (do_serialize or do_deserialize):
+                return rerun.values
+        pending = pending_validators() if do_validate else None
 
         if do_validate:
             self._error_handler.reset()
 
+        for key in self._child_fields:
+            self._fields[key].resolver.reset()
+
         # get elements
-        if tags:
+        if projection is not None:
+            elements = set(k for k in projection if k in self._fields)
+        elif tags:
             data_keys = []
             for tag in tags:
                 data_keys.extend(self._tags.get(tag, []))
@@ -498,19 +1024,48 @@ class Schema(AbstractSchema, metaclass=ABCSchema):
         exclude = set(exclude) if exclude else set()
 
         output = {}
+        values = None
+        if pending is not None and not pending.path:
+            # the top level of an async run keeps the validated values, see `_arun`
+            pending.data = data
+            if do_serialize or do_deserialize:
+                values = pending.values
+            else:
+                pending.values = output
         for key in elements:
             if key in exclude:
                 continue
 
             field = self._fields[key]
+            field._schema = self
+
+            if processed is not None and key in processed:
+                value, error = processed[key]
+                if error is not None:
+                    self._error_handler.add(key, error)
+                    output[key] = value
+                    if self.halt_on_error:
+                        break
+                    continue
+                output[(field.name or key) if do_serialize else key] = value
+                continue
 
+            subtree = None
+            if projection and projection[key] and isinstance(field, NESTED_FIELDS):
+                subtree = projection[key]
+
+            # field options only apply to their field
+            output_missing = schema_output_missing
+            allow_none = schema_allow_none
             if field.output_missing is not UseSchemaOption:
                 output_missing = field.output_missing
             if field.allow_none is not UseSchemaOption:
                 allow_none = field.allow_none
 
             # field value
-            if do_serialize:
+            if rerun is not None and key in rerun.values:
+                klass_value = rerun.values[key]
+            elif do_serialize:
                 klass_value = data.get(key, SchemaFieldMissing)
             elif do_deserialize or do_validate:
                 load_key = getattr(field, 'load', None) or key
@@ -529,11 +1084,10 @@ class Schema(AbstractSchema, metaclass=ABCSchema):
                 subschema = self._subschemas[key]  # reference the subschema
                 if isinstance(subschema, AbstractPolySchema):
                     try:
-                        polykey = subschema.getpolyname()
-                        if hasattr(klass_value, '__dict__'):
-                            klass_value = vars(klass_value)
-                        subschema.getpoly(klass_value[polykey])()
-                    except Exception:
+                        poly = subschema.getpoly(get_value(klass_value, subschema.getpolyname(), None))
+                    except TypeError:  # unhashable key
+                        poly = None
+                    if poly is None:
                         self._error_handler.add(key, FieldError(field, 'invalid_polykey'))
                         continue
 
@@ -558,7 +1112,20 @@ class Schema(AbstractSchema, metaclass=ABCSchema):
 
             if do_validate:
                 # sets klass_value prior to serialization/deserialization
-                output[key] = klass_value = self._validate_element(field, key, klass_value, output_missing, allow_none)
+                if pending is not None:
+                    # the path of the values met by coroutine validators
+                    pending.path.append((key, field))
+                    pending.target = output if values is None else values
+                if profiler:
+                    klass_value = profiler.run_field(self, key, 'validate', self._validate_element,
+                                                     field, key, klass_value, output_missing, allow_none, subtree)
+                else:
+                    klass_value = self._validate_element(field, key, klass_value, output_missing, allow_none, subtree)
+                if pending is not None:
+                    pending.path.pop()
+                output[key] = klass_value
+                if values is not None:
+                    values[key] = klass_value
                 if self.errors and self.halt_on_error:
                     break
                 elif self.errors:
@@ -568,26 +1135,51 @@ class Schema(AbstractSchema, metaclass=ABCSchema):
                 # determine the field result name (serialized name)
                 output_key = field.name or key
 
-                output[output_key] = self._serialize_element(field, key, klass_value)
+                if profiler:
+                    output[output_key] = profiler.run_field(self, key, 'serialize', self._serialize_element,
+                                                            field, key, klass_value, subtree)
+                else:
+                    output[output_key] = self._serialize_element(field, key, klass_value, subtree)
 
-                # remove old keys if the serializer renames the field
-                if output_key != key:
+                # remove the validated value if the serializer renames the field
+                if do_validate and output_key != key:
                     del output[key]
 
             if do_deserialize:
-                output[key] = self._deserialize_element(field, key, klass_value)
+                if lazy and field.deferred and not missing and klass_value is not None:
+                    output[key] = DeferredValue(field, key, klass_value)
+                elif profiler:
+                    output[key] = profiler.run_field(self, key, 'deserialize', self._deserialize_element,
+                                                     field, key, klass_value)
+                elif pending is not None:
+                    # nested schemas validate the value again, the validators they
+                    # meet were collected with the value already
+                    with PendingValidators():
+                        output[key] = self._deserialize_element(field, key, klass_value)
+                else:
+                    output[key] = self._deserialize_element(field, key, klass_value)
 
+        # don't keep the input alive until the next pass
+        for key in self._child_fields:
+            self._fields[key].resolver.reset()
         return output
 
+    @profiled('validate')
     def validate(self, data=None, halt_on_error=False, exclude=None,
-                 whitelist=None, tags=None, context=None):
-        data = data or self
-        if hasattr(data, '__dict__'):
-            data = vars(data)
+                 whitelist=None, tags=None, context=None, projection=None):
+        """Validates `data` and returns the validated output
+
+        :param projection: Dotted field paths to include, e.g. ``['title', 'cast.name']``.
+            Nested schemas and lists only visit the requested subfields.
+        :type projection: list
+        """
+        data = self._get_input(data or self)
 
         self.halt_on_error = halt_on_error
 
-        if hasattr(self._schema_callables, 'pre_validate'):
+        if self._schema_callables.pre_validate:
+            if isinstance(data, ObjectView):
+                data = data.to_dict()
             context = context or self.context
             for c in getattr(self._schema_callables, 'pre_validate'):
                 data = c(data, schema=self, context=context)
@@ -597,37 +1189,384 @@ class Schema(AbstractSchema, metaclass=ABCSchema):
             exclude=exclude,
             whitelist=whitelist,
             tags=tags,
-            do_validate=True
+            do_validate=True,
+            projection=compile_projection(projection)
         )
 
-        if hasattr(self._schema_callables, 'post_validate'):
+        post_validate = self._schema_callables.post_validate
+        if post_validate:
             context = context or self.context
-            for c in getattr(self._schema_callables, 'post_validate'):
-                output = c(output, schema=self, context=context)
+            split = self._schema_callables.async_post_validate
+            for idx, c in enumerate(post_validate if split is None else post_validate[:split]):
+                value = c(output, schema=self, context=context)
+                if inspect.isawaitable(value):
+                    self._defer_schema_validators([_AwaitedValidator(value)] + post_validate[idx + 1:], output, context)
+                    break
+                output = value
+            else:
+                if split is not None:
+                    self._defer_schema_validators(post_validate[split:], output, context)
 
         if self._config.raise_errors and self.errors:
             raise ValidationError(self)
         return output
 
-    def serialize(self, data=None, skip_validation=False, exclude=None,
-                  whitelist=None, tags=None, context=None):
-        data = data or self
-        if hasattr(data, '__dict__'):
-            data = vars(data)
+    def validate_batch(self, records, halt_on_error=False, exclude=None, whitelist=None, tags=None):
+        """Validates a list of records and returns the validated outputs, in order.
 
-        if hasattr(self._schema_callables, 'pre_serialize'):
-            context = context or self.context
-            for c in getattr(self._schema_callables, 'pre_serialize'):
-                data = c(data, schema=self, context=context)
+        Schemas of scalar fields (e.g. `String`, `Integer`, `Float`, `Boolean`,
+        `Date`) read the batch column by column and validate each column in one
+        pass. Records holding a value which needs more than a type check (missing
+        values, defaults, conversions, invalid values) are validated one by one
+        with :meth:`validate`, as are all records of other schemas.
 
-        output = self._iterate(
-            data,
-            exclude=exclude,
-            whitelist=whitelist,
-            tags=tags,
-            do_validate=(not skip_validation),
-            do_serialize=True
-        )
+        Errors are keyed by record index, each holding the record's field errors.
+
+        :param records: list of mappings
+        :param halt_on_error: Stop at the first invalid record
+        :param exclude: Field keys to skip
+        :param whitelist: Field keys to validate
+        :param tags: Validate the fields with these tags
+        """
+        self.halt_on_error = halt_on_error
+        self._error_handler.reset()
+
+        records = list(records)
+        columns = self._batch_columns(records, exclude=exclude, whitelist=whitelist, tags=tags)
+        if columns is None:
+            outputs = [None] * len(records)
+            pending = range(len(records))
+        else:
+            outputs, pending = columns
+
+        worker = None
+        for idx in pending:
+            if worker is None:
+                worker = self.__class__()
+                if '_config' in self.__dict__:
+                    worker.config({'options': self._config})
+            try:
+                outputs[idx] = worker.validate(records[idx], halt_on_error=halt_on_error, exclude=exclude,
+                                               whitelist=whitelist, tags=tags)
+            except ValidationError:
+                pass
+            if worker.errors:
+                self._error_handler.add(idx, FieldError(self, 'invalid', errors=worker._raw_errors,
+                                                        message=SchemaField.messages.invalid))
+                if halt_on_error:
+                    break
+
+        if self._config.raise_errors and self.errors:
+            raise ValidationError(self)
+        return outputs
+
+    def _batch_columns(self, records, exclude=None, whitelist=None, tags=None):
+        """Validates `records` column by column. Returns the outputs and the
+        indices of records to validate one by one, or None if the schema or the
+        records can't be handled as columns."""
+        if self._profiler or self._schema_callables.pre_validate or self._schema_callables.post_validate:
+            return None
+        if self._field_callables.pre_validate or self._field_callables.post_validate:
+            return None
+        if records and set(map(type, records)) != {dict}:
+            return None
+
+        keys = self._batch_keys(exclude, whitelist, tags)
+        for key in keys:
+            if self._fields[key]._scan_type is None or self._fields[key].load:
+                return None
+
+        # outputs start as copies of the records, columns changed by validation are written back
+        outputs = list(map(dict, records))
+        absent = set()
+        pending = set()
+        for key in keys:
+            field = self._fields[key]
+            output_missing = self._config.output_missing
+            if field.output_missing is not UseSchemaOption:
+                output_missing = field.output_missing
+            # a missing value is only left out if the field needs nothing else
+            skip_missing = not (field.required or output_missing or field.default is not SchemaFieldDefault)
+
+            field._schema = self
+            column = [record.get(key, SchemaFieldMissing) for record in records]
+            values, invalid = field.validate_column(column)
+            for idx in invalid:
+                if skip_missing and values[idx] is SchemaFieldMissing:
+                    absent.add(idx)
+                else:
+                    pending.add(idx)
+            if values is not column and values != column:
+                for output, value in zip(outputs, values):
+                    if value is not SchemaFieldMissing:
+                        output[key] = value
+
+        # drop the keys which are not validated fields
+        size = len(keys)
+        for idx, output in enumerate(outputs):
+            if len(output) != size or idx in absent:
+                outputs[idx] = dict((k, v) for k, v in output.items() if k in keys)
+        return outputs, sorted(pending)
+
+    def _batch_keys(self, exclude=None, whitelist=None, tags=None):
+        # the same selection as `_iterate`
+        if tags:
+            keys = set(k for tag in tags for k in self._tags.get(tag, []))
+        elif whitelist:
+            keys = set(whitelist)
+        else:
+            keys = set(self._fields)
+        keys.intersection_update(self._fields)
+        if exclude:
+            keys.difference_update(exclude)
+        return keys
+
+    def serialize_batch(self, records, skip_validation=False, exclude=None, whitelist=None, tags=None):
+        """Serializes a list of records and returns the outputs, in order.
+
+        The records are validated with :meth:`validate_batch` first, unless
+        `skip_validation` is set. As with validation, scalar fields are serialized
+        column by column and the remaining records one by one with :meth:`serialize`.
+
+        :param records: list of mappings
+        :param skip_validation: Serialize the records as they are
+        :param exclude: Field keys to skip
+        :param whitelist: Field keys to serialize
+        :param tags: Serialize the fields with these tags
+        """
+        if not skip_validation:
+            records = self.validate_batch(records, exclude=exclude, whitelist=whitelist, tags=tags)
+        else:
+            records = list(records)
+
+        columns = self._serialize_columns(records, exclude=exclude, whitelist=whitelist, tags=tags)
+        if columns is None:
+            outputs = [None] * len(records)
+            pending = range(len(records))
+        else:
+            outputs, pending = columns
+
+        for idx in pending:
+            # records which failed validation stay None
+            if records[idx] is not None:
+                outputs[idx] = self.serialize(records[idx], skip_validation=True, exclude=exclude,
+                                              whitelist=whitelist, tags=tags)
+        return outputs
+
+    def _serialize_columns(self, records, exclude=None, whitelist=None, tags=None):
+        """Serializes `records` column by column. Returns the outputs and the
+        indices of records to serialize one by one, or None if the schema or the
+        records can't be handled as columns."""
+        if self._profiler or self._schema_callables.pre_serialize or self._schema_callables.post_serialize:
+            return None
+        if self._field_callables.pre_serialize or self._field_callables.post_serialize:
+            return None
+        if records and set(map(type, records)) != {dict}:
+            return None
+
+        keys = self._batch_keys(exclude, whitelist, tags)
+        for key in keys:
+            if self._fields[key]._scan_type is None:
+                return None
+
+        outputs = [{} for _ in records]
+        pending = set()
+        for key in keys:
+            field = self._fields[key]
+            scan_type = field._scan_type
+            output_missing = self._config.output_missing
+            if field.output_missing is not UseSchemaOption:
+                output_missing = field.output_missing
+            skip_missing = not (field.required or output_missing)
+
+            field._schema = self
+            indices = []
+            column = []
+            for idx, record in enumerate(records):
+                value = record.get(key, SchemaFieldMissing)
+                if type(value) is scan_type:
+                    indices.append(idx)
+                    column.append(value)
+                elif value is not SchemaFieldMissing or not skip_missing:
+                    # None, defaults and conversions
+                    pending.add(idx)
+            values = field.serialize_many(column)
+            if values is None:
+                pending.update(indices)
+                continue
+            output_key = field.name or key
+            for idx, value in zip(indices, values):
+                outputs[idx][output_key] = value
+        return outputs, sorted(pending)
+
+    def validate_partial(self, data, base=None, halt_on_error=False):
+        """Validates a partial update, e.g. the body of a PATCH request, and applies
+        it to `base`. Only the supplied keys are validated; required fields and
+        defaults are not checked for the rest of the document, which is reused
+        from `base` as is.
+
+        :param data: Mapping of keys or dotted paths (e.g. ``cast.0.name``) to new
+            values, or a list of JSON-Patch ``add``, ``replace`` and ``remove`` operations
+        :param base: A previously validated document
+        :returns: `base` with the validated changes applied
+        """
+        self.halt_on_error = halt_on_error
+        self._error_handler.reset()
+        if base is not None and not isinstance(base, Mapping):
+            # attributes the object doesn't have are left out
+            base = dict(self._get_input(base).items())
+
+        validated = self._validate_ops(parse_patch(data), base)
+
+        if self._config.raise_errors and self.errors:
+            raise ValidationError(self)
+        return apply_patch(base, validated)
+
+    def _validate_ops(self, ops, base=None):
+        """Validates `ops` against the fields of this schema. `base` is the
+        document the operations apply to, if known."""
+        groups = {}
+        for op, parts, value in ops:
+            groups.setdefault(parts[0], []).append((op, parts[1:], value))
+
+        validated = []
+        for key, key_ops in groups.items():
+            field = self._fields.get(key)
+            if field is None:
+                raise SerializationError("Unknown patch path '{}'".format(key))
+            field._schema = self
+
+            output_missing = self._config.output_missing
+            allow_none = self._config.allow_none
+            if field.output_missing is not UseSchemaOption:
+                output_missing = field.output_missing
+            if field.allow_none is not UseSchemaOption:
+                allow_none = field.allow_none
+
+            nested = []
+            for op, parts, value in key_ops:
+                if parts:
+                    nested.append((op, parts, value))
+                elif op == 'remove':
+                    if field.required:
+                        self._error_handler.add(key, FieldError(field, 'required'))
+                    validated.append((op, (key,), value))
+                else:
+                    value = self._validate_element(field, key, value, output_missing, allow_none)
+                    validated.append((op, (key,), value))
+            if nested:
+                field_base = get_value(base, key, None) if base is not None else None
+                nested_ops, field_error = self._validate_nested_ops(field, nested, field_base)
+                if field_error:
+                    self._error_handler.add(key, field_error)
+                validated.extend((op, (key,) + parts, value) for op, parts, value in nested_ops)
+            if self.errors and self.halt_on_error:
+                break
+        return validated
+
+    def _validate_nested_ops(self, field, ops, base=None):
+        """Validates operations targeting values inside `field`, whose current
+        value is `base`. Returns the validated operations and a `FieldError` if any failed."""
+        if isinstance(field, (SchemaField, SelfReferenceField)):
+            schema = field._get_schema()
+            if isinstance(schema, AbstractPolySchema):
+                schema = self._patch_variant(schema, ops, base)
+                if schema is None:
+                    return [], FieldError(field, 'invalid_polykey')
+            schema.halt_on_error = self.halt_on_error
+            schema._error_handler.reset()
+            validated = schema._validate_ops(ops, base)
+            if schema.errors:
+                return validated, FieldError(field, 'invalid', errors=schema._raw_errors)
+            return validated, None
+
+        if isinstance(field, ListField):
+            item_field = field.field
+            item_field._schema = self
+            validated = []
+            errors = {}
+            groups = {}
+            for op, parts, value in ops:
+                groups.setdefault(parts[0], []).append((op, parts[1:], value))
+            for index, index_ops in groups.items():
+                if index != '-' and not index.isdigit():
+                    errors[index] = FieldError(item_field, 'invalid')
+                    continue
+                nested = []
+                for op, parts, value in index_ops:
+                    if parts:
+                        nested.append((op, parts, value))
+                        continue
+                    if op != 'remove':
+                        try:
+                            value = item_field.validate(value)
+                        except FieldValidationError as field_exc:
+                            errors[index] = field_exc.error
+                    validated.append((op, (index,), value))
+                if nested:
+                    item_base = None
+                    if isinstance(base, list) and index.isdigit() and int(index) < len(base):
+                        item_base = base[int(index)]
+                    nested_ops, item_error = self._validate_nested_ops(item_field, nested, item_base)
+                    if item_error:
+                        errors[index] = item_error
+                    validated.extend((op, (index,) + parts, value) for op, parts, value in nested_ops)
+                if errors and self.halt_on_error:
+                    break
+            if errors:
+                return validated, FieldError(field, 'invalid_item', errors=errors)
+            return validated, None
+
+        return [], FieldError(field, 'invalid')
+
+    @staticmethod
+    def _patch_variant(schema, ops, base):
+        """Returns the variant of the poly `schema` the patched value belongs to,
+        or `None` if the polymorphic key is missing or unknown"""
+        name = schema.getpolyname()
+        id_ = get_value(base, name, None) if base is not None else None
+        for op, parts, value in ops:
+            if parts == (name,):
+                id_ = None if op == 'remove' else value
+        try:
+            variant = schema.getpoly(id_)
+        except TypeError:  # unhashable key
+            return None
+        if variant is None:
+            return None
+        return variant(*schema.__poly_args__, **schema.__poly_kwargs__)
+
+    @profiled('serialize')
+    def serialize(self, data=None, skip_validation=False, exclude=None,
+                  whitelist=None, tags=None, context=None, projection=None):
+        """Serializes `data` into basic python types
+
+        :param projection: Dotted field paths to include, e.g. ``['title', 'cast.name']``.
+            Nested schemas and lists only visit the requested subfields.
+        :type projection: list
+        """
+        if (data is None and self._config.track_changes and not self._schema_callables.pre_serialize
+                and not (exclude or whitelist or tags or projection)):
+            output = self._serialize_changes(skip_validation)
+        else:
+            data = self._get_input(data or self)
+
+            if self._schema_callables.pre_serialize:
+                if isinstance(data, ObjectView):
+                    data = data.to_dict()
+                context = context or self.context
+                for c in getattr(self._schema_callables, 'pre_serialize'):
+                    data = c(data, schema=self, context=context)
+
+            output = self._iterate(
+                data,
+                exclude=exclude,
+                whitelist=whitelist,
+                tags=tags,
+                do_validate=(not skip_validation),
+                do_serialize=True,
+                projection=compile_projection(projection)
+            )
 
         if hasattr(self._schema_callables, 'post_serialize'):
             context = context or self.context
@@ -638,13 +1577,121 @@ class Schema(AbstractSchema, metaclass=ABCSchema):
             raise ValidationError(self)
         return output
 
+    def mark_changed(self, *keys):
+        """Flags fields as changed. Only needed for in place changes, such as
+        appending to a list, which change tracking can not see."""
+        self.__dict__.setdefault('_dirty', set()).update(keys)
+
+    def has_changes(self):
+        """Whether the instance changed since it was last serialized"""
+        return '_serialized' not in self.__dict__ or bool(self._changed_keys())
+
+    def _changed_keys(self):
+        changed = set(self.__dict__.get('_dirty', ()))
+        for key in self._fields:
+            if key not in changed:
+                nested = self._nested_tracked(key)
+                if nested and any(item.has_changes() for item in nested):
+                    changed.add(key)
+        return changed
+
+    def _nested_tracked(self, key):
+        """Returns the change tracked schema instances a field value is made of,
+        or `None` if the value has to be serialized through the field"""
+        field = self._fields[key]
+        value = self.__dict__.get(key)
+        if value is None or self._field_callables.pre_serialize.get(key) \
+                or self._field_callables.post_serialize.get(key):
+            return None
+        if isinstance(field, ListField) and isinstance(value, list):
+            field, items = field.field, value
+        else:
+            items = [value]
+        if not isinstance(field, SchemaField) or field.exclude or field.whitelist or field.tags:
+            return None
+        for item in items:
+            if not isinstance(item, AbstractSchema) or not item._config.track_changes:
+                return None
+        return items
+
+    def _serialize_changes(self, skip_validation):
+        """Serializes a change tracked instance, recomputing only the fields
+        changed since the last serialization and reusing the rest"""
+        self._resolve_deferred()  # values left pending by lazy deserialization
+        cache = self.__dict__.get('_serialized')
+        if cache is None or (cache[1] and not skip_validation):
+            changed = set(self._fields)
+            output = {}
+        else:
+            changed = self._changed_keys()
+            output = dict(cache[0])
+            for key in changed:
+                output.pop(self._fields[key].name or key, None)
+
+        nested = {}
+        for key in changed:
+            items = self._nested_tracked(key)
+            if items is not None:
+                nested[key] = items
+        plain = [key for key in changed if key not in nested]
+
+        if plain:
+            output.update(self._iterate(
+                vars(self),
+                whitelist=plain,
+                do_validate=(not skip_validation),
+                do_serialize=True
+            ))
+        else:
+            self._error_handler.reset()
+
+        for key, items in nested.items():
+            field = self._fields[key]
+            if isinstance(field, ListField):
+                fragments = []
+                errors = {}
+                for idx, item in enumerate(items):
+                    fragment, error = self._serialize_nested_changes(field.field, item, skip_validation)
+                    fragments.append(fragment)
+                    if error:
+                        errors[str(idx)] = error
+                error = FieldError(field, 'invalid_item', errors=errors) if errors else None
+            else:
+                fragments, error = self._serialize_nested_changes(field, items[0], skip_validation)
+            if error:
+                self._error_handler.add(key, error)
+            else:
+                output[field.name or key] = fragments
+
+        if not self.errors:
+            self.__dict__['_serialized'] = (dict(output), skip_validation)
+            self.__dict__['_dirty'] = set()
+        return output
+
+    def _serialize_nested_changes(self, field, instance, skip_validation):
+        try:
+            output = instance.serialize(skip_validation=skip_validation)
+        except ValidationError:
+            output = None
+        if instance.errors:
+            return output, FieldError(field, 'invalid', errors=instance._raw_errors)
+        return output, None
+
+    @profiled('deserialize')
     def deserialize(self, data=None, skip_validation=False, exclude=None,
-                    whitelist=None, tags=None, context=None):
-        data = data or self
-        if hasattr(data, '__dict__'):
-            data = vars(data)
+                    whitelist=None, tags=None, context=None, lazy=False):
+        """Deserializes `data` into a schema instance
 
-        if hasattr(self._schema_callables, 'pre_deserialize'):
+        :param lazy: Defer deserializing nested schemas and lists until the
+            attribute is first accessed. Validation still runs up front unless
+            `skip_validation` is set. Lazy output is always a schema instance.
+        :type lazy: bool
+        """
+        data = self._get_input(data or self)
+
+        if self._schema_callables.pre_deserialize:
+            if isinstance(data, ObjectView):
+                data = data.to_dict()
             context = context or self.context
             for c in getattr(self._schema_callables, 'pre_deserialize'):
                 data = c(data, schema=self, context=context)
@@ -655,24 +1702,40 @@ class Schema(AbstractSchema, metaclass=ABCSchema):
             whitelist=whitelist,
             tags=tags,
             do_validate=(not skip_validation),
-            do_deserialize=True
+            do_deserialize=True,
+            lazy=lazy
         )
 
-        if hasattr(self._schema_callables, 'post_deserialize'):
+        if self._schema_callables.post_deserialize:
+            if lazy:
+                # callables expect deserialized values
+                lazy = False
+                for k, v in output.items():
+                    if isinstance(v, DeferredValue):
+                        output[k] = v.resolve(self)
             context = context or self.context
             for c in getattr(self._schema_callables, 'post_deserialize'):
                 output = c(output, schema=self, context=context)
 
         if self._config.raise_errors and self.errors:
             raise ValidationError(self)
+        if lazy:
+            return self._make_lazy(output)
+        if self._config.record_output:
+            return self.record_class(self._config.frozen_records)._make(output)
         return self.__class__(**output)
 
+    @profiled('encode')
     def encode(self, data=None, skip_validation=False, skip_serialization=False,
-               exclude=[], whitelist=[], tags=[], context=None):
+               exclude=[], whitelist=[], tags=[], context=None, projection=None):
+        """Serializes `data` and encodes the result with the schema encoder
+
+        :param projection: Dotted field paths to include, e.g. ``['title', 'cast.name']``.
+            Nested schemas and lists only visit the requested subfields.
+        :type projection: list
+        """
         self._encode_stream = []
-        data = data or self
-        if hasattr(data, '__dict__'):
-            data = vars(data)
+        data = self._get_input(data or self)
 
         output = self._iterate(
             data,
@@ -680,29 +1743,239 @@ class Schema(AbstractSchema, metaclass=ABCSchema):
             whitelist=whitelist,
             tags=tags,
             do_validate=(not skip_validation),
-            do_serialize=(not skip_serialization)
+            do_serialize=(not skip_serialization),
+            projection=compile_projection(projection)
         )
 
         if self._config.raise_errors and self.errors:
             raise ValidationError(self)
         return self._encoder.encode(output, self)
 
+    def iterencode(self, data=None, skip_validation=False, skip_serialization=False,
+                   exclude=[], whitelist=[], tags=[], context=None, projection=None):
+        """Like :meth:`encode`, but returns an iterator over chunks of the
+        encoded output. Streamed :class:`~ciri.fields.List` fields are
+        validated, serialized and encoded one item at a time as the chunks are
+        consumed, so an invalid item raises
+        :class:`~ciri.exception.FieldValidationError` during iteration.
+        """
+        data = self._get_input(data or self)
+
+        output = self._iterate(
+            data,
+            exclude=exclude,
+            whitelist=whitelist,
+            tags=tags,
+            do_validate=(not skip_validation),
+            do_serialize=(not skip_serialization),
+            projection=compile_projection(projection)
+        )
+
+        if self._config.raise_errors and self.errors:
+            raise ValidationError(self)
+        return self._encoder.iterencode(output, self)
+
+    async def avalidate(self, data=None, halt_on_error=False, exclude=None,
+                        whitelist=None, tags=None, context=None, projection=None):
+        """Coroutine version of :meth:`validate` which keeps the event loop responsive.
+        Large top level lists are handled in chunks of `async_chunk_size` items,
+        yielding to the event loop between chunks, and inputs holding at least
+        `async_offload_size` list items are handed to `async_executor`.
+        """
+        return await self._arun('validate', data, halt_on_error=halt_on_error, exclude=exclude,
+                                whitelist=whitelist, tags=tags, context=context, projection=projection)
+
+    async def aserialize(self, data=None, skip_validation=False, exclude=None,
+                         whitelist=None, tags=None, context=None, projection=None):
+        """Coroutine version of :meth:`serialize`, see :meth:`avalidate`"""
+        return await self._arun('serialize', data, skip_validation=skip_validation, exclude=exclude,
+                                whitelist=whitelist, tags=tags, context=context, projection=projection)
+
+    async def adeserialize(self, data=None, skip_validation=False, exclude=None,
+                           whitelist=None, tags=None, context=None, lazy=False):
+        """Coroutine version of :meth:`deserialize`, see :meth:`avalidate`"""
+        return await self._arun('deserialize', data, skip_validation=skip_validation, exclude=exclude,
+                                whitelist=whitelist, tags=tags, context=context, lazy=lazy)
+
+    async def aencode(self, data=None, skip_validation=False, skip_serialization=False,
+                      exclude=[], whitelist=[], tags=[], context=None, projection=None):
+        """Coroutine version of :meth:`encode`, see :meth:`avalidate`"""
+        return await self._arun('encode', data, skip_validation=skip_validation,
+                                skip_serialization=skip_serialization, exclude=exclude, whitelist=whitelist,
+                                tags=tags, context=context, projection=projection)
+
+    async def _arun(self, method, data, **kwargs):
+        pending = PendingValidators()
+        try:
+            output = await self._arun_sync(method, data, kwargs, pending)
+        except ValidationError:
+            if not pending or self.halt_on_error:
+                raise
+            output = None
+        if pending:
+            output = await self._arun_validators(pending, output)
+            if method != 'validate' and not self.errors:
+                # as the synchronous methods, serialize (or deserialize) the values the
+                # validators returned, the validated values are used as they are
+                self._rerun = pending
+                try:
+                    output = await self._arun_sync(method, data, dict(kwargs, skip_validation=True),
+                                                   PendingValidators())
+                finally:
+                    self.__dict__.pop('_rerun', None)
+        return output
+
+    async def _arun_sync(self, method, data, kwargs, pending):
+        sizes = self._list_sizes(self._get_input(data or self), method, kwargs)
+        offload_size = self._config.async_offload_size
+        if sizes and offload_size is not None and sum(sizes.values()) >= offload_size:
+            return await self._aoffload(method, data, kwargs, pending)
+
+        large = [key for key, size in sizes.items() if size > self._config.async_chunk_size]
+        if large and not any(getattr(self._schema_callables, c) for c in
+                             ('pre_validate', 'pre_serialize', 'pre_deserialize')):
+            do_validate = method == 'validate' or not kwargs.get('skip_validation')
+            do_serialize = method == 'serialize' or (method == 'encode' and not kwargs.get('skip_serialization'))
+            view = self._get_input(data or self)
+            validated = self.__dict__['_rerun'].values if '_rerun' in self.__dict__ else {}
+            self.halt_on_error = kwargs.get('halt_on_error', False)
+            processed = {}
+            for key in large:
+                field = self._fields[key]
+                if any(key in (getattr(self._field_callables, c) or {}) for c in FIELD_CALLABLES):
+                    continue
+                if key in validated:
+                    value = validated[key]
+                else:
+                    value = view.get(key if do_serialize else (field.load or key))
+                processed[key] = await self._achunk(key, field, value, pending, do_validate, do_serialize,
+                                                    method == 'deserialize')
+            # `_iterate` uses the processed lists as they are
+            self._processed = processed
+        try:
+            return self._run_collecting(pending, method, data, kwargs)
+        finally:
+            self.__dict__.pop('_processed', None)
+
+    def _run_collecting(self, pending, method, data, kwargs):
+        # collection only spans synchronous code, other tasks of the loop share the thread
+        with pending:
+            return getattr(self, method)(data, **kwargs)
+
+    async def _arun_validators(self, pending, output):
+        """Runs the coroutine validators collected by `pending` and merges their
+        errors. The validated values are replaced by the values the validators return,
+        returns `output` as the schema validators left it."""
+        for entry, value, error in await pending.run(self._config.async_concurrency):
+            path = entry[0]
+            if error is not None:
+                self._error_handler.add_nested(path, error)
+            else:
+                entry[5][path[-1][0]] = value
+        output = await pending.run_schema(output)
+        if self._config.raise_errors and self.errors:
+            raise ValidationError(self)
+        return output
+
+    def _list_sizes(self, data, method, kwargs):
+        """Returns the sizes of the top level lists in `data`, by field key"""
+        if not isinstance(data, Mapping) or kwargs.get('projection') or kwargs.get('lazy'):
+            return {}
+        if self._profiler or self._config.profiler or active_profiler():
+            return {}  # profiled runs time the fields as the synchronous API does
+        sizes = {}
+        for key in self._batch_keys(kwargs.get('exclude'), kwargs.get('whitelist'), kwargs.get('tags')):
+            field = self._fields[key]
+            if not isinstance(field, ListField) or field.stream:
+                continue
+            value = data.get(key if method in ('serialize', 'encode') else (field.load or key))
+            if isinstance(value, list):
+                sizes[key] = len(value)
+        return sizes
+
+    async def _achunk(self, key, field, value, pending, do_validate, do_serialize, do_deserialize):
+        """Handles a list chunk by chunk, yielding to the event loop in between.
+        Returns the output and the list error, if any."""
+        chunk_size = self._config.async_chunk_size
+        output = []
+        validated = []
+        errors = {}
+        for start in range(0, len(value), chunk_size):
+            chunk = value[start:start + chunk_size]
+            # other tasks may have bound the field to their schema meanwhile
+            field._schema = self
+            if do_validate:
+                collected = len(pending.entries), len(pending.schema_entries)
+                pending.path.append((key, field))
+                try:
+                    with pending:
+                        chunk = field.validate(chunk)
+                except FieldValidationError as field_exc:
+                    for k, error in field_exc.error.errors.items():
+                        errors[str(int(k) + start)] = error
+                    if self.halt_on_error:
+                        break
+                finally:
+                    pending.path.pop()
+                # item paths start at the chunk
+                for entry in pending.entries[collected[0]:] + pending.schema_entries[collected[1]:]:
+                    k, item_field = entry[0][1]
+                    entry[0][1] = (str(int(k) + start), item_field)
+                validated.extend(chunk)
+            if not errors:
+                if do_serialize:
+                    chunk = field.serialize(chunk)
+                elif do_deserialize:
+                    # nested schemas validate the items again, see `_iterate`
+                    with PendingValidators():
+                        chunk = field.deserialize(chunk)
+                output.extend(chunk)
+            await asyncio.sleep(0)
+        if errors:
+            return value, FieldError(field, 'invalid_item', errors=errors)
+        if do_validate and (do_serialize or do_deserialize):
+            # the top level values of the run, see `_iterate`
+            pending.values[key] = validated
+        return output, None
+
+    async def _aoffload(self, method, data, kwargs, pending):
+        loop = asyncio.get_event_loop()
+        executor = self._config.async_executor
+        if not isinstance(executor, ProcessPoolExecutor):
+            return await loop.run_in_executor(executor, partial(self._run_collecting, pending, method, data, kwargs))
+
+        view = self._get_input(data or self)
+        keys = set(self._fields) | set(self._load_keys)
+        data = dict((k, v) for k, v in view.items() if k in keys)
+        output, errors = await loop.run_in_executor(executor, _run_in_process, self.__class__, method, data, kwargs)
+        self._error_handler.reset()
+        for key, packed in errors.items():
+            self._error_handler.add(key, _unpack_error(self.__class__, self._fields.get(key), packed))
+        if errors and self._config.raise_errors:
+            raise ValidationError(self)
+        return output
+
 
 class PolySchema(AbstractPolySchema, Schema):
 
+    # the values of a schema constructed without any, also what a released instance is reset to
+    __poly_args__ = ()
+    __poly_kwargs__ = {}
+
     def __init__(self, *args, **kwargs):
         self.__poly_args__ = args
         self.__poly_kwargs__ = kwargs
         super(PolySchema, self).__init__(*args, **kwargs)
 
-    def deserialize(self, data=None, *args, **kwargs):
-        ident_key = self.__poly_on__.name
-        if self.__poly_on__.load:
-            ident_key = self.__poly_on__.load
+    def _variant(self, data, ident_key=None):
+        """Returns an instance of the polymorphic schema handling `data`, and
+        `data` as it is read. `ident_key` defaults to the name of the poly field."""
+        ident_key = ident_key or self.__poly_on__.name
         data = data or self.__poly_kwargs__ or self
-        if hasattr(data, '__dict__'):
+        if isinstance(data, AbstractSchema):
+            data._resolve_deferred()
             data = vars(data)
-        id_ = data.get(ident_key)
+        id_ = get_value(data, ident_key, None)
         if not id_:
             raise SerializationError(
                 "[{}] Failed to find polymorphic key '{}' in input data".format(
@@ -710,7 +1983,8 @@ class PolySchema(AbstractPolySchema, Schema):
                     ident_key
                 )
             )
-        if not self.__poly_mapping__.get(id_):
+        variant = self.__poly_mapping__.get(id_)
+        if not variant:
             raise SerializationError(
                 "[{}] Failed to find polymorphic identifier '{}' in mapping {}".format(
                     self.__class__.__name__,
@@ -718,81 +1992,36 @@ class PolySchema(AbstractPolySchema, Schema):
                     self.__poly_mapping__
                 )
             )
-        schema = self.__poly_mapping__.get(id_)(*self.__poly_args__, **self.__poly_kwargs__)
+        return variant(*self.__poly_args__, **self.__poly_kwargs__), data
+
+    def deserialize(self, data=None, *args, **kwargs):
+        schema, data = self._variant(data, self.__poly_on__.load)
         return schema.deserialize(data, *args, **kwargs)
 
     def serialize(self, data=None, *args, **kwargs):
-        ident_key = self.__poly_on__.name
-        data = data or self.__poly_kwargs__ or self
-        if hasattr(data, '__dict__'):
-            data = vars(data)
-        id_ = data.get(ident_key)
-        if not id_:
-            raise SerializationError(
-                "[{}] Failed to find polymorphic key '{}' in input data".format(
-                    self.__class__.__name__,
-                    ident_key
-                )
-            )
-        if not self.__poly_mapping__.get(id_):
-            raise SerializationError(
-                "[{}] Failed to find polymorphic identifier '{}' in mapping {}".format(
-                    self.__class__.__name__,
-                    id_,
-                    self.__poly_mapping__
-                )
-            )
-        schema = self.__poly_mapping__.get(id_)(*self.__poly_args__, **self.__poly_kwargs__)
+        schema, data = self._variant(data)
         return schema.serialize(data, *args, **kwargs)
 
     def validate(self, data=None, *args, **kwargs):
-        ident_key = self.__poly_on__.name
-        data = data or self.__poly_kwargs__ or self
-        if hasattr(data, '__dict__'):
-            data = vars(data)
-        id_ = data.get(ident_key)
-        if not id_:
-            raise SerializationError(
-                "[{}] Failed to find polymorphic key '{}' in input data".format(
-                    self.__class__.__name__,
-                    ident_key
-                )
-            )
-        if not self.__poly_mapping__.get(id_):
-            raise SerializationError(
-                "[{}] Failed to find polymorphic identifier '{}' in mapping {}".format(
-                    self.__class__.__name__,
-                    id_,
-                    self.__poly_mapping__
-                )
-            )
-        schema = self.__poly_mapping__.get(id_)(*self.__poly_args__, **self.__poly_kwargs__)
+        schema, data = self._variant(data)
+        # errors are read from the dispatching schema, e.g. by nested schema fields
+        self._error_handler = schema._error_handler
         return schema.validate(data, *args, **kwargs)
 
     def encode(self, data=None, *args, **kwargs):
-        ident_key = self.__poly_on__.name
-        data = data or self.__poly_kwargs__ or self
-        if hasattr(data, '__dict__'):
-            data = vars(data)
-        id_ = data.get(ident_key)
-        if not id_:
-            raise SerializationError(
-                "[{}] Failed to find polymorphic key '{}' in input data".format(
-                    self.__class__.__name__,
-                    ident_key
-                )
-            )
-        if not self.__poly_mapping__.get(id_):
-            raise SerializationError(
-                "[{}] Failed to find polymorphic identifier '{}' in mapping {}".format(
-                    self.__class__.__name__,
-                    id_,
-                    self.__poly_mapping__
-                )
-            )
-        schema = self.__poly_mapping__.get(id_)(*self.__poly_args__, **self.__poly_kwargs__)
+        schema, data = self._variant(data)
         return schema.encode(data, *args, **kwargs)
 
+    def iterencode(self, data=None, *args, **kwargs):
+        schema, data = self._variant(data)
+        return schema.iterencode(data, *args, **kwargs)
+
+    async def _arun(self, method, data, **kwargs):
+        schema, data = self._variant(data, self.__poly_on__.load if method == 'deserialize' else None)
+        # errors are read from the dispatching schema
+        self._error_handler = schema._error_handler
+        return await schema._arun(method, data, **kwargs)
+
     @classmethod
     def getpolyname(cls):
         return cls.__poly_on__.name
@@ -801,6 +2030,11 @@ class PolySchema(AbstractPolySchema, Schema):
     def getpoly(cls, key):
         return cls.__poly_mapping__.get(key, None)
 
+    @classmethod
+    def unregister(cls, key):
+        """Removes the polymorphic schema registered under `key`"""
+        cls.__poly_mapping__.pop(key, None)
+
     @classmethod
     def polymorph(cls, *args, **kwargs):
         ident_key = cls.__poly_on__.name
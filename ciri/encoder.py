@@ -1,16 +1,65 @@
 import json
 
+from collections.abc import Iterator, Mapping
+
 
 class SchemaEncoder(object):
 
     def encode(self, *args, **kwargs):
         raise NotImplementedError
 
+    def iterencode(self, data, schema):
+        """Encodes `data` in chunks. Encoders without streaming support
+        return the whole encoding as a single chunk."""
+        yield self.encode(data, schema)
+
 
 class JSONEncoder(SchemaEncoder):
 
     def __init__(self):
-        self.encoder = json.JSONEncoder(check_circular=False)
+        self.encoder = json.JSONEncoder(check_circular=False, default=self.default)
 
     def encode(self, data, schema):
-        return json.dumps(data)
+        return json.dumps(data, default=self.default)
+
+    def default(self, value):
+        # streamed lists are read in full when encoding in one go
+        if isinstance(value, Iterator):
+            return list(value)
+        # numpy arrays and scalars, array.array and memoryview
+        if hasattr(value, 'tolist'):
+            return value.tolist()
+        raise TypeError("Object of type {} is not JSON serializable".format(value.__class__.__name__))
+
+    def encode_key(self, key):
+        """Encodes a mapping key as :func:`json.dumps` does, e.g. ``True`` as ``"true"``"""
+        if not isinstance(key, str):
+            if key is not None and not isinstance(key, (int, float)):
+                raise TypeError("keys must be str, int, float, bool or None, not {}".format(key.__class__.__name__))
+            key = self.encoder.encode(key)
+        return self.encoder.encode(key)
+
+    def iterencode(self, data, schema):
+        """Encodes `data` in chunks. Iterators, such as the output of streamed
+        :class:`~ciri.fields.List` fields, are consumed one item at a time.
+        The joined chunks equal :meth:`encode`."""
+        if isinstance(data, Mapping):
+            yield '{'
+            for idx, (key, value) in enumerate(data.items()):
+                if idx:
+                    yield ', '
+                yield self.encode_key(key)
+                yield ': '
+                for chunk in self.iterencode(value, schema):
+                    yield chunk
+            yield '}'
+        elif isinstance(data, (list, tuple, Iterator)):
+            yield '['
+            for idx, value in enumerate(data):
+                if idx:
+                    yield ', '
+                for chunk in self.iterencode(value, schema):
+                    yield chunk
+            yield ']'
+        else:
+            yield self.encoder.encode(data)
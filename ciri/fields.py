@@ -2,8 +2,10 @@ import datetime
 import uuid
 
 from abc import ABCMeta
+from collections.abc import Iterable, Mapping
 
-from ciri.abstract import AbstractField, AbstractSchema, SchemaFieldDefault, SchemaFieldMissing, UseSchemaOption
+from ciri.abstract import (AbstractField, AbstractPolySchema, AbstractSchema, SchemaFieldDefault, SchemaFieldMissing,
+                           UseSchemaOption)
 from ciri.registry import schema_registry
 from ciri.exception import (
         SerializationError,
@@ -11,10 +13,26 @@ from ciri.exception import (
         FieldValidationError,
         FieldError
 )
+from ciri.util.accessors import PathResolver, get_value, is_accessible
+from ciri.util.arrays import NumericBuffer, is_array, np, to_array, to_list
 from ciri.util.dateparse import parse_date, parse_datetime
+from ciri.util.pending import pending_validators
+
+
+def _scan(values, value_type):
+    # one pass over the list at C speed instead of a field call per item
+    return set(map(type, values)) == {value_type}
+
+
+FIELD_CALLABLES = ('pre_validate', 'pre_serialize', 'pre_deserialize',
+                   'post_validate', 'post_serialize', 'post_deserialize')
 
 
 class FieldErrorMessages(object):
+    """Error message table. Each field class holds one table, shared by all
+    of its fields unless a field overrides messages with the `messages` kwarg."""
+
+    __slots__ = ['_messages']
 
     def __init__(self, *args, **kwargs):
         self._messages = {
@@ -25,54 +43,50 @@ class FieldErrorMessages(object):
         }
         self._messages.update(kwargs)
 
-
-class FieldMessageContainer(object):
-
-    def __init__(self, field):
-        self._field = field
-
     def __getattr__(self, name):
-        if self._field._messages.get(name):
-            return self._field_messages[name]
-        else:
-            return self._field.messages._messages[name]
+        try:
+            return self._messages[name]
+        except KeyError:
+            raise AttributeError(name)
 
     def __getitem__(self, name):
-        if self._field._messages.get(name):
-            return self._field_messages[name]
-        else:
-            return self._field.messages._messages[name]
+        return self._messages[name]
+
+    def extend(self, messages):
+        """Returns a new table with `messages` overriding this table"""
+        merged = dict(self._messages)
+        merged.update(messages)
+        return self.__class__(**merged)
 
 
 class AbstractBaseField(ABCMeta):
 
     def __new__(cls, name, bases, attrs):
         klass = ABCMeta.__new__(cls, name, bases, dict(attrs))
-        if isinstance(attrs.get('messages'), FieldErrorMessages):
-            klass.messages = attrs.get('messages')
-        else:
-            klass.messages = FieldErrorMessages(**attrs.get('messages', {}))
-        if getattr(klass, 'new', None):
-            constructor = klass.__init__
-            new_constructor = klass.new
-
-            def field_init(self, *args, **kwargs):
-                constructor(self, *args, **kwargs)
-                new_constructor(self, *args, **kwargs)
-
-            klass.__init__ = field_init
-            delattr(klass, 'new')
+        messages = attrs.get('messages')
+        if not isinstance(messages, FieldErrorMessages):
+            inherited = next((base.messages for base in bases if isinstance(base, AbstractBaseField)), None)
+            if inherited is not None:
+                messages = inherited.extend(messages or {})
+            else:
+                messages = FieldErrorMessages(**(messages or {}))
+        klass.messages = messages
+        # `new` initializers run after `Field.__init__`, base classes first
+        klass._initializers = tuple(c.__dict__['new'] for c in reversed(klass.__mro__) if 'new' in c.__dict__)
+        # subclasses changing how values are handled lose the list fast paths of their parent
+        if '_scan_type' not in attrs and any(m in attrs for m in ('validate', 'serialize', 'deserialize')):
+            klass._scan_type = None
         return klass
 
 
 class Field(AbstractField, metaclass=AbstractBaseField):
     """Base Field Class that all other Fields extend from"""
 
-    __slots__ = ['name', 'required', 'default', 'allow_none',
-                 '_messages', 'message', '_schema', 'validators',
+    __slots__ = ['name', 'required', 'default', 'allow_none', 'output_missing',
+                 'message', '_schema', 'validators',
                  'pre_validate', 'pre_serialize', 'pre_deserialize',
                  'post_validate', 'post_serialize', 'post_deserialize',
-                 'missing_output_value', 'tags', 'load', '_og_schema']
+                 'missing_output_value', 'tags', 'load']
 
     def __init__(self, *args, **kwargs):
         self.name = kwargs.get('name', None)
@@ -80,22 +94,26 @@ class Field(AbstractField, metaclass=AbstractBaseField):
         self.required = kwargs.get('required', False)
         self.default = kwargs.get('default', SchemaFieldDefault)
         self.allow_none = kwargs.get('allow_none', UseSchemaOption)
-        self._messages = kwargs.get('messages', {})
-        self.message = FieldMessageContainer(self)
+        messages = kwargs.get('messages')
+        self.message = self.messages.extend(messages) if messages else self.messages
         self.output_missing = kwargs.get('output_missing', UseSchemaOption)
         self.missing_output_value = kwargs.get('missing_output_value', None)
         self.tags = kwargs.get('tags', [])
 
-        callables = ['pre_validate', 'pre_serialize', 'pre_deserialize',
-                     'post_validate', 'post_serialize', 'post_deserialize']
-        for c in callables:
-            self._set_callable(c, kwargs.get(c))
+        for c in FIELD_CALLABLES:
+            value = kwargs.get(c)
+            setattr(self, c, value if isinstance(value, list) else [])
 
-    def _set_callable(self, type_, value):
-        if isinstance(value, list):
-            setattr(self, type_, value)
-        else:
-            setattr(self, type_, [])
+        for initializer in self._initializers:
+            initializer(self, *args, **kwargs)
+
+    #: Whether lazy deserialization may postpone this field until it is accessed
+    deferred = False
+
+    #: Exact type of the values the field validates and deserializes unchanged.
+    #: :class:`List` and :meth:`Schema.validate_batch` handle whole lists of it
+    #: with a single type scan.
+    _scan_type = None
 
     def _does_allow_none(self):
         if self.allow_none is True or (self.allow_none is UseSchemaOption and self._schema._config.allow_none):
@@ -130,6 +148,82 @@ class Field(AbstractField, metaclass=AbstractBaseField):
         """
         raise NotImplementedError
 
+    def validate_many(self, values):
+        """
+        Validates a list of values at once
+
+        :param values: list of values
+        :returns: validated list, or None if the values must be validated one by one
+        """
+        if self._scan_type is not None and _scan(values, self._scan_type):
+            return list(values)
+        return None
+
+    def serialize_many(self, values):
+        """
+        Serializes a list of values at once
+
+        :param values: list of values
+        :returns: serialized list, or None if the values must be serialized one by one
+        """
+        if self._scan_type is not None and _scan(values, self._scan_type):
+            return list(values)
+        return None
+
+    def deserialize_many(self, values):
+        """
+        Deserializes a list of values at once
+
+        :param values: list of values
+        :returns: deserialized list, or None if the values must be deserialized one by one
+        """
+        if self._scan_type is not None and _scan(values, self._scan_type):
+            return list(values)
+        return None
+
+    def validate_column(self, values):
+        """
+        Validates a column of values, e.g. one field across a batch of records
+
+        :param values: list of values
+        :returns: the validated list, and the indices of values which must be
+            validated one by one. Those are left unchanged in the list.
+        """
+        scan_type = self._scan_type
+        if scan_type is None:
+            return values, list(range(len(values)))
+        if _scan(values, scan_type):
+            return values, []
+        return values, [idx for idx, value in enumerate(values) if type(value) is not scan_type]
+
+    def validate_array(self, value):
+        """
+        Validates a numeric array (numpy array, `array.array` or buffer) of
+        values at once
+
+        :param value: array of values
+        :returns: the array, or None if the values must be validated one by one
+        """
+        return None
+
+    def serialize_array(self, value):
+        """
+        Serializes a numeric array of values at once
+
+        :param value: array of values
+        :returns: the array, or None if the values must be serialized one by one
+        """
+        return None
+
+    def deserialize_array(self, value):
+        """
+        Deserializes a numeric array of values at once
+
+        :param value: array of values
+        :returns: the array, or None if the values must be deserialized one by one
+        """
+        return None
+
 
 class String(Field):
 
@@ -138,6 +232,8 @@ class String(Field):
     messages = {'invalid': 'Field is not a valid String',
                 'empty': 'Field cannot be empty'}
 
+    _scan_type = str
+
     def new(self, *args, **kwargs):
         self.allow_empty = kwargs.get('allow_empty', True)
         self.trim = kwargs.get('trim', True)
@@ -163,14 +259,37 @@ class String(Field):
             raise FieldValidationError(FieldError(self, 'empty'))
         return value
 
+    def validate_many(self, values):
+        if self._scan_type is None or not _scan(values, self._scan_type):
+            return None
+        if self.trim:
+            values = [v.strip() for v in values]
+        if not self.allow_empty and not all(values):
+            return None
+        return list(values)
+
+    def validate_column(self, values):
+        values, invalid = super(String, self).validate_column(values)
+        if self._scan_type is None:
+            return values, invalid
+        if self.trim:
+            values = [v.strip() if type(v) is str else v for v in values]
+        if not self.allow_empty:
+            invalid = sorted(set(invalid).union(idx for idx, value in enumerate(values) if value == ''))
+        return values, invalid
+
 
 Str = String
 
 
 class Integer(Field):
 
+    __slots__ = ()
+
     messages = {'invalid': 'Field is not a valid Integer'}
 
+    _scan_type = int
+
     def serialize(self, value, **kwargs):
         if value is None and self._does_allow_none():
             return None
@@ -198,14 +317,36 @@ class Integer(Field):
             raise FieldValidationError(FieldError(self, 'invalid'))
         return value
 
+    def validate_array(self, value):
+        if self._scan_type is None:
+            return None
+        values = NumericBuffer(value)
+        if values.ndim == 1 and values.is_integral():
+            return value
+        return None
+
+    def serialize_array(self, value):
+        if self._scan_type is None:
+            return None
+        return value
+
+    def deserialize_array(self, value):
+        if self._scan_type is None or NumericBuffer(value).kind != 'i':
+            return None
+        return value
+
 
 Int = Integer
 
 
 class Float(Field):
 
+    __slots__ = ['strict']
+
     messages = {'invalid': 'Field is not a valid Float'}
 
+    _scan_type = float
+
     def new(self, *args, **kwargs):
         self.strict = kwargs.get('strict', False)  # allow integers to be passed and converted to a float
 
@@ -237,9 +378,112 @@ class Float(Field):
                 raise FieldValidationError(FieldError(self, 'invalid'))
         return value
 
+    def validate_array(self, value):
+        if self._scan_type is None:
+            return None
+        values = NumericBuffer(value)
+        if values.ndim == 1 and (values.kind == 'f' or (values.kind == 'i' and not self.strict)):
+            return value
+        return None
+
+    def serialize_array(self, value):
+        if self._scan_type is None:
+            return None
+        return value
+
+    def deserialize_array(self, value):
+        if self._scan_type is None or NumericBuffer(value).kind != 'f':
+            return None
+        return value
+
+    def validate_column(self, values):
+        values, invalid = super(Float, self).validate_column(values)
+        if invalid and not self.strict and self._scan_type is not None:
+            # integers are accepted as they are
+            invalid = [idx for idx in invalid if type(values[idx]) is not int]
+        return values, invalid
+
+
+class NumericArray(Field):
+    """Array of numbers, validated as a whole. Accepts numpy arrays (when numpy
+    is installed), `array.array`, other buffer protocol objects and lists of
+    numbers. Validated values are numpy arrays, or the array itself without
+    numpy, sharing the input's memory where possible.
+
+    :param dtype: ``'int'``, ``'float'`` or, with numpy, any numpy dtype (e.g. ``'float32'``)
+    :param shape: Expected shape, ``None`` entries match any size (e.g. ``(None, 3)``)
+    :param min: Smallest allowed value
+    :param max: Largest allowed value
+    """
+
+    __slots__ = ['dtype', 'shape', 'min', 'max']
+
+    messages = {'invalid': 'Field is not a valid numeric array',
+                'invalid_dtype': 'Array values are not of the expected type',
+                'invalid_shape': 'Array does not have the expected shape',
+                'out_of_range': 'Array values are out of range'}
+
+    def new(self, *args, **kwargs):
+        self.dtype = kwargs.get('dtype')
+        if self.dtype not in (None, 'int', 'float'):
+            if np is None:
+                raise ValueError("numpy is required for dtype '{}'".format(self.dtype))
+            self.dtype = np.dtype(self.dtype)
+        self.shape = kwargs.get('shape')
+        self.min = kwargs.get('min')
+        self.max = kwargs.get('max')
+
+    def serialize(self, value, **kwargs):
+        if value is None and self._does_allow_none():
+            return None
+        # encoders convert arrays, see JSONEncoder.default
+        return value
+
+    def deserialize(self, value):
+        if value is None and self._does_allow_none():
+            return None
+        if np is not None:
+            return np.asarray(value)
+        if isinstance(value, list):
+            return to_array(value)
+        return value
+
+    def validate(self, value):
+        if value is None and self._does_allow_none():
+            return None
+        if isinstance(value, (list, tuple)):
+            try:
+                value = to_array(value)
+            except (TypeError, ValueError):
+                raise FieldValidationError(FieldError(self, 'invalid'))
+        elif not is_array(value):
+            raise FieldValidationError(FieldError(self, 'invalid'))
+
+        values = NumericBuffer(value)
+        if values.kind not in ('i', 'f'):
+            raise FieldValidationError(FieldError(self, 'invalid'))
+        if self.dtype == 'int' and values.kind != 'i':
+            raise FieldValidationError(FieldError(self, 'invalid_dtype'))
+        if self.dtype == 'float' and values.kind != 'f':
+            raise FieldValidationError(FieldError(self, 'invalid_dtype'))
+        if np is not None and isinstance(self.dtype, np.dtype) and values.data.dtype != self.dtype:
+            raise FieldValidationError(FieldError(self, 'invalid_dtype'))
+        if self.shape is not None:
+            if len(self.shape) != values.ndim or \
+                    any(size is not None and size != actual for size, actual in zip(self.shape, values.shape)):
+                raise FieldValidationError(FieldError(self, 'invalid_shape'))
+        if (self.min is not None and len(values) and values.min() < self.min) or \
+                (self.max is not None and len(values) and values.max() > self.max):
+            raise FieldValidationError(FieldError(self, 'out_of_range'))
+        return values.data if np is not None else value
+
 
 class Boolean(Field):
 
+    __slots__ = ()
+
+    _scan_type = bool
+
     def serialize(self, value, **kwargs):
         if value is None and self._does_allow_none():
             return None
@@ -265,6 +509,8 @@ Bool = Boolean
 
 class Dict(Field):
 
+    __slots__ = ()
+
     def serialize(self, value, **kwargs):
         if value is None and self._does_allow_none():
             return None
@@ -285,7 +531,9 @@ class Dict(Field):
 
 class List(Field):
 
-    __slots__ = ['field', 'items']
+    __slots__ = ['field', 'items', 'stream']
+
+    deferred = True
 
     messages = {'invalid_item': 'Invalid Item(s)'}
 
@@ -305,34 +553,182 @@ class List(Field):
         elif not isinstance(self.field, AbstractField):
             raise ValueError("'of' field must be a subclass of AbstractField or AbstractSchema")
         self.items = kwargs.get('items', [])
+        self.stream = kwargs.get('stream', False)
+
+    def _item_kwargs(self, kwargs):
+        # only nested fields take a projection
+        if kwargs.get('projection') and isinstance(self.field, (Schema, SelfReference, List)):
+            return {'projection': kwargs['projection']}
+        return {}
+
+    def _stream(self, method, value, item_kwargs):
+        # items are handled as the output is consumed, the parent schema may
+        # have run other operations since, so the binding is restored per item
+        field = self.field
+        schema = self._schema
+        handle = getattr(field, method)
+        for k, v in enumerate(value):
+            field._schema = schema
+            try:
+                yield handle(v, **item_kwargs)
+            except FieldValidationError as field_exc:
+                raise FieldValidationError(FieldError(self, 'invalid_item', errors={str(k): field_exc.error}))
+
+    def _poly_buckets(self, value, deserialize=False):
+        """Groups the items of a list of polymorphic schemas by their polymorphic
+        schema, so each variant handles its items in one go. Returns the parent
+        schema and the item indices by variant, or None if the items have to be
+        dispatched one by one (e.g. missing or unknown identifiers)."""
+        if not isinstance(self.field, Schema) or not isinstance(value, (list, tuple)) or len(value) < 2:
+            return None
+        schema = self.field.cached or self.field._get_schema()
+        if not isinstance(schema, AbstractPolySchema):
+            return None
+        key = schema.__poly_on__.name
+        if deserialize and schema.__poly_on__.load:
+            key = schema.__poly_on__.load
+        buckets = {}
+        for k, v in enumerate(value):
+            if type(v) is dict:
+                id_ = v.get(key)
+            elif isinstance(v, AbstractSchema) or not is_accessible(v):
+                return None
+            else:
+                id_ = get_value(v, key, None)
+            try:
+                variant = schema.getpoly(id_)
+            except TypeError:
+                return None
+            if variant is None:
+                return None
+            buckets.setdefault(variant, []).append(k)
+        return schema, buckets
+
+    def _poly_serialize(self, value, schema, buckets):
+        field = self.field
+        output = [None] * len(value)
+        for variant, indices in buckets.items():
+            instance = variant(*schema.__poly_args__, **schema.__poly_kwargs__)
+            items = instance.serialize_batch([value[k] for k in indices], skip_validation=True,
+                                             exclude=field.exclude, whitelist=field.whitelist, tags=field.tags)
+            for k, v in zip(indices, items):
+                output[k] = v
+        return output
+
+    def _poly_deserialize(self, value, schema, buckets):
+        # one variant instance serves all of the items of its bucket
+        field = self.field
+        output = [None] * len(value)
+        for variant, indices in buckets.items():
+            instance = variant(*schema.__poly_args__, **schema.__poly_kwargs__)
+            for k in indices:
+                output[k] = instance.deserialize(value[k], exclude=field.exclude, whitelist=field.whitelist,
+                                                 tags=field.tags)
+        return output
+
+    def _poly_validate(self, value, schema, buckets):
+        field = self.field
+        valid = [None] * len(value)
+        errors = []
+        for variant, indices in buckets.items():
+            instance = variant(*schema.__poly_args__, **schema.__poly_kwargs__)
+            try:
+                output = instance.validate_batch([value[k] for k in indices], exclude=field.exclude,
+                                                 whitelist=field.whitelist, tags=field.tags)
+            except ValidationError:
+                output = None
+            for pos, record_error in instance._raw_errors.items():
+                errors.append((indices[pos], FieldError(field, 'invalid', errors=record_error.errors)))
+            if output is not None:
+                for k, v in zip(indices, output):
+                    valid[k] = v
+        if errors:
+            errors.sort(key=lambda e: e[0])
+            raise FieldValidationError(FieldError(self, 'invalid_item',
+                                                  errors=dict((str(k), e) for k, e in errors)))
+        return valid
 
     def serialize(self, value, **kwargs):
         self.field._schema = self._schema
         if value is None and self._does_allow_none():
             return None
-        return [self.field.serialize(v) for v in value]
+        item_kwargs = self._item_kwargs(kwargs)
+        if self.stream:
+            return self._stream('serialize', value, item_kwargs)
+        if is_array(value):
+            output = self.field.serialize_array(value)
+            if output is not None:
+                return output
+            value = to_list(value)
+        if not item_kwargs and isinstance(value, (list, tuple)):
+            output = self.field.serialize_many(value)
+            if output is not None:
+                return output
+            poly = self._poly_buckets(value)
+            if poly:
+                return self._poly_serialize(value, *poly)
+        return [self.field.serialize(v, **item_kwargs) for v in value]
 
     def deserialize(self, value):
         self.field._schema = self._schema
         if value is None and self._does_allow_none():
             return None
+        if self.stream:
+            return self._stream('deserialize', value, {})
+        if is_array(value):
+            output = self.field.deserialize_array(value)
+            if output is not None:
+                return output
+            value = to_list(value)
+        if isinstance(value, (list, tuple)):
+            output = self.field.deserialize_many(value)
+            if output is not None:
+                return output
+            poly = self._poly_buckets(value, deserialize=True)
+            if poly:
+                return self._poly_deserialize(value, *poly)
         return [self.field.deserialize(v) for v in value]
 
-    def validate(self, value):
+    def validate(self, value, **kwargs):
         self.field._schema = self._schema
         if value is None and self._does_allow_none():
             return None
         valid = []
         errors = {}
+        if self.stream:
+            if not isinstance(value, Iterable) or isinstance(value, (str, bytes, Mapping)):
+                raise FieldValidationError(FieldError(self, 'invalid'))
+            return self._stream('validate', value, self._item_kwargs(kwargs))
+        if not isinstance(value, list) and is_array(value):
+            output = self.field.validate_array(value)
+            if output is not None:
+                return output
+            # the items are checked one by one to report the invalid ones
+            value = to_list(value)
         if not isinstance(value, list):
             raise FieldValidationError(FieldError(self, 'invalid'))
+        item_kwargs = self._item_kwargs(kwargs)
+        # coroutine validators of nested schemas need the index of their item
+        pending = pending_validators()
+        if not item_kwargs:
+            output = self.field.validate_many(value)
+            if output is not None:
+                return output
+            poly = None if self._schema.halt_on_error or pending is not None else self._poly_buckets(value)
+            if poly:
+                return self._poly_validate(value, *poly)
         for k, v in enumerate(value):
+            if pending is not None:
+                pending.path.append((str(k), self.field))
             try:
-                valid.append(self.field.validate(v))
+                valid.append(self.field.validate(v, **item_kwargs))
             except FieldValidationError as field_exc:
                 errors[str(k)] = field_exc.error
                 if self._schema.halt_on_error:
                     break
+            finally:
+                if pending is not None:
+                    pending.path.pop()
         if errors:
             raise FieldValidationError(FieldError(self, 'invalid_item', errors=errors))
         return valid
@@ -340,7 +736,9 @@ class List(Field):
 
 class Schema(Field):
 
-    __slots__ = ['registry', 'raw_schema', 'cached', 'schema']
+    __slots__ = ['registry', 'raw_schema', 'cached', 'schema', 'exclude', 'whitelist']
+
+    deferred = True
 
     messages = {'invalid': 'Invalid Schema',
                 'invalid_mapping': 'Field is not a valid Schema Mapping type'}
@@ -370,7 +768,10 @@ class Schema(Field):
         if value is None and self._does_allow_none():
             return None
         schema = self.cached or self._get_schema()
-        return schema.serialize(value, exclude=self.exclude, whitelist=self.whitelist, tags=self.tags)
+        # the parent schema already validated this value (or was asked not to),
+        # validating again at every level makes deep nesting quadratic
+        return schema.serialize(value, skip_validation=True, exclude=self.exclude, whitelist=self.whitelist,
+                                tags=self.tags, projection=kwargs.get('projection'))
 
     def deserialize(self, value):
         if value is None and self._does_allow_none():
@@ -378,67 +779,81 @@ class Schema(Field):
         schema = self.cached or self._get_schema()
         return schema.deserialize(value, exclude=self.exclude, whitelist=self.whitelist, tags=self.tags)
 
-    def validate(self, value):
+    def validate(self, value, **kwargs):
         if value is None and self._does_allow_none():
             return None
         schema = self.cached or self._get_schema()
-        if not hasattr(value, '__dict__') and (type(value) is not dict or not isinstance(value, dict)):
+        if not schema._is_input(value):
             raise FieldValidationError(FieldError(self, 'invalid_mapping'))
         try:
             return schema.validate(value, exclude=self.exclude, whitelist=self.whitelist, tags=self.tags,
-                                   halt_on_error=self._schema.halt_on_error)
+                                   halt_on_error=self._schema.halt_on_error, projection=kwargs.get('projection'))
         except ValidationError:
             raise FieldValidationError(FieldError(self, 'invalid', errors=schema._raw_errors))
 
 
 class SelfReference(Field):
 
-    __slots__ = ['exclude', 'cached']
+    __slots__ = ['exclude', 'whitelist']
+
+    deferred = True
 
     messages = {'invalid': 'Invalid Schema',
                 'invalid_mapping': 'Field is not a valid Schema Mapping type'}
 
     def new(self, *args, **kwargs):
-        self.cached = None
         self.exclude = kwargs.get('exclude', [])
         self.whitelist = kwargs.get('whitelist', [])
         self.tags = kwargs.get('tags', [])
 
     def _get_schema(self):
-        if not self.cached:
-            self.cached = self._og_schema()
-            self.cached._schema = self._schema
-        return self.cached
+        # subclasses share the field with the schema declaring it, so it refers
+        # to the class of the running schema. The instance is kept on that class,
+        # the field would keep dynamic classes alive
+        schema_class = self._schema._og_schema
+        schema = schema_class.__dict__.get('_self_reference')
+        if schema is None:
+            schema = schema_class()
+            schema._schema = self._schema
+            schema_class._self_reference = schema
+        return schema
 
     def serialize(self, value, **kwargs):
         if value is None and self._does_allow_none():
             return None
-        schema = self.cached or self._get_schema()
-        return schema.serialize(value, exclude=self.exclude, whitelist=self.whitelist, tags=self.tags)
+        schema = self._get_schema()
+        # the parent schema already validated this value (or was asked not to),
+        # validating again at every level makes deep nesting quadratic
+        return schema.serialize(value, skip_validation=True, exclude=self.exclude, whitelist=self.whitelist,
+                                tags=self.tags, projection=kwargs.get('projection'))
 
     def deserialize(self, value):
         if value is None and self._does_allow_none():
             return None
-        schema = self.cached or self._get_schema()
+        schema = self._get_schema()
         return schema.deserialize(value, exclude=self.exclude, whitelist=self.whitelist, tags=self.tags)
 
-    def validate(self, value):
+    def validate(self, value, **kwargs):
         if value is None and self._does_allow_none():
             return None
-        schema = self.cached or self._get_schema()
-        if not hasattr(value, '__dict__') and (type(value) is not dict or not isinstance(value, dict)):
+        schema = self._get_schema()
+        if not schema._is_input(value):
             raise FieldValidationError(FieldError(self, 'invalid_mapping'))
         try:
             return schema.validate(value, exclude=self.exclude, whitelist=self.whitelist, tags=self.tags,
-                                   halt_on_error=self._schema.halt_on_error)
+                                   halt_on_error=self._schema.halt_on_error, projection=kwargs.get('projection'))
         except ValidationError:
             raise FieldValidationError(FieldError(self, 'invalid', errors=schema._raw_errors))
 
 
 class Date(Field):
 
+    __slots__ = ()
+
     messages = {'invalid': 'Invalid ISO-8601 Date'}
 
+    _scan_type = datetime.date
+
     def serialize(self, value, **kwargs):
         if value is None and self._does_allow_none():
             return None
@@ -448,6 +863,11 @@ class Date(Field):
         except Exception:
             raise SerializationError
 
+    def serialize_many(self, values):
+        if self._scan_type is None or not _scan(values, self._scan_type):
+            return None
+        return [value.isoformat() for value in values]
+
     def deserialize(self, value):
         if value is None and self._does_allow_none():
             return None
@@ -485,8 +905,12 @@ class Date(Field):
 
 class DateTime(Field):
 
+    __slots__ = ()
+
     messages = {'invalid': 'Invalid ISO-8601 DateTime'}
 
+    _scan_type = datetime.datetime
+
     def serialize(self, value, **kwargs):
         if value is None and self._does_allow_none():
             return None
@@ -495,6 +919,11 @@ class DateTime(Field):
         except Exception:
             raise SerializationError
 
+    def serialize_many(self, values):
+        if self._scan_type is None or not _scan(values, self._scan_type):
+            return None
+        return [value.isoformat() for value in values]
+
     def deserialize(self, value):
         if value is None and self._does_allow_none():
             return None
@@ -516,6 +945,8 @@ class DateTime(Field):
 
 class UUID(Field):
 
+    __slots__ = ()
+
     messages = {'invalid': 'Field is not a valid UUID'}
 
     def serialize(self, value, **kwargs):
@@ -542,28 +973,24 @@ class UUID(Field):
 
 class Child(Field):
 
+    __slots__ = ['field', 'path', 'cache_value', 'resolver']
+
     def new(self, field, *args, **kwargs):
         self.field = field
         self.path = kwargs.pop('path', None)
         self.cache_value = SchemaFieldMissing
+        # replaced by the schema with a resolver shared by children with a common path prefix
+        self.resolver = PathResolver(self.path)
 
     def _get_child_value(self, value):
-        ctx = value
-        if hasattr(ctx, '__dict__'):
-            ctx = vars(ctx)
-        if isinstance(ctx, dict):
-            try:
-                for part in self.path.split('.'):
-                    ctx = ctx.get(part, {})
-                    if hasattr(ctx, '__dict__'):
-                        ctx = vars(ctx)
-            except AttributeError:
-                pass
-            try:
-                value = ctx.get(self.field.name)
-            except AttributeError:
-                value = None
-        return value
+        if not is_accessible(value):
+            return value
+        child_val = get_value(self.resolver.resolve(value), self.field.name)
+        if child_val is SchemaFieldMissing:
+            if not isinstance(value, dict) and not hasattr(value, '__dict__'):
+                return value  # slotted values (e.g. uuid.UUID) that hold no child are leaf values
+            return None
+        return child_val
 
     def serialize(self, value, **kwargs):
         if value is None and self._does_allow_none():
@@ -595,6 +1022,8 @@ class Child(Field):
 
 class Any(Field):
 
+    __slots__ = ['fieldset']
+
     def new(self, fieldset, *args, **kwargs):
         self.fieldset = fieldset
         if not isinstance(self.fieldset, list):
@@ -619,7 +1048,7 @@ class Any(Field):
             raise SerializationError
         return value
 
-    def serialize(self, value):
+    def serialize(self, value, **kwargs):
         if value is None and self._does_allow_none():
             return None
         valid = False
@@ -654,6 +1083,8 @@ class Any(Field):
 
 class Anything(Field):
 
+    __slots__ = ()
+
     def serialize(self, value, **kwargs):
         return value
 
@@ -0,0 +1,127 @@
+import sys
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+
+from ciri.abstract import AbstractField, AbstractSchema
+from ciri.core import SchemaOptions
+from ciri.encoder import SchemaEncoder
+from ciri.registry import Registry
+
+
+#: Objects shared process wide, which are never attributed to a single owner
+SHARED_TYPES = (type, FunctionType, MethodType, BuiltinFunctionType, ModuleType,
+                SchemaOptions, SchemaEncoder, Registry, bool, type(None))
+
+
+def _is_shared(obj):
+    # cached small ints belong to the interpreter
+    return type(obj) is int and -5 <= obj <= 256
+
+
+def _own_size(obj):
+    size = sys.getsizeof(obj)
+    if hasattr(obj, '__dict__') and not isinstance(obj, type):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def _references(obj):
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            yield k
+            yield v
+        return
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        for v in obj:
+            yield v
+        return
+    if isinstance(obj, (str, bytes, int, float, complex)):
+        return
+    if hasattr(obj, '__dict__'):
+        # attribute names are interned and shared by every instance
+        for v in obj.__dict__.values():
+            yield v
+    for klass in type(obj).__mro__:
+        for slot in getattr(klass, '__slots__', ()):
+            if isinstance(slot, str) and slot not in ('__dict__', '__weakref__'):
+                try:
+                    yield getattr(obj, slot)
+                except AttributeError:
+                    pass
+
+
+def deep_sizeof(obj, stop=(), seen=None):
+    """Bytes used by `obj` and every object it references, each counted once.
+
+    Classes, functions, modules, schema options, encoders, registries and
+    interpreter cached objects are shared and never counted.
+
+    :param stop: Types whose instances are neither counted nor followed
+    :type stop: tuple
+    :param seen: Set of object ids already counted, to share between calls
+    :type seen: set
+    """
+    if seen is None:
+        seen = set()
+    stop = SHARED_TYPES + tuple(stop)
+    size = 0
+    pending = [obj]
+    while pending:
+        item = pending.pop()
+        if id(item) in seen or isinstance(item, stop) or _is_shared(item):
+            continue
+        seen.add(id(item))
+        size += _own_size(item)
+        pending.extend(_references(item))
+    return size
+
+
+def field_sizeof(field, seen=None):
+    """Bytes used by a field object, excluding the schemas it is bound to
+    and the message table shared by its class"""
+    if seen is None:
+        seen = set()
+    seen.add(id(type(field).messages))
+    return deep_sizeof(field, stop=(AbstractSchema,), seen=seen)
+
+
+def schema_sizeof(schema):
+    """Reports the bytes attributable to a schema class.
+
+    ``fields`` covers the field objects, ``metadata`` the lookup tables the
+    class builds (field maps, tags, callables, caches) and ``class`` the class
+    object and its namespace.
+
+    :param schema: Schema class or instance
+    :rtype: dict
+    """
+    cls = schema if isinstance(schema, type) else schema.__class__
+    seen = set()
+    fields = sum(field_sizeof(field, seen=seen) for field in cls._fields.values())
+    metadata = 0
+    for value in vars(cls).values():
+        metadata += deep_sizeof(value, stop=(AbstractField, AbstractSchema), seen=seen)
+    own = sys.getsizeof(cls) + sys.getsizeof(vars(cls))
+    return {'class': own, 'fields': fields, 'metadata': metadata, 'total': own + fields + metadata}
+
+
+def instance_sizeof(instance):
+    """Bytes used by a schema instance, including its values and any nested
+    instances it holds, excluding the fields shared with its class"""
+    return deep_sizeof(instance, stop=(AbstractField,))
+
+
+def memory_report(*schemas):
+    """Memory report keyed by schema class name. Instances passed in are
+    also measured under ``instance``.
+
+    :param schemas: Schema classes or instances
+    :rtype: dict
+    """
+    report = {}
+    for schema in schemas:
+        entry = schema_sizeof(schema)
+        if not isinstance(schema, type):
+            entry['instance'] = instance_sizeof(schema)
+        name = schema.__name__ if isinstance(schema, type) else schema.__class__.__name__
+        report[name] = entry
+    return report
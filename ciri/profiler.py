@@ -0,0 +1,196 @@
+import copy
+import inspect
+import threading
+from functools import wraps
+from timeit import default_timer as timer
+
+
+_local = threading.local()
+
+
+def active_profiler():
+    """Returns the :class:`Profiler` activated by a ``with`` block in the current thread"""
+    return getattr(_local, 'profiler', None)
+
+
+class TimingStats(object):
+    """Call count, cumulative/max time and error count of a single operation"""
+
+    __slots__ = ['calls', 'total', 'max', 'errors']
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.errors = 0
+
+    def add(self, elapsed, error=False):
+        self.calls += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+        if error:
+            self.errors += 1
+
+    def to_dict(self):
+        return {
+            'calls': self.calls,
+            'total': self.total,
+            'max': self.max,
+            'mean': self.total / self.calls if self.calls else 0.0,
+            'errors': self.errors
+        }
+
+
+class Profiler(object):
+    """
+    Records timings of schema operations, per field timings and the time spent
+    in `pre_*`/`post_*` callables.
+
+    Attach a profiler to a schema through the `profiler` schema option, or
+    activate it for every schema used in a block::
+
+        with Profiler() as profiler:
+            schema.serialize(data)
+        profiler.to_dict()
+    """
+
+    def __init__(self):
+        self._previous = []
+        self.reset()
+
+    def reset(self):
+        """Clears the recorded statistics"""
+        self.schemas = {}
+        self.fields = {}
+        self.callables = {}
+        self._wrapped = {}
+
+    def __enter__(self):
+        self._previous.append(active_profiler())
+        _local.profiler = self
+        return self
+
+    def __exit__(self, *exc_info):
+        _local.profiler = self._previous.pop()
+
+    def _stats(self, table, name, op):
+        ops = table.get(name)
+        if ops is None:
+            ops = table[name] = {}
+        stats = ops.get(op)
+        if stats is None:
+            stats = ops[op] = TimingStats()
+        return stats
+
+    def record_schema(self, schema, op, elapsed, error=False):
+        self._stats(self.schemas, schema.__class__.__name__, op).add(elapsed, error)
+
+    def record_field(self, schema, key, op, elapsed, error=False):
+        name = '{}.{}'.format(schema.__class__.__name__, key)
+        self._stats(self.fields, name, op).add(elapsed, error)
+
+    def record_callable(self, name, op, elapsed, error=False):
+        self._stats(self.callables, name, op).add(elapsed, error)
+
+    def run(self, schema, op, method, args, kwargs):
+        """Runs a schema operation with timing enabled"""
+        schema.__dict__['_profiler'] = self
+        schema.__dict__['_schema_callables'] = self._wrap_callables(schema, '_schema_callables')
+        schema.__dict__['_field_callables'] = self._wrap_callables(schema, '_field_callables')
+        error = False
+        start = timer()
+        try:
+            return method(schema, *args, **kwargs)
+        except Exception:
+            error = True
+            raise
+        finally:
+            elapsed = timer() - start
+            for attr in ('_profiler', '_schema_callables', '_field_callables'):
+                schema.__dict__.pop(attr, None)
+            self.record_schema(schema, op, elapsed, error)
+
+    def run_field(self, schema, key, op, func, *args):
+        """Runs a schema element function with timing enabled"""
+        error = False
+        start = timer()
+        try:
+            return func(*args)
+        except Exception:
+            error = True
+            raise
+        finally:
+            if op == 'validate':
+                error = error or key in schema._raw_errors
+            self.record_field(schema, key, op, timer() - start, error)
+
+    def _wrap_callables(self, schema, attr):
+        callables = getattr(schema.__class__, attr)
+        cache_key = (schema.__class__, attr)
+        wrapped = self._wrapped.get(cache_key)
+        if wrapped is None:
+            name = schema.__class__.__name__
+            wrapped = copy.copy(callables)
+            for c in callables.callables:
+                value = getattr(callables, c)
+                if isinstance(value, dict):
+                    value = dict((k, [self._wrap(f, '{}.{}'.format(name, k), c) for f in funcs])
+                                 for k, funcs in value.items())
+                else:
+                    value = [self._wrap(f, name, c) for f in value]
+                setattr(wrapped, c, value)
+            self._wrapped[cache_key] = wrapped
+        return wrapped
+
+    def _wrap(self, func, name, op):
+        @wraps(func)
+        def timed(*args, **kwargs):
+            start = timer()
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                self.record_callable(name, op, timer() - start, True)
+                raise
+            elapsed = timer() - start
+            if inspect.isawaitable(result):
+                # coroutine validators do their work once awaited by the async API
+                return self._timed_await(result, name, op, elapsed)
+            self.record_callable(name, op, elapsed)
+            return result
+        return timed
+
+    async def _timed_await(self, awaitable, name, op, elapsed):
+        error = False
+        start = timer()
+        try:
+            return await awaitable
+        except Exception:
+            error = True
+            raise
+        finally:
+            self.record_callable(name, op, elapsed + timer() - start, error)
+
+    def to_dict(self):
+        """Exports the recorded statistics"""
+        def export(table):
+            return dict((name, dict((op, stats.to_dict()) for op, stats in ops.items()))
+                        for name, ops in table.items())
+        return {
+            'schemas': export(self.schemas),
+            'fields': export(self.fields),
+            'callables': export(self.callables)
+        }
+
+
+def profiled(op):
+    """Decorates a schema operation so it is timed while a profiler is attached"""
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            profiler = self._config.profiler or active_profiler()
+            if profiler is None or self._profiler is not None:
+                return method(self, *args, **kwargs)
+            return profiler.run(self, op, method, args, kwargs)
+        return wrapper
+    return decorator
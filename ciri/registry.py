@@ -1,37 +1,161 @@
+import gc
+import threading
+import weakref
+from functools import reduce
+from importlib import import_module
+
+from ciri.abstract import AbstractSchema
 from ciri.exception import RegistryError
 
 RegistryKeyMissing = type('RegistryKeyMissing', (object,), {})
 
 
+class ImportPath(object):
+    """A registry entry given as a ``'package.module:ClassName'`` string,
+    imported the first time it is looked up"""
+
+    __slots__ = ['path', 'module', 'attr']
+
+    def __init__(self, path):
+        module, _, attr = path.partition(':')
+        if not module or not attr:
+            raise ValueError("'{}' is not a 'package.module:ClassName' import path".format(path))
+        self.path = path
+        self.module = module
+        self.attr = attr
+
+    def load(self):
+        try:
+            return reduce(getattr, self.attr.split('.'), import_module(self.module))
+        except (ImportError, AttributeError) as e:
+            raise RegistryError('Failed to import {}: {}'.format(self.path, e))
+
+
 class Registry(object):
+    """
+    Name to value storage.
+
+    :param weak: Only hold weak references to the values, so entries are
+        dropped once nothing else references them (e.g. schema classes
+        generated at runtime)
+    :type weak: bool
+    """
 
-    def __init__(self):
+    def __init__(self, weak=False):
+        self.weak = weak
+        self._lock = threading.RLock()
         self.init_registry()
 
     def init_registry(self):
-        self.storage = {}
+        self.storage = weakref.WeakValueDictionary() if self.weak else {}
+        #: entries registered as import paths which have not been imported yet
+        self.paths = {}
 
     def add(self, name, value):
+        self.paths.pop(name, None)
         self.storage[name] = value
 
+    def add_lazy(self, name, path):
+        """Registers `name` as an import path which is only imported (once)
+        when the entry is first looked up
+
+        :param path: ``'package.module:ClassName'``
+        :type path: str
+        """
+        self.storage.pop(name, None)
+        self.paths[name] = ImportPath(path)
+
+    def _resolve(self, name, path):
+        with self._lock:
+            # another thread may have imported it while we waited
+            value = self.storage.get(name, RegistryKeyMissing)
+            if value is RegistryKeyMissing:
+                value = path.load()
+                self.storage[name] = value
+                self.paths.pop(name, None)
+        return value
+
     def get(self, name, **kwargs):
-        if 'default' in kwargs:
-            return self.storage.get(name, kwargs.get('default'))
-        else:
-            reg_value = self.storage.get(name, RegistryKeyMissing)
-            if reg_value != RegistryKeyMissing:
-                return reg_value
+        reg_value = self.storage.get(name, RegistryKeyMissing)
+        if reg_value is RegistryKeyMissing:
+            path = self.paths.get(name)
+            if path is not None:
+                return self._resolve(name, path)
+            if 'default' in kwargs:
+                return kwargs.get('default')
             raise RegistryError('{} was not found in the registry'.format(name))
+        return reg_value
+
+    def names(self):
+        """Returns the registered names, including entries not imported yet"""
+        return list(self.storage.keys()) + list(self.paths)
 
     def remove(self, name):
-        del self.storage[name]
+        if self.paths.pop(name, None) is None:
+            del self.storage[name]
+
+    def unregister(self, value):
+        """Removes every entry holding `value`"""
+        for name, reg_value in list(self.storage.items()):
+            if reg_value is value:
+                del self.storage[name]
 
     def reset(self):
         self.init_registry()
 
 
 class SchemaRegistry(Registry):
-    pass
+
+    def add(self, name, value):
+        """Registers a schema. String values are import paths, see :meth:`add_lazy`"""
+        if isinstance(value, str):
+            self.add_lazy(name, value)
+        else:
+            super(SchemaRegistry, self).add(name, value)
+
+    def warmup(self, freeze=False):
+        """Compiles and instantiates every registered schema and resolves the
+        schemas they reference, so the first request of a worker does not pay
+        for it. Prefork servers can call this before forking.
+
+        :param freeze: Move everything allocated so far to the permanent
+            generation with `gc.freeze()` so collections in forked workers
+            do not touch (and copy) the shared pages
+        :type freeze: bool
+        :returns: the schema classes that were warmed up
+        :rtype: list
+        """
+        warmed = []
+        seen = set()
+        for name in self.names():
+            schema = self.get(name, default=None)
+            if isinstance(schema, type) and issubclass(schema, AbstractSchema):
+                self._warm_schema(schema, seen, warmed)
+        if freeze and hasattr(gc, 'freeze'):
+            gc.collect()
+            gc.freeze()
+        return warmed
+
+    def _warm_schema(self, schema, seen, warmed):
+        if schema in seen:
+            return
+        seen.add(schema)
+        schema.compile().resolve_schemas()
+        instance = schema()
+        warmed.append(schema)
+        for field in list(schema._fields.values()):
+            self._warm_field(field, instance, seen, warmed)
+        for variant in list(getattr(schema, '__poly_mapping__', {}).values()):
+            self._warm_schema(variant, seen, warmed)
+
+    def _warm_field(self, field, instance, seen, warmed):
+        get_schema = getattr(field, '_get_schema', None)
+        if get_schema is not None:
+            field._schema = instance
+            self._warm_schema(get_schema().__class__, seen, warmed)
+        for nested in [getattr(field, 'field', None)] + list(getattr(field, 'fieldset', None) or []):
+            if nested is not None:
+                self._warm_field(nested, instance, seen, warmed)
 
 
 schema_registry = SchemaRegistry()
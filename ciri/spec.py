@@ -0,0 +1,135 @@
+import copyreg
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+from ciri import fields
+from ciri.core import ABCSchema, PolySchema, Schema, SchemaOptions
+
+
+#: Number of schema classes kept by the spec cache
+SPEC_CACHE_SIZE = 256
+
+_cache = OrderedDict()
+_lock = threading.Lock()
+
+#: Field classes by lowercase name, including aliases (e.g. ``str``, ``int``)
+FIELD_TYPES = dict((name.lower(), value) for name, value in vars(fields).items()
+                   if isinstance(value, fields.AbstractBaseField) and value is not fields.Field)
+
+
+def _class_ref(obj):
+    # schema classes in a spec are hashed by identity, classes of the same
+    # name may be defined in different places. Cached classes keep them alive
+    if isinstance(obj, type):
+        return '<class {}.{} at {:#x}>'.format(obj.__module__, obj.__qualname__, id(obj))
+    raise TypeError("Object of type {} is not allowed in a spec".format(type(obj).__name__))
+
+
+def spec_hash(spec):
+    """Content hash of a spec, independent of key order"""
+    encoded = json.dumps(spec, sort_keys=True, default=_class_ref)
+    return hashlib.sha1(encoded.encode('utf-8')).hexdigest()
+
+
+def clear_spec_cache():
+    with _lock:
+        _cache.clear()
+
+
+def schema_from_spec(spec, base=Schema):
+    """Builds a schema class from a declarative spec. Identical specs return
+    the same class, the most recently used :data:`SPEC_CACHE_SIZE` classes are kept.
+
+    :param spec: dict, or the JSON encoded dict
+    :param base: Schema class to subclass
+    :rtype: :class:`~ciri.core.Schema` subclass
+    """
+    if isinstance(spec, (str, bytes)):
+        spec = json.loads(spec)
+    key = (base, spec_hash(spec))
+    with _lock:
+        schema = _cache.get(key)
+        if schema is not None:
+            _cache.move_to_end(key)
+            return schema
+    schema = build_schema(spec, base)
+    with _lock:
+        # keep the class another thread may have built meanwhile
+        schema = _cache.setdefault(key, schema)
+        _cache.move_to_end(key)
+        while len(_cache) > SPEC_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return schema
+
+
+def build_schema(spec, base=Schema):
+    """Builds a schema class from a spec, without caching"""
+    attrs = dict((key, build_field(field_spec, base)) for key, field_spec in spec.get('fields', {}).items())
+    if spec.get('options'):
+        attrs['__schema_options__'] = SchemaOptions(**spec['options'])
+    name = str(spec.get('name', 'SpecSchema'))
+
+    # the classes can't be imported, they are pickled by their spec instead
+    attrs['__module__'] = __name__
+    attrs['_spec_source'] = (spec, base)
+
+    poly_on = spec.get('poly_on')
+    if not poly_on:
+        return type(name, (base,), attrs)
+
+    # nested specs keep subclassing `base`
+    poly_base = base if issubclass(base, PolySchema) else PolySchema
+    if poly_on not in attrs:
+        raise ValueError("poly_on '{}' is not one of the spec fields".format(poly_on))
+    attrs['__poly_on__'] = attrs[poly_on]
+    parent = type(name, (poly_base,), attrs)
+    for poly_id, variant in spec.get('variants', {}).items():
+        variant_attrs = dict((key, build_field(field_spec, base))
+                             for key, field_spec in variant.get('fields', {}).items())
+        variant_attrs['__poly_id__'] = poly_id
+        variant_attrs['__module__'] = __name__
+        variant_attrs['_spec_source'] = (parent, poly_id)
+        type(str(variant.get('name', '{}_{}'.format(name, poly_id))), (parent,), variant_attrs)
+    return parent
+
+
+def build_field(spec, base=Schema):
+    """Builds a field from a field spec, e.g. ``{'type': 'string', 'required': True}``"""
+    kwargs = dict(spec)
+    type_ = kwargs.pop('type', None)
+    field_cls = FIELD_TYPES.get(str(type_).lower())
+    if field_cls is None:
+        raise ValueError("Unknown field type '{}'".format(type_))
+
+    args = []
+    if field_cls is fields.List:
+        if 'of' in kwargs:
+            kwargs['of'] = build_field(kwargs['of'], base)
+    elif field_cls is fields.Schema:
+        schema = kwargs.pop('schema', None)
+        if isinstance(schema, dict):
+            schema = schema_from_spec(schema, base)
+        args.append(schema)
+    elif field_cls is fields.Child:
+        args.append(build_field(kwargs.pop('field'), base))
+    elif field_cls is fields.Any:
+        args.append([build_field(f, base) for f in kwargs.pop('fieldset', [])])
+    return field_cls(*args, **kwargs)
+
+
+def _spec_variant(parent, poly_id):
+    return parent.getpoly(poly_id)
+
+
+def _reduce_schema(cls):
+    source = cls.__dict__.get('_spec_source')
+    if source is None:
+        return cls.__qualname__  # pickled by reference as usual
+    if isinstance(source[0], type):
+        return _spec_variant, source
+    return schema_from_spec, source
+
+
+copyreg.pickle(ABCSchema, _reduce_schema)
@@ -0,0 +1,151 @@
+from collections.abc import Mapping
+from operator import attrgetter, itemgetter
+
+from ciri.abstract import SchemaFieldMissing
+
+
+def is_accessible(value, keys=None):
+    """Whether values can be looked up on `value` by key or attribute name.
+
+    Objects without a `__dict__` (e.g. `__slots__` classes and namedtuples) only
+    count if their type defines one of `keys`, when given, so slotted values such
+    as `uuid.UUID` are not read as objects holding the fields of a schema."""
+    if isinstance(value, Mapping) or hasattr(value, '__dict__'):
+        return True
+    value_type = type(value)
+    if not hasattr(value_type, '__slots__'):
+        return False
+    return keys is None or any(hasattr(value_type, key) for key in keys)
+
+
+def get_value(obj, key, default=SchemaFieldMissing):
+    """Looks up `key` on a mapping (item access) or on an object
+    (attribute access, which includes slots and properties)"""
+    if isinstance(obj, Mapping):
+        return obj.get(key, default)
+    if hasattr(obj, '__dict__') or hasattr(type(obj), '__slots__'):
+        return getattr(obj, key, default)
+    return default
+
+
+class PathAccessor(object):
+    """Dotted path compiled into a chain of lookups"""
+
+    __slots__ = ['path', 'parts']
+
+    def __init__(self, path):
+        self.path = path
+        self.parts = tuple(part for part in (path or '').split('.') if part)
+
+    def __call__(self, obj, default=SchemaFieldMissing):
+        for part in self.parts:
+            obj = get_value(obj, part)
+            if obj is SchemaFieldMissing:
+                return default
+        return obj
+
+
+class PathResolver(object):
+    """Resolves a :class:`PathAccessor` and remembers the last result.
+
+    Resolvers with a `parent` resolve the parent's path first and only walk
+    their own segments from there, see :func:`shared_resolver`. Fields sharing
+    a resolver (or a prefix of their path) only walk it once for a given input
+    object. The owning schema resets the resolvers at the start and the end of
+    every pass so a mutated input is never served stale, nor kept alive."""
+
+    __slots__ = ['accessor', 'parent', '_source', '_resolved']
+
+    def __init__(self, path, parent=None):
+        self.accessor = PathAccessor(path)
+        self.parent = parent
+        self.reset()
+
+    def reset(self):
+        self._source = SchemaFieldMissing
+        self._resolved = SchemaFieldMissing
+        if self.parent is not None:
+            self.parent.reset()
+
+    def resolve(self, obj):
+        if obj is not self._source:
+            value = obj if self.parent is None else self.parent.resolve(obj)
+            self._resolved = SchemaFieldMissing if value is SchemaFieldMissing else self.accessor(value)
+            self._source = obj
+        return self._resolved
+
+
+def shared_resolver(resolvers, key, path):
+    """Returns the resolver of `path` read off the input value `key`, built as a
+    trie of path segments in `resolvers` so paths sharing a prefix share the
+    resolvers of that prefix, e.g. ``a.b`` and ``a.c`` both resolve ``a`` once."""
+    parts = PathAccessor(path).parts
+    resolver = None
+    for i in range(1, len(parts) + 1):
+        node = resolvers.get((key, parts[:i]))
+        if node is None:
+            node = resolvers[(key, parts[:i])] = PathResolver(parts[i - 1], parent=resolver)
+        resolver = node
+    return resolver or PathResolver(None)
+
+
+def compile_getters(type_, keys):
+    """Compiles a getter for each of `keys` suited to the `type_` of input.
+
+    Namedtuples are read by position, everything else by attribute."""
+    tuple_fields = getattr(type_, '_fields', None)
+    if issubclass(type_, tuple) and isinstance(tuple_fields, tuple):
+        return dict((k, itemgetter(tuple_fields.index(k))) for k in keys if k in tuple_fields)
+    return dict((k, attrgetter(k)) for k in keys)
+
+
+class ObjectView(Mapping):
+    """Read-only mapping over an object's attributes, limited to the keys
+    a schema compiled getters for. Lets schemas consume objects directly
+    instead of copying them into a dict first.
+
+    Iterating yields the keys without reading them, so properties (e.g. lazy
+    loaded relations) only run when the schema reads their value. Keys the
+    object does not have raise `KeyError` on access and are left out of
+    :meth:`items`."""
+
+    __slots__ = ['obj', 'getters']
+
+    def __init__(self, obj, getters):
+        self.obj = obj
+        self.getters = getters
+
+    def __getitem__(self, key):
+        try:
+            return self.getters[key](self.obj)
+        except (KeyError, AttributeError):
+            raise KeyError(key)
+
+    def get(self, key, default=None):
+        getter = self.getters.get(key)
+        if getter is None:
+            return default
+        try:
+            return getter(self.obj)
+        except AttributeError:
+            return default
+
+    def __iter__(self):
+        return iter(self.getters)
+
+    def __len__(self):
+        return len(self.getters)
+
+    def items(self):
+        obj = self.obj
+        for key, getter in self.getters.items():
+            try:
+                yield key, getter(obj)
+            except AttributeError:
+                continue
+
+    def to_dict(self):
+        """Mutable copy of the input, for callables that expect a dict"""
+        if hasattr(self.obj, '__dict__'):
+            return vars(self.obj)
+        return dict(self.items())
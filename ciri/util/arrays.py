@@ -0,0 +1,109 @@
+import math
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+#: memoryview formats of integer and floating point items
+INT_FORMATS = frozenset('bBhHiIlLqQnN')
+FLOAT_FORMATS = frozenset('efd')
+
+#: numpy dtype kinds mapped to 'i' (integer), 'f' (floating point) and 'b' (bool)
+NUMPY_KINDS = {'i': 'i', 'u': 'i', 'f': 'f', 'b': 'b'}
+
+
+def is_array(value):
+    """Whether `value` is a numeric array: a numpy array, an `array.array`, or any
+    other object exposing the buffer protocol. Bytes and strings are not arrays."""
+    if np is not None and isinstance(value, np.ndarray):
+        return True
+    if isinstance(value, (array, memoryview)):
+        return True
+    if isinstance(value, (str, bytes, bytearray)):
+        return False
+    try:
+        memoryview(value)
+    except TypeError:
+        return False
+    return True
+
+
+def to_list(value):
+    """Copies the values of an array into (nested) lists"""
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    return memoryview(value).tolist()
+
+
+def to_array(values):
+    """Converts a list of numbers to a numpy array, or to an `array.array` if numpy
+    is not installed. Raises TypeError or ValueError for non numeric values."""
+    if np is not None:
+        data = np.asarray(values)
+        if NUMPY_KINDS.get(data.dtype.kind) not in ('i', 'f'):
+            raise TypeError('not a numeric array')
+        return data
+    kinds = set(map(type, values))
+    if kinds <= {int}:
+        return array('q', values)
+    if kinds <= {int, float}:
+        return array('d', values)
+    raise TypeError('not a numeric array')
+
+
+class NumericBuffer(object):
+    """Read only view of a numeric array. Checks run vectorized with numpy when
+    it is installed, and over a flat memoryview otherwise. No data is copied
+    for numpy arrays, `array.array` and contiguous buffers.
+
+    :param value: numpy array, `array.array` or buffer
+    """
+
+    __slots__ = ['data', 'kind', 'shape']
+
+    def __init__(self, value):
+        if np is not None:
+            self.data = np.asarray(value)
+            self.kind = NUMPY_KINDS.get(self.data.dtype.kind)
+            self.shape = self.data.shape
+            return
+        view = memoryview(value)
+        fmt = view.format.lstrip('@=<>!')
+        self.shape = view.shape
+        self.kind = 'i' if fmt in INT_FORMATS else 'f' if fmt in FLOAT_FORMATS else 'b' if fmt == '?' else None
+        try:
+            self.data = view if view.ndim == 1 else view.cast('B').cast(fmt)
+        except (TypeError, ValueError):
+            # non contiguous or unsupported item formats
+            self.data = None
+            self.kind = None
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    def __len__(self):
+        return len(self.data) if np is None else self.data.size
+
+    def min(self):
+        if not len(self):
+            return None
+        return self.data.min() if np is not None else min(self.data)
+
+    def max(self):
+        if not len(self):
+            return None
+        return self.data.max() if np is not None else max(self.data)
+
+    def is_integral(self):
+        """Whether every value is a whole number"""
+        if self.kind == 'i':
+            return True
+        if self.kind != 'f':
+            return False
+        if np is not None:
+            return bool(np.all(np.isfinite(self.data)) and np.all(np.mod(self.data, 1) == 0))
+        return all(math.isfinite(v) and v.is_integer() for v in self.data)
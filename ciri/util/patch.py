@@ -0,0 +1,77 @@
+from collections.abc import Mapping
+
+from ciri.exception import SerializationError
+
+
+PATCH_OPERATIONS = ('add', 'replace', 'remove')
+
+
+def parse_pointer(pointer):
+    """Splits a JSON pointer (e.g. ``/cast/0/name``) into its unescaped parts"""
+    if not pointer.startswith('/'):
+        raise SerializationError("Invalid JSON pointer '{}'".format(pointer))
+    return tuple(part.replace('~1', '/').replace('~0', '~') for part in pointer.split('/')[1:])
+
+
+def parse_patch(data):
+    """Normalizes a patch into a list of ``(op, path, value)`` operations.
+
+    `data` is either a mapping of dotted paths to replacement values or a
+    list of JSON-Patch (RFC 6902) ``add``, ``replace`` and ``remove`` operations.
+    """
+    if isinstance(data, Mapping):
+        return [('replace', tuple(str(key).split('.')), value) for key, value in data.items()]
+    ops = []
+    for item in data:
+        op = item.get('op')
+        if op not in PATCH_OPERATIONS:
+            raise SerializationError("Unsupported patch operation '{}'".format(op))
+        ops.append((op, parse_pointer(item['path']), item.get('value')))
+    return ops
+
+
+def apply_patch(base, ops):
+    """Applies `ops` to `base` without modifying it. Only the containers along
+    each patched path are copied, everything else is shared with `base`."""
+    copied = set()
+
+    def own(node, default):
+        if node is None:
+            node = default
+        elif id(node) in copied:
+            return node
+        else:
+            node = list(node) if isinstance(node, list) else dict(node)
+        copied.add(id(node))
+        return node
+
+    def apply(node, parts, op, value):
+        part = parts[0]
+        if isinstance(node, list):
+            node = own(node, [])
+            index = len(node) if part == '-' else int(part)
+            if len(parts) > 1:
+                node[index] = apply(node[index], parts[1:], op, value)
+            elif op == 'add':
+                node.insert(index, value)
+            elif op == 'replace':
+                node[index] = value
+            else:
+                del node[index]
+            return node
+        node = own(node, {})
+        if len(parts) > 1:
+            node[part] = apply(node.get(part), parts[1:], op, value)
+        elif op == 'remove':
+            node.pop(part, None)
+        else:
+            node[part] = value
+        return node
+
+    doc = base if base is not None else {}
+    for op, parts, value in ops:
+        try:
+            doc = apply(doc, parts, op, value)
+        except (IndexError, ValueError, TypeError, AttributeError):
+            raise SerializationError("Invalid patch path '{}'".format('/'.join(parts)))
+    return doc
@@ -0,0 +1,103 @@
+import asyncio
+import inspect
+import threading
+
+from ciri.exception import FieldValidationError
+
+
+_local = threading.local()
+
+
+def pending_validators():
+    """Returns the :class:`PendingValidators` collecting coroutine validators in
+    the current thread, or None outside of the async API."""
+    return getattr(_local, 'pending', None)
+
+
+class PendingValidators(object):
+    """Collects the coroutine `post_validate` validators met while a schema
+    validates synchronously, so the async API can run them concurrently
+    afterwards. Each entry keeps the path of its value, a list of
+    ``(key, field)`` pairs from the top level key down, and the output the
+    value was validated into. The values validated at the top level, and the
+    input they were read from, are kept so the async API can serialize or
+    deserialize them once the validators ran.
+
+    Coroutine `post_validate` callables of schemas are kept apart, they run
+    after the field validators, one after the other, as they receive the
+    output the field validators complete.
+
+    Collection is active within the context manager, which must not span an
+    ``await``: other tasks of the event loop share the thread. Nesting another
+    collector discards what is met meanwhile.
+    """
+
+    __slots__ = ['path', 'entries', 'schema_entries', 'target', 'data', 'values', 'outer']
+
+    def __init__(self):
+        self.path = []
+        self.entries = []
+        self.schema_entries = []
+        self.target = None
+        self.data = None
+        self.values = {}
+        self.outer = None
+
+    def __enter__(self):
+        self.outer = pending_validators()
+        _local.pending = self
+        return self
+
+    def __exit__(self, *args):
+        _local.pending = self.outer
+        self.outer = None
+
+    def __len__(self):
+        return len(self.entries) + len(self.schema_entries)
+
+    def add(self, validators, value, schema, field):
+        """Defers `validators`, which run in order on `value` as `post_validate` would"""
+        self.entries.append((list(self.path), validators, value, schema, field, self.target))
+
+    def add_schema(self, validators, value, schema, context):
+        """Defers `validators`, which run in order on the output `value` of `schema`
+        as its `post_validate` callables would"""
+        self.schema_entries.append((list(self.path), validators, value, schema, context))
+
+    async def run(self, limit):
+        """Runs the collected validators, with at most `limit` entries running at
+        a time. Returns ``(entry, value, error)`` for each entry, in order."""
+        semaphore = asyncio.Semaphore(limit)
+
+        async def run_entry(entry):
+            path, validators, value, schema, field, target = entry
+            async with semaphore:
+                try:
+                    for validator in validators:
+                        value = validator(value, schema=schema, field=field)
+                        if inspect.isawaitable(value):
+                            value = await value
+                except FieldValidationError as field_exc:
+                    return entry, value, field_exc.error
+            return entry, value, None
+
+        return await asyncio.gather(*[run_entry(entry) for entry in self.entries])
+
+    async def run_schema(self, output):
+        """Runs the collected schema validators, nested schemas first. The value
+        returned for a nested schema replaces its output within the top level
+        values, `output` is returned replaced by the value of the top level schema."""
+        for path, validators, value, schema, context in self.schema_entries:
+            for validator in validators:
+                value = validator(value, schema=schema, context=context)
+                if inspect.isawaitable(value):
+                    value = await value
+            if not path:
+                output = value
+                continue
+            container = self.values
+            for key, field in path[:-1]:
+                container = container[int(key) if isinstance(container, list) else key]
+            key = path[-1][0]
+            container[int(key) if isinstance(container, list) else key] = value
+        return output
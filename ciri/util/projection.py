@@ -0,0 +1,29 @@
+from functools import lru_cache
+
+
+def compile_projection(spec):
+    """Compiles a projection spec such as ``['title', 'cast.name']`` into a tree
+    of nested dicts, e.g. ``{'title': None, 'cast': {'name': None}}``. A `None`
+    node selects the whole field. Compiled trees are cached and passed through
+    unchanged.
+
+    :param spec: Sequence of dotted field paths, or an already compiled tree
+    """
+    if spec is None or isinstance(spec, dict):
+        return spec
+    return _compile(tuple(spec))
+
+
+@lru_cache(maxsize=256)
+def _compile(spec):
+    tree = {}
+    for path in spec:
+        node = tree
+        *parents, leaf = path.split('.')
+        for part in parents:
+            if part in node and node[part] is None:
+                break  # the whole field was already requested
+            node = node.setdefault(part, {})
+        else:
+            node[leaf] = None
+    return tree
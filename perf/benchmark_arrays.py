@@ -0,0 +1,54 @@
+"""
+Validation of large numeric arrays: `List(Integer())` and `List(Float())`
+given lists, `array.array` values (checked as a whole, without copying) and
+numpy arrays when numpy is installed.
+"""
+import os
+import sys
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
+
+from timeit import default_timer as timer
+
+from ciri import fields
+from ciri.core import Schema
+from ciri.util.arrays import np
+
+
+SIZE = 1000000
+
+
+class Sensor(Schema):
+
+    counts = fields.List(fields.Integer())
+    readings = fields.List(fields.Float())
+    samples = fields.NumericArray(dtype='float', min=0, max=SIZE)
+
+
+def run(label, data, calls):
+    schema = Sensor()
+    start = timer()
+    for _ in range(calls):
+        schema.validate(data)
+    duration = (timer() - start) / calls
+    print("Average {} duration over {} calls of {} values: {} seconds".format(label, calls, SIZE, duration))
+
+
+if __name__ == '__main__':
+    # run benchmark
+    print("Running")
+
+    calls = 5
+    counts = list(range(SIZE))
+    readings = [idx / 3.0 for idx in range(SIZE)]
+    # whole floats take the per item path in a list
+    run('list validate (whole float counts)', {'counts': [float(v) for v in counts]}, calls)
+    run('list validate', {'counts': counts, 'readings': readings}, calls)
+    run('array.array validate', {'counts': array('q', counts), 'readings': array('d', readings)}, calls)
+    run('array.array NumericArray validate', {'samples': array('d', readings)}, calls)
+    if np is not None:
+        run('numpy validate', {'counts': np.arange(SIZE), 'readings': np.asarray(readings)}, calls)
+        run('numpy NumericArray validate', {'samples': np.asarray(readings)}, calls)
+    else:
+        print("numpy is not installed, skipping numpy arrays")
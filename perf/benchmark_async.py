@@ -0,0 +1,116 @@
+"""
+Event loop latency while serializing a large document with :meth:`~ciri.core.Schema.serialize`
+and with :meth:`~ciri.core.Schema.aserialize`, which yields to the loop between list chunks or
+offloads the document to an executor, and :meth:`~ciri.core.Schema.avalidate` of a list whose
+items have a coroutine validator, at increasing concurrency limits.
+"""
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
+
+from timeit import default_timer as timer
+
+from ciri import fields
+from ciri.core import Schema, SchemaOptions
+
+
+class Line(Schema):
+
+    sku = fields.String(required=True)
+    quantity = fields.Integer(required=True)
+    price = fields.Float()
+
+
+class Invoice(Schema):
+
+    number = fields.String(required=True)
+    lines = fields.List(fields.Schema(Line))
+
+
+async def sku_exists(value, schema=None, field=None):
+    # a database round trip
+    await asyncio.sleep(0.001)
+    return value
+
+
+class CheckedLine(Line):
+
+    sku = fields.String(required=True, post_validate=[sku_exists])
+
+
+class CheckedInvoice(Invoice):
+
+    lines = fields.List(fields.Schema(CheckedLine))
+
+
+def invoice(size):
+    return {'number': 'INV-1', 'lines': [{'sku': 'sku{}'.format(idx), 'quantity': idx, 'price': idx / 3.0}
+                                         for idx in range(size)]}
+
+
+async def ticker(stalls, done):
+    # the longest time between two turns of the loop
+    last = timer()
+    while not done.is_set():
+        await asyncio.sleep(0)
+        now = timer()
+        stalls.append(now - last)
+        last = now
+
+
+async def measure(label, operation, runs):
+    stalls = []
+    done = asyncio.Event()
+    task = asyncio.ensure_future(ticker(stalls, done))
+    await asyncio.sleep(0)
+    start = timer()
+    for _ in range(runs):
+        await operation()
+        # lets the ticker see the end of the operation
+        await asyncio.sleep(0)
+    duration = (timer() - start) / runs
+    done.set()
+    await task
+    print("Average {} duration over {} runs: {} seconds, longest loop stall: {} seconds".format(
+        label, runs, duration, max(stalls)))
+
+
+async def main(size, runs):
+    data = invoice(size)
+
+    async def sync():
+        Invoice().serialize(data)
+
+    async def chunked():
+        schema = Invoice()
+        schema.config({'options': SchemaOptions(async_offload_size=None)})
+        await schema.aserialize(data)
+
+    async def offloaded():
+        schema = Invoice()
+        schema.config({'options': SchemaOptions(async_offload_size=1)})
+        await schema.aserialize(data)
+
+    await measure('serialize', sync, runs)
+    await measure('chunked aserialize', chunked, runs)
+    await measure('offloaded aserialize', offloaded, runs)
+
+    checked = invoice(500)
+    for concurrency in (1, 10, 100):
+        schema = CheckedInvoice()
+        schema.config({'options': SchemaOptions(async_concurrency=concurrency)})
+        start = timer()
+        await schema.avalidate(checked)
+        print("avalidate of 500 lines with coroutine validators, concurrency {}: {} seconds".format(
+            concurrency, timer() - start))
+
+
+if __name__ == '__main__':
+    # run benchmark
+    print("Running")
+
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(main(size=20000, runs=10))
+    loop.close()
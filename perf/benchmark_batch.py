@@ -0,0 +1,72 @@
+"""
+Columnar batch validation of flat records with :meth:`~ciri.core.Schema.validate_batch`,
+compared with validating each record.
+"""
+import datetime
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
+
+from timeit import default_timer as timer
+
+from ciri import fields
+from ciri.core import Schema
+
+
+class PageView(Schema):
+
+    url = fields.String(required=True)
+    user = fields.Integer(required=True)
+    duration = fields.Float()
+    bounced = fields.Boolean()
+    day = fields.Date()
+
+
+def records(count, invalid_every=None):
+    day = datetime.date(2020, 1, 1)
+    batch = [{'url': '/page/{}'.format(idx % 100), 'user': idx, 'duration': idx / 7.0,
+              'bounced': idx % 3 == 0, 'day': day} for idx in range(count)]
+    if invalid_every:
+        for record in batch[::invalid_every]:
+            record['user'] = 'unknown'
+    return batch
+
+
+def per_record(schema, batch):
+    output = []
+    for record in batch:
+        try:
+            output.append(schema.validate(record))
+        except Exception:
+            output.append(None)
+    return output
+
+
+def batched(schema, batch):
+    try:
+        return schema.validate_batch(batch)
+    except Exception:
+        return None
+
+
+def run(label, func, batch, runs):
+    schema = PageView()
+    start = timer()
+    for _ in range(runs):
+        func(schema, batch)
+    duration = (timer() - start) / runs
+    print("Average {} duration over {} runs of {} records: {} seconds".format(label, runs, len(batch), duration))
+
+
+if __name__ == '__main__':
+    # run benchmark
+    print("Running")
+
+    runs = 5
+    valid = records(100000)
+    invalid = records(100000, invalid_every=100)
+    run('per record validate', per_record, valid, runs)
+    run('validate_batch', batched, valid, runs)
+    run('per record validate (1% invalid)', per_record, invalid, runs)
+    run('validate_batch (1% invalid)', batched, invalid, runs)
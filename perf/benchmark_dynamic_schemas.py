@@ -0,0 +1,64 @@
+"""
+Creates and drops dynamic (e.g. tenant specific) schema classes and reports
+the memory still held afterwards, with strong and weak registries/poly mappings.
+"""
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
+
+from ciri import fields
+from ciri.core import PolySchema
+from ciri.registry import SchemaRegistry
+
+from timeit import default_timer as timer
+
+
+def make_parent(weak):
+    class Form(PolySchema):
+        __poly_weak__ = weak
+        kind = fields.String(required=True)
+        __poly_on__ = kind
+    return Form
+
+
+def churn(count, weak, checkpoints=5):
+    registry = SchemaRegistry(weak=weak)
+    parent = make_parent(weak)
+    step = count // checkpoints
+
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    start = timer()
+    for idx in range(count):
+        name = 'tenant{}'.format(idx)
+        schema = type('TenantForm{}'.format(idx), (parent,), {
+            '__poly_id__': name,
+            'title': fields.String(required=True),
+            'amount': fields.Float(),
+        })
+        registry.add(name, schema)
+        parent().serialize({'kind': name, 'title': 'form', 'amount': 1.5})
+        del schema
+        if (idx + 1) % step == 0:
+            gc.collect()
+            held = tracemalloc.get_traced_memory()[0] - base
+            print("  {:>7} schemas created, {:>7} registered, {:>7} mapped, {:.1f} MB held".format(
+                idx + 1, len(registry.names()), len(parent.__poly_mapping__), held / 1024.0 / 1024.0))
+    elapsed = timer() - start
+    tracemalloc.stop()
+    print("Average {} dynamic schema duration over {} schemas: {} seconds".format(
+        'weak' if weak else 'strong', count, elapsed / count))
+
+
+if __name__ == '__main__':
+    # run benchmark
+    print("Running")
+
+    print("strong references")
+    churn(10000, weak=False)
+    print("weak references")
+    churn(100000, weak=True)
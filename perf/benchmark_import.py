@@ -0,0 +1,91 @@
+"""
+Import time of a module defining many schema classes, compiled eagerly and
+with the lazy schema option.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.abspath(__file__)) + '/../'
+
+sys.path.insert(0, ROOT)  # noqa
+
+
+SCHEMA_TEMPLATE = '''
+class Address{idx}(Base):
+    street = fields.String(required=True)
+    city = fields.String(required=True)
+    postcode = fields.String()
+
+
+class Person{idx}(Base):
+    name = fields.String(required=True)
+    email = fields.String()
+    age = fields.Integer()
+    score = fields.Float()
+    active = fields.Boolean(default=True)
+    created = fields.DateTime()
+    address = fields.Schema(Address{idx})
+    tags = fields.List(fields.String())
+'''
+
+
+MODULE_HEADER = '''
+from ciri import fields
+from ciri.core import Schema
+
+
+class Base(Schema):
+    __schema_lazy__ = {lazy}
+'''
+
+
+TIMER = '''
+import sys
+sys.path.insert(0, {root!r})
+sys.path.insert(0, {path!r})
+from timeit import default_timer as timer
+import ciri.core
+start = timer()
+import {module}
+imported = timer()
+for name in dir({module}):
+    if name.startswith('Person'):
+        getattr({module}, name).compile()
+print(imported - start, timer() - imported)
+'''
+
+
+def write_module(path, module, count, lazy):
+    with open(os.path.join(path, module + '.py'), 'w') as fp:
+        fp.write(MODULE_HEADER.format(lazy=lazy))
+        for idx in range(count):
+            fp.write(SCHEMA_TEMPLATE.format(idx=idx))
+
+
+def time_import(path, module):
+    code = TIMER.format(root=ROOT, path=path, module=module)
+    output = subprocess.check_output([sys.executable, '-c', code])
+    return [float(value) for value in output.split()]
+
+
+if __name__ == '__main__':
+    # run benchmark
+    print("Running")
+
+    count = 1000  # pairs of schemas, 2000 classes
+    runs = 5
+    path = tempfile.mkdtemp()
+
+    for label, lazy in (('eager', False), ('lazy', True)):
+        module = 'schemas_{}'.format(label)
+        write_module(path, module, count, lazy)
+        time_import(path, module)  # compile the bytecode
+        timings = [time_import(path, module) for _ in range(runs)]
+        import_time = sum(t[0] for t in timings) / runs
+        compile_time = sum(t[1] for t in timings) / runs
+        print("Average {} import duration of {} schemas over {} runs: {} seconds".format(
+            label, count * 2, runs, import_time))
+        print("Average {} compile duration of {} schemas over {} runs: {} seconds".format(
+            label, count * 2, runs, compile_time))
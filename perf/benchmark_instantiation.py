@@ -0,0 +1,70 @@
+"""
+Cost of creating schema instances: plain construction of a small and a wide
+schema, construction with values, and pooled instances from
+:meth:`~ciri.core.Schema.acquire` / :meth:`~ciri.core.Schema.release`.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
+
+from timeit import default_timer as timer
+
+from ciri import fields
+from ciri.core import Schema
+
+
+class Small(Schema):
+
+    name = fields.String(required=True)
+    age = fields.Integer()
+
+
+Wide = type('Wide', (Schema,), dict(('field_{}'.format(idx), fields.String()) for idx in range(100)))
+
+
+def construct(schema):
+    return schema()
+
+
+def construct_values(schema):
+    return schema(name='ciri', age=20)
+
+
+def pooled(schema):
+    instance = schema.acquire()
+    instance.release()
+    return instance
+
+
+def construct_validate(schema):
+    return schema().validate({'name': 'ciri', 'age': 20})
+
+
+def pooled_validate(schema):
+    instance = schema.acquire()
+    output = instance.validate({'name': 'ciri', 'age': 20})
+    instance.release()
+    return output
+
+
+def run(label, func, schema, calls):
+    start = timer()
+    for _ in range(calls):
+        func(schema)
+    duration = (timer() - start) / calls
+    print("Average {} duration over {} calls: {} seconds".format(label, calls, duration))
+
+
+if __name__ == '__main__':
+    # run benchmark
+    print("Running")
+
+    calls = 100000
+    run('Small()', construct, Small, calls)
+    run('Wide() (100 fields)', construct, Wide, calls)
+    run('Small(**values)', construct_values, Small, calls)
+    run('Small.acquire() / release()', pooled, Small, calls)
+    run('Wide.acquire() / release()', pooled, Wide, calls)
+    run('Small().validate()', construct_validate, Small, calls)
+    run('pooled Small validate()', pooled_validate, Small, calls)
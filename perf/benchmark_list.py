@@ -0,0 +1,59 @@
+"""
+List fields of primitive items, which are checked with a single type scan,
+compared with lists holding one mismatched item, which fall back to per item
+validation.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
+
+from timeit import default_timer as timer
+
+from ciri import fields
+from ciri.core import Schema
+
+
+class Measurements(Schema):
+
+    names = fields.List(fields.String())
+    counts = fields.List(fields.Integer())
+    values = fields.List(fields.Float())
+    flags = fields.List(fields.Boolean())
+
+
+SIZE = 1000
+
+HOMOGENEOUS = {
+    'names': ['name {}'.format(idx) for idx in range(SIZE)],
+    'counts': list(range(SIZE)),
+    'values': [idx / 3.0 for idx in range(SIZE)],
+    'flags': [idx % 2 == 0 for idx in range(SIZE)]
+}
+
+# a valid, but not exactly typed, item makes the list take the per item path
+MIXED = dict(HOMOGENEOUS, counts=HOMOGENEOUS['counts'][:-1] + [1.0],
+             values=HOMOGENEOUS['values'][:-1] + [1])
+
+
+def run(label, func, calls):
+    start = timer()
+    for _ in range(calls):
+        func()
+    duration = (timer() - start) / calls
+    print("Average {} duration over {} calls: {} seconds".format(label, calls, duration))
+
+
+if __name__ == '__main__':
+    # run benchmark
+    print("Running")
+
+    schema = Measurements()
+    calls = 500
+    run('homogeneous validate', lambda: schema.validate(HOMOGENEOUS), calls)
+    run('mixed validate', lambda: schema.validate(MIXED), calls)
+    run('homogeneous serialize', lambda: schema.serialize(HOMOGENEOUS), calls)
+    run('homogeneous serialize (skip validation)',
+        lambda: schema.serialize(HOMOGENEOUS, skip_validation=True), calls)
+    run('mixed serialize (skip validation)', lambda: schema.serialize(MIXED, skip_validation=True), calls)
+    run('homogeneous deserialize', lambda: schema.deserialize(HOMOGENEOUS), calls)
@@ -0,0 +1,84 @@
+"""
+Memory footprint of schema classes, field objects and instances, measured
+with tracemalloc and compared with the :mod:`ciri.memory` report.
+"""
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
+
+from ciri import fields
+from ciri.core import Schema
+from ciri.memory import field_sizeof, instance_sizeof, schema_sizeof
+
+
+class Track(Schema):
+
+    title = fields.String(required=True)
+    artist = fields.String(required=True)
+    album = fields.String()
+    length = fields.Integer()
+    rating = fields.Float()
+    explicit = fields.Boolean()
+
+
+DATA = {'title': 'Fade Away', 'artist': 'Ciri', 'album': 'Witcher',
+        'length': 243, 'rating': 4.5, 'explicit': False}
+
+
+def measure(label, count, build):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = build(count)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print("Average {} size over {} objects: {:.1f} bytes".format(label, count, (after - before) / count))
+    return held
+
+
+def define_schemas(count):
+    return [type('Track{}'.format(idx), (Schema,), {
+        'title': fields.String(required=True),
+        'length': fields.Integer(),
+        'rating': fields.Float(),
+    }) for idx in range(count)]
+
+
+def define_fields(count):
+    return [fields.String() for _ in range(count)]
+
+
+def create_instances(count):
+    return [Track() for _ in range(count)]
+
+
+def deserialize_instances(count):
+    schema = Track()
+    return [schema.deserialize(DATA) for _ in range(count)]
+
+
+def deserialize_records(count):
+    class RecordTrack(Track):
+        class Meta:
+            options = Track._config.__class__(record_output=True)
+    schema = RecordTrack()
+    return [schema.deserialize(DATA) for _ in range(count)]
+
+
+if __name__ == '__main__':
+    # run benchmark
+    print("Running")
+
+    measure('schema class (3 fields)', 1000, define_schemas)
+    measure('String field', 20000, define_fields)
+    measure('empty schema instance', 20000, create_instances)
+    measure('deserialized instance', 20000, deserialize_instances)
+    measure('deserialized record', 20000, deserialize_records)
+
+    print("\nciri.memory report")
+    print("Track class: {}".format(schema_sizeof(Track)))
+    print("String field: {} bytes".format(field_sizeof(Track._fields['title'])))
+    print("Deserialized instance: {} bytes".format(instance_sizeof(Track().deserialize(DATA))))
@@ -0,0 +1,77 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
+
+from collections import namedtuple
+from dataclasses import dataclass
+
+from ciri import fields
+from ciri.core import Schema
+
+from timeit import default_timer as timer
+
+
+class Track(Schema):
+
+    title = fields.String(required=True)
+    artist = fields.String(required=True)
+    album = fields.String()
+    length = fields.Integer()
+    rating = fields.Float()
+    explicit = fields.Boolean()
+
+
+@dataclass
+class DataTrack:
+    title: str
+    artist: str
+    album: str
+    length: int
+    rating: float
+    explicit: bool
+
+
+class SlotTrack(object):
+    __slots__ = ['title', 'artist', 'album', 'length', 'rating', 'explicit']
+
+    def __init__(self, title, artist, album, length, rating, explicit):
+        self.title = title
+        self.artist = artist
+        self.album = album
+        self.length = length
+        self.rating = rating
+        self.explicit = explicit
+
+
+TupleTrack = namedtuple('TupleTrack', ['title', 'artist', 'album', 'length', 'rating', 'explicit'])
+
+
+VALUES = ('Fade Away', 'Ciri', 'Witcher', 243, 4.5, False)
+
+
+if __name__ == '__main__':
+    # run benchmark
+    print("Running")
+
+    ncalls = 20000
+    schema = Track()
+
+    inputs = [
+        ('dict', dict(zip(TupleTrack._fields, VALUES))),
+        ('dataclass', DataTrack(*VALUES)),
+        ('slots', SlotTrack(*VALUES)),
+        ('namedtuple', TupleTrack(*VALUES)),
+    ]
+
+    for label, data in inputs:
+        start = timer()
+
+        for _ in range(ncalls):
+            schema.serialize(data)
+
+        end = timer()
+
+        avg_duration = (end-start) / ncalls
+
+        print("Average {} serialization duration over {} calls: {} seconds".format(label, ncalls, avg_duration))
@@ -0,0 +1,38 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
+
+from ciri.core import Schema
+from ciri.spec import build_schema
+
+from timeit import default_timer as timer
+
+
+FORM = {
+    'name': 'Form',
+    'fields': dict([('question_{}'.format(i), {'type': 'string', 'required': i % 2 == 0}) for i in range(20)] +
+                   [('answer_{}'.format(i), {'type': 'integer'}) for i in range(10)] +
+                   [('attachments', {'type': 'list', 'of': {'type': 'schema', 'schema': {
+                       'name': 'Attachment',
+                       'fields': {'name': {'type': 'string'}, 'size': {'type': 'integer'}}}}})])
+}
+
+
+if __name__ == '__main__':
+    # run benchmark
+    print("Running")
+
+    ncalls = 2000
+
+    start = timer()
+    for _ in range(ncalls):
+        build_schema(FORM)
+    end = timer()
+    print("Average uncached schema build duration over {} calls: {} seconds".format(ncalls, (end-start) / ncalls))
+
+    start = timer()
+    for _ in range(ncalls):
+        Schema.from_spec(FORM)
+    end = timer()
+    print("Average cached from_spec duration over {} calls: {} seconds".format(ncalls, (end-start) / ncalls))
@@ -0,0 +1,174 @@
+"""
+Ciri complexity scaling checks
+
+Sweeps nesting depth, list length, field count and poly variant count, times
+``serialize``, ``validate`` and ``encode`` at each size, and fits the growth
+exponent on a log-log scale (time ~ size ** slope). An operation whose slope
+exceeds the threshold grows faster than its input and fails the run::
+
+    python perf/scaling.py
+    python perf/scaling.py --axis depth --threshold 1.5
+"""
+import argparse
+import math
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
+
+from ciri import fields
+from ciri.core import PolySchema, Schema
+
+from timeit import default_timer as timer
+
+
+OPERATIONS = ('serialize', 'validate', 'encode')
+
+
+# nesting depth
+
+class Node(Schema):
+    label = fields.String(required=True)
+    weight = fields.Integer()
+    child = fields.SelfReference()
+
+
+def depth_case(depth):
+    data = None
+    for level in range(depth):
+        node = {'label': 'level {}'.format(level), 'weight': level}
+        if data is not None:
+            node['child'] = data
+        data = node
+    return Node(), data
+
+
+# list length
+
+class Item(Schema):
+    name = fields.String(required=True)
+    count = fields.Integer()
+    tags = fields.List(fields.String())
+
+
+class Basket(Schema):
+    items = fields.List(fields.Schema(Item))
+
+
+def list_case(length):
+    items = [{'name': 'item {}'.format(idx), 'count': idx, 'tags': ['a', 'b']} for idx in range(length)]
+    return Basket(), {'items': items}
+
+
+# field count
+
+def fields_case(count):
+    attrs = dict(('field_{}'.format(idx), fields.Integer()) for idx in range(count))
+    schema = type('Wide{}'.format(count), (Schema,), attrs)
+    return schema(), dict(('field_{}'.format(idx), idx) for idx in range(count))
+
+
+# poly variant count, with the same number of items per variant
+
+def poly_case(variants, per_variant=10):
+    class Base(PolySchema):
+        kind = fields.String(required=True)
+        value = fields.Integer()
+        __poly_on__ = kind
+
+    for idx in range(variants):
+        type('Variant{}'.format(idx), (Base,), {
+            '__poly_id__': 'variant{}'.format(idx),
+            'extra': fields.String()
+        })
+
+    class Collection(Schema):
+        members = fields.List(fields.Schema(Base))
+
+    members = [{'kind': 'variant{}'.format(idx % variants), 'value': idx, 'extra': 'x'}
+               for idx in range(variants * per_variant)]
+    return Collection(), {'members': members}
+
+
+AXES = {
+    'depth': (depth_case, (4, 8, 16, 32, 64)),
+    'list': (list_case, (100, 200, 400, 800, 1600)),
+    'fields': (fields_case, (16, 32, 64, 128, 256)),
+    'poly': (poly_case, (2, 4, 8, 16, 32)),
+}
+
+
+def best_time(func, repeat=5, min_sample_time=0.01):
+    func()
+    number = 1
+    while True:
+        start = timer()
+        for _ in range(number):
+            func()
+        elapsed = timer() - start
+        if elapsed >= min_sample_time:
+            break
+        number *= 2
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = timer()
+        for _ in range(number):
+            func()
+        best = min(best, (timer() - start) / number)
+    return best
+
+
+def fit_slope(points):
+    """Least squares slope of log(time) against log(size)"""
+    xs = [math.log(size) for size, _ in points]
+    ys = [math.log(elapsed) for _, elapsed in points]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    num = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    den = sum((x - mean_x) ** 2 for x in xs)
+    return num / den
+
+
+def growth(points):
+    """Growth exponent of a sweep. Fixed per call overhead flattens the small
+    sizes, so the upper half of the sweep is fit separately and the steeper
+    of the two slopes is reported."""
+    tail = points[len(points) // 2:]
+    return max(fit_slope(points), fit_slope(tail))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Ciri complexity scaling checks')
+    parser.add_argument('--axis', action='append', choices=sorted(AXES), help='axis to sweep')
+    parser.add_argument('--op', action='append', choices=OPERATIONS, help='operation(s) to time')
+    parser.add_argument('--threshold', type=float, default=1.3,
+                        help='largest growth exponent accepted as linear (default 1.3)')
+    parser.add_argument('--repeat', type=int, default=5, help='timings per size, the best is kept')
+    args = parser.parse_args(argv)
+
+    failures = []
+    for axis in args.axis or sorted(AXES):
+        case, sizes = AXES[axis]
+        cases = [(size, case(size)) for size in sizes]
+        for op in args.op or OPERATIONS:
+            points = []
+            for size, (schema, data) in cases:
+                method = getattr(schema, op)
+                points.append((size, best_time(lambda: method(data), repeat=args.repeat)))
+            slope = growth(points)
+            status = 'ok'
+            if slope > args.threshold:
+                status = 'SUPERLINEAR'
+                failures.append('{}.{}'.format(axis, op))
+            timings = '  '.join('{}:{:.6f}s'.format(size, elapsed) for size, elapsed in points)
+            print('{:<18} slope {:>5.2f}  {:<11} {}'.format('{}.{}'.format(axis, op), slope, status, timings))
+
+    if failures:
+        print('\nSuperlinear growth (slope > {}): {}'.format(args.threshold, ', '.join(failures)))
+        return 1
+    print('\nAll operations scale linearly (slope <= {})'.format(args.threshold))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,308 @@
+"""
+Ciri benchmark suite
+
+Runs every operation (serialize, validate, deserialize, encode) against a set
+of schema shapes and data sizes, and stores percentile timings as JSON::
+
+    python perf/suite.py run --output results.json
+    python perf/suite.py compare baseline.json results.json --threshold 0.1
+
+``compare`` exits with a non-zero status when any benchmark got slower than
+the threshold allows.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
+
+from ciri import __version__, fields
+from ciri.core import PolySchema, Schema
+
+from timeit import default_timer as timer
+
+
+OPERATIONS = ('serialize', 'validate', 'deserialize', 'encode')
+
+SIZES = {'small': 10, 'large': 1000}
+
+
+# flat / wide: 40 scalar fields per record
+
+Wide = type('Wide', (Schema,), dict(
+    [('str_{}'.format(i), fields.String()) for i in range(10)] +
+    [('int_{}'.format(i), fields.Integer()) for i in range(10)] +
+    [('float_{}'.format(i), fields.Float()) for i in range(10)] +
+    [('bool_{}'.format(i), fields.Boolean()) for i in range(10)]
+))
+
+
+class WideList(Schema):
+    rows = fields.List(fields.Schema(Wide))
+
+
+def wide_record(idx):
+    record = {}
+    for i in range(10):
+        record['str_{}'.format(i)] = 'value {} {}'.format(idx, i)
+        record['int_{}'.format(i)] = idx * i
+        record['float_{}'.format(i)] = idx * i / 3.0
+        record['bool_{}'.format(i)] = bool(i % 2)
+    return record
+
+
+def flat_case(size):
+    return WideList(), {'rows': [wide_record(i) for i in range(size)]}
+
+
+# deep
+
+class Node(Schema):
+    label = fields.String(required=True)
+    weight = fields.Integer()
+    child = fields.SelfReference()
+
+
+def deep_case(size):
+    depth = max(2, min(size // 10, 60))
+    data = None
+    for level in range(depth):
+        node = {'label': 'level {}'.format(level), 'weight': level}
+        if data is not None:
+            node['child'] = data
+        data = node
+    return Node(), data
+
+
+# poly
+
+class Shape(PolySchema):
+    kind = fields.String(required=True)
+    name = fields.String()
+    __poly_on__ = kind
+
+
+class Circle(Shape):
+    __poly_id__ = 'circle'
+    radius = fields.Float(required=True)
+
+
+class Rectangle(Shape):
+    __poly_id__ = 'rectangle'
+    width = fields.Float(required=True)
+    height = fields.Float(required=True)
+
+
+class Polygon(Shape):
+    __poly_id__ = 'polygon'
+    sides = fields.Integer(required=True)
+    points = fields.List(fields.Float())
+
+
+class Drawing(Schema):
+    shapes = fields.List(fields.Schema(Shape))
+
+
+def poly_case(size):
+    shapes = []
+    for idx in range(size):
+        if idx % 3 == 0:
+            shapes.append({'kind': 'circle', 'name': 'c{}'.format(idx), 'radius': idx / 2.0})
+        elif idx % 3 == 1:
+            shapes.append({'kind': 'rectangle', 'name': 'r{}'.format(idx), 'width': 1.5, 'height': idx / 4.0})
+        else:
+            shapes.append({'kind': 'polygon', 'name': 'p{}'.format(idx), 'sides': 5,
+                           'points': [1.0, 2.0, 3.0, 4.0, 5.0]})
+    return Drawing(), {'shapes': shapes}
+
+
+# list heavy
+
+class Tagged(Schema):
+    name = fields.String(required=True)
+    tags = fields.List(fields.String())
+    scores = fields.List(fields.Integer())
+    ratios = fields.List(fields.Float())
+
+
+class TaggedList(Schema):
+    items = fields.List(fields.Schema(Tagged))
+
+
+def list_case(size):
+    items = [{'name': 'item {}'.format(idx),
+              'tags': ['tag{}'.format(t) for t in range(20)],
+              'scores': list(range(20)),
+              'ratios': [t / 7.0 for t in range(20)]} for idx in range(size)]
+    return TaggedList(), {'items': items}
+
+
+# date / uuid heavy
+
+class Event(Schema):
+    id = fields.UUID(required=True)
+    parent_id = fields.UUID()
+    day = fields.Date()
+    created = fields.DateTime()
+    updated = fields.DateTime()
+
+
+class EventLog(Schema):
+    events = fields.List(fields.Schema(Event))
+
+
+def dates_case(size):
+    now = datetime.datetime(2020, 5, 17, 12, 30, 15)
+    events = [{'id': str(uuid.UUID(int=idx + 1)),
+               'parent_id': str(uuid.UUID(int=idx + 10 ** 6)),
+               'day': '2020-05-17',
+               'created': now.isoformat(),
+               'updated': (now + datetime.timedelta(seconds=idx)).isoformat()} for idx in range(size)]
+    return EventLog(), {'events': events}
+
+
+SHAPES = {
+    'flat': flat_case,
+    'deep': deep_case,
+    'poly': poly_case,
+    'list': list_case,
+    'dates': dates_case,
+}
+
+
+def operation(schema, op, data):
+    if op == 'deserialize':
+        # deserialize works from the validated output, like loading stored data
+        data = schema.validate(data)
+    method = getattr(schema, op)
+    return lambda: method(data)
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[idx]
+
+
+def measure(func, repeat, min_sample_time):
+    func()  # warm up caches and pending schemas
+    number = 1
+    while True:
+        start = timer()
+        for _ in range(number):
+            func()
+        elapsed = timer() - start
+        if elapsed >= min_sample_time or number >= 10 ** 6:
+            break
+        number *= 2
+    samples = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = timer()
+        for _ in range(number):
+            func()
+        samples.append((timer() - start) / number)
+    return {
+        'min': min(samples),
+        'mean': sum(samples) / len(samples),
+        'p50': percentile(samples, 50),
+        'p90': percentile(samples, 90),
+        'p99': percentile(samples, 99),
+        'max': max(samples),
+        'samples': len(samples),
+        'number': number
+    }
+
+
+def run(args):
+    shapes = args.shape or sorted(SHAPES)
+    sizes = args.size or sorted(SIZES)
+    ops = args.op or list(OPERATIONS)
+    results = {}
+    for shape in shapes:
+        for size in sizes:
+            schema, data = SHAPES[shape](SIZES[size])
+            for op in ops:
+                name = '{}.{}.{}'.format(shape, size, op)
+                results[name] = stats = measure(operation(schema, op, data), args.repeat, args.min_time)
+                print('{:<28} p50 {:>12.9f}s  p90 {:>12.9f}s  p99 {:>12.9f}s'.format(
+                    name, stats['p50'], stats['p90'], stats['p99']))
+    output = {
+        'meta': {
+            'ciri': __version__,
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'timestamp': datetime.datetime.utcnow().isoformat()
+        },
+        'results': results
+    }
+    if args.output:
+        with open(args.output, 'w') as fp:
+            json.dump(output, fp, indent=2, sort_keys=True)
+        print('Results written to {}'.format(args.output))
+    return 0
+
+
+def compare(args):
+    with open(args.baseline) as fp:
+        baseline = json.load(fp)['results']
+    with open(args.current) as fp:
+        current = json.load(fp)['results']
+
+    regressions = []
+    for name in sorted(set(baseline) & set(current)):
+        before = baseline[name][args.stat]
+        after = current[name][args.stat]
+        change = (after - before) / before if before else 0.0
+        flag = ''
+        if change > args.threshold:
+            flag = 'REGRESSION'
+            regressions.append(name)
+        elif change < -args.threshold:
+            flag = 'improved'
+        print('{:<28} {:>12.9f}s -> {:>12.9f}s  {:>+8.1%}  {}'.format(name, before, after, change, flag))
+
+    for name in sorted(set(baseline) ^ set(current)):
+        print('{:<28} only in {}'.format(name, 'baseline' if name in baseline else 'current'))
+
+    if regressions:
+        print('\n{} benchmark(s) regressed more than {:.0%}: {}'.format(
+            len(regressions), args.threshold, ', '.join(regressions)))
+        return 1
+    print('\nNo regressions above {:.0%}'.format(args.threshold))
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Ciri benchmark suite')
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    run_parser = commands.add_parser('run', help='run the benchmarks')
+    run_parser.add_argument('--shape', action='append', choices=sorted(SHAPES), help='schema shape(s) to run')
+    run_parser.add_argument('--size', action='append', choices=sorted(SIZES), help='data size(s) to run')
+    run_parser.add_argument('--op', action='append', choices=OPERATIONS, help='operation(s) to run')
+    run_parser.add_argument('--repeat', type=int, default=15, help='samples per benchmark')
+    run_parser.add_argument('--min-time', type=float, default=0.005, help='minimum seconds per sample')
+    run_parser.add_argument('--output', '-o', help='write JSON results to this file')
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser('compare', help='compare two result files')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=0.1,
+                                help='relative slowdown flagged as a regression (default 0.1)')
+    compare_parser.add_argument('--stat', default='p50', choices=('min', 'mean', 'p50', 'p90', 'p99'),
+                                help='statistic to compare (default p50)')
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -36,13 +36,15 @@ setup(
     packages=find_packages(exclude=('test*', 'docs')),
     package_dir={'ciri': 'ciri'},
     include_package_data=True,
-    python_requires='>=3.4',
+    python_requires='>=3.5',
+    extras_require={
+        'numpy': ['numpy']
+    },
     license='MIT',
     classifiers=[
         'Development Status :: 3 - Alpha',
         'License :: OSI Approved :: MIT License',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.4',
         'Programming Language :: Python :: 3.5',
         'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
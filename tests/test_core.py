@@ -827,3 +827,27 @@ def test_schema_parent_schema_element_has_load():
     obj = schema.deserialize({'sub': {'name': 'TheFalcon'}})
     assert obj == Parent(sub_=S(name='TheFalcon'))
     assert obj.serialize() == {'sub': {'name': 'TheFalcon'}}
+
+
+def test_schema_nested_serialize_validates_once():
+    calls = []
+
+    class CountedInteger(fields.Integer):
+        def validate(self, value):
+            calls.append(value)
+            return super(CountedInteger, self).validate(value)
+
+    class Node(Schema):
+        weight = CountedInteger()
+        child = fields.SelfReference()
+
+    data = {'weight': 1, 'child': {'weight': 2, 'child': {'weight': 3}}}
+    assert Node().serialize(data) == data
+    assert sorted(calls) == [1, 2, 3]
+
+
+def test_schema_serialize_skip_validation_renamed_field():
+    class S(Schema):
+        name_ = fields.String(name='name')
+
+    assert S().serialize({'name_': 'TheFalcon'}, skip_validation=True) == {'name': 'TheFalcon'}
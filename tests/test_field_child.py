@@ -0,0 +1,105 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
+
+from collections import namedtuple
+
+from ciri import fields
+from ciri.abstract import SchemaFieldMissing
+from ciri.core import Schema
+
+
+class Slotted(object):
+    __slots__ = ['title', 'c']
+
+    def __init__(self, **kwargs):
+        for k, v in kwargs.items():
+            setattr(self, k, v)
+
+
+class Counted(object):
+
+    def __init__(self, c):
+        self.calls = 0
+        self._c = c
+
+    @property
+    def c(self):
+        self.calls += 1
+        return self._c
+
+
+def test_child_path_with_slots():
+    class S(Schema):
+        name = fields.Child(fields.String(name='title'), path='c', load='a')
+    data = {'name': Slotted(c=Slotted(title='Hello World'))}
+    assert S().serialize(data) == {'name': 'Hello World'}
+
+
+def test_child_path_with_namedtuple():
+    Node = namedtuple('Node', ['b', 'title'])
+
+    class S(Schema):
+        name = fields.Child(fields.String(name='title'), path='b', load='a')
+    data = {'name': Node(b=Node(b=None, title='Hello World'), title=None)}
+    assert S().serialize(data) == {'name': 'Hello World'}
+
+
+def test_child_path_with_property():
+    class S(Schema):
+        name = fields.Child(fields.String(name='title'), path='c', load='a')
+    data = {'name': Counted({'title': 'Hello World'})}
+    assert S().serialize(data) == {'name': 'Hello World'}
+
+
+def test_child_missing_path():
+    class S(Schema):
+        name = fields.Child(fields.String(name='title', allow_none=True), path='b.c', load='a')
+    schema = S()
+    assert schema.deserialize({'a': {'b': 'c'}}).name is None
+    assert schema.deserialize({'a': {}}).name is None
+
+
+def test_child_shared_prefix_resolved_once():
+    class S(Schema):
+        first = fields.Child(fields.String(name='first'), path='c', load='nest')
+        last = fields.Child(fields.String(name='last'), path='c', load='nest')
+    assert S._fields['first'].resolver is S._fields['last'].resolver
+
+    nest = Counted({'first': 'Jon', 'last': 'Snow'})
+    obj = S().deserialize({'nest': nest}, skip_validation=True)
+    assert (obj.first, obj.last) == ('Jon', 'Snow')
+    assert nest.calls == 1
+
+
+def test_child_prefix_not_stale_after_mutation():
+    class S(Schema):
+        first = fields.Child(fields.String(name='first'), path='c', load='nest')
+    nest = {'c': {'first': 'Jon'}}
+    schema = S()
+    assert schema.deserialize({'nest': nest}).first == 'Jon'
+    nest['c'] = {'first': 'Arya'}
+    assert schema.deserialize({'nest': nest}).first == 'Arya'
+
+
+def test_child_common_prefix_resolved_once():
+    class S(Schema):
+        first = fields.Child(fields.String(name='first'), path='c.name', load='nest')
+        house = fields.Child(fields.String(name='title'), path='c.house', load='nest')
+    assert S._fields['first'].resolver.parent is S._fields['house'].resolver.parent
+
+    nest = Counted({'name': {'first': 'Jon'}, 'house': {'title': 'Stark'}})
+    obj = S().deserialize({'nest': nest}, skip_validation=True)
+    assert (obj.first, obj.house) == ('Jon', 'Stark')
+    assert nest.calls == 1
+
+
+def test_child_resolver_releases_input():
+    class S(Schema):
+        first = fields.Child(fields.String(name='first'), path='c.name', load='nest')
+    nest = {'c': {'name': {'first': 'Jon'}}}
+    S().serialize({'nest': nest})
+    resolver = S._fields['first'].resolver
+    assert resolver._source is SchemaFieldMissing
+    assert resolver.parent._source is SchemaFieldMissing
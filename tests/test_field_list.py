@@ -3,9 +3,9 @@ import sys
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
 
-from ciri.fields import List, String, Integer, Float, Schema as SubSchema
+from ciri.fields import Boolean, List, String, Integer, Float, Schema as SubSchema
 from ciri.core import Schema
-from ciri.exception import ValidationError
+from ciri.exception import FieldValidationError, ValidationError
 
 import pytest
 
@@ -55,3 +55,114 @@ def test_deserializations(item_type, value, expected):
         foo = List(of=item_type)
     schema = S()
     assert schema.deserialize({'foo': [value]}) == S(foo=[expected])
+
+
+@pytest.mark.parametrize("item_type, value", [
+    [String(), ['a', 'b', 'c']],
+    [Integer(), [1, 2, 3]],
+    [Float(), [1.5, 2.5]],
+    [Boolean(), [True, False]],
+])
+def test_homogeneous_lists(item_type, value):
+    class S(Schema):
+        foo = List(of=item_type)
+    schema = S()
+    output = schema.serialize({'foo': value})
+    assert output == {'foo': value}
+    assert output['foo'] is not value
+    assert schema.validate({'foo': value})['foo'] is not value
+    assert schema.deserialize({'foo': value}).foo == value
+
+
+def test_homogeneous_string_list_trims():
+    class S(Schema):
+        foo = List(String())
+        bar = List(String(trim=False))
+    assert S().validate({'foo': [' a ', 'b '], 'bar': [' a ']}) == {'foo': ['a', 'b'], 'bar': [' a ']}
+
+
+def test_mixed_list_reports_item_errors():
+    class S(Schema):
+        foo = List(Integer())
+        bar = List(String(allow_empty=False))
+    schema = S()
+    with pytest.raises(ValidationError):
+        schema.validate({'foo': [1, 2, 'x', 4.0], 'bar': ['a', ' ']})
+    assert list(schema._raw_errors['foo'].errors) == ['2']
+    assert list(schema._raw_errors['bar'].errors) == ['1']
+    assert S().validate({'foo': [1, 2.0]}) == {'foo': [1, 2.0]}
+
+
+def test_float_list_accepts_integers():
+    class S(Schema):
+        foo = List(Float())
+    assert S().validate({'foo': [1.5, 2]}) == {'foo': [1.5, 2]}
+
+
+def test_subclass_overriding_validate_skips_fast_path():
+    class Upper(String):
+        def validate(self, value):
+            return String.validate(self, value).upper()
+
+    class S(Schema):
+        foo = List(Upper())
+    assert Upper._scan_type is None
+    assert S().validate({'foo': ['a', 'b']}) == {'foo': ['A', 'B']}
+
+
+def test_serialize_iterables():
+    class S(Schema):
+        foo = List(Integer())
+    assert S().serialize({'foo': (1, 2)}, skip_validation=True) == {'foo': [1, 2]}
+    assert S().serialize({'foo': (x for x in (1, 2))}, skip_validation=True) == {'foo': [1, 2]}
+
+
+def test_stream_validate_accepts_iterables():
+    class S(Schema):
+        foo = List(Integer(), stream=True)
+    schema = S()
+    output = schema.validate({'foo': (x for x in range(3))})
+    assert not isinstance(output['foo'], list)
+    assert list(output['foo']) == [0, 1, 2]
+    assert list(schema.validate({'foo': range(2)})['foo']) == [0, 1]
+
+
+@pytest.mark.parametrize("value", [1, '12', b'12', {'a': 1}])
+def test_stream_rejects_non_iterables(value):
+    class S(Schema):
+        foo = List(Integer(), stream=True)
+    schema = S()
+    with pytest.raises(ValidationError):
+        schema.validate({'foo': value})
+    assert schema._raw_errors['foo'].message == List().message.invalid
+
+
+def test_stream_errors_raise_when_consumed():
+    class S(Schema):
+        foo = List(Integer(), stream=True)
+    consumed = []
+
+    def rows():
+        for value in (1, 'x', 3):
+            consumed.append(value)
+            yield value
+
+    output = S().serialize({'foo': rows()})
+    assert consumed == []
+    items = iter(output['foo'])
+    assert next(items) == 1
+    with pytest.raises(FieldValidationError) as exc:
+        next(items)
+    assert exc.value.error.message == List().message.invalid_item
+    assert list(exc.value.error.errors) == ['1']
+    assert consumed == [1, 'x']
+
+
+def test_stream_nested_schemas():
+    class S(Schema):
+        foo = List(SubSchema(FooSchema), stream=True)
+    schema = S()
+    output = schema.serialize({'foo': iter([{'hello': 'a'}, {'hello': 'b'}])})
+    assert list(output['foo']) == [{'hello': 'a'}, {'hello': 'b'}]
+    deserialized = schema.deserialize({'foo': [{'hello': 'a'}]})
+    assert [item.hello for item in deserialized.foo] == ['a']
@@ -0,0 +1,135 @@
+import json
+import os
+import sys
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
+
+import pytest
+
+from ciri import fields
+from ciri.core import Schema
+from ciri.exception import ValidationError
+
+
+class Readings(Schema):
+
+    ints = fields.List(fields.Integer())
+    floats = fields.List(fields.Float())
+    strict = fields.List(fields.Float(strict=True))
+    values = fields.NumericArray(min=0, max=100)
+
+
+def test_list_accepts_arrays_without_copying():
+    ints = array('q', range(10))
+    floats = array('d', [0.5, 1.5])
+    output = Readings().validate({'ints': ints, 'floats': floats, 'strict': floats})
+    assert output['ints'] is ints
+    assert output['floats'] is floats
+    assert output['strict'] is floats
+    assert Readings().serialize({'ints': ints})['ints'] is ints
+
+
+def test_list_accepts_buffers():
+    view = memoryview(array('i', [1, 2, 3]))
+    assert Readings().validate({'ints': view})['ints'] is view
+
+
+def test_integer_list_accepts_whole_floats():
+    value = array('d', [1.0, 2.0])
+    assert Readings().validate({'ints': value})['ints'] is value
+
+
+def test_integer_list_reports_invalid_items():
+    schema = Readings()
+    with pytest.raises(ValidationError):
+        schema.validate({'ints': array('d', [1.0, 2.5, 3.0])})
+    assert schema.errors['ints']['errors'] == {'1': {'msg': 'Field is not a valid Integer'}}
+
+
+def test_strict_float_list_rejects_integer_arrays():
+    schema = Readings()
+    with pytest.raises(ValidationError):
+        schema.validate({'strict': array('q', [1, 2])})
+    assert sorted(schema.errors['strict']['errors']) == ['0', '1']
+
+
+def test_list_deserializes_arrays():
+    ints = array('q', [1, 2])
+    output = Readings().deserialize({'ints': ints, 'floats': ints})
+    assert output.ints is ints
+    assert output.floats == [1.0, 2.0]
+
+
+def test_bytes_are_not_arrays():
+    schema = Readings()
+    with pytest.raises(ValidationError):
+        schema.validate({'ints': b'\x01\x02'})
+
+
+@pytest.mark.parametrize("value", [
+    array('d', [0.0, 50.5, 100.0]),
+    array('q', [1, 2]),
+    memoryview(array('f', [1.0])),
+])
+def test_numeric_array(value):
+    assert Readings().validate({'values': value})['values'] is not None
+
+
+@pytest.mark.parametrize("value, message", [
+    ['12', 'invalid'],
+    [['a', 1], 'invalid'],
+    [array('d', [-1.0, 2.0]), 'out_of_range'],
+    [array('q', [1, 101]), 'out_of_range'],
+])
+def test_invalid_numeric_array(value, message):
+    schema = Readings()
+    with pytest.raises(ValidationError):
+        schema.validate({'values': value})
+    assert schema._raw_errors['values'].message_key == message
+
+
+def test_numeric_array_dtype_and_shape():
+    class S(Schema):
+        ints = fields.NumericArray(dtype='int')
+        floats = fields.NumericArray(dtype='float', shape=(None,))
+        grid = fields.NumericArray(shape=(2, 2))
+
+    grid = memoryview(array('d', [1.0, 2.0, 3.0, 4.0])).cast('B').cast('d', [2, 2])
+    assert S().validate({'ints': [1, 2], 'floats': [1.5], 'grid': grid})
+    schema = S()
+    with pytest.raises(ValidationError):
+        schema.validate({'ints': [1.5], 'floats': memoryview(array('d', [1.0])).cast('B').cast('d', [1, 1]),
+                         'grid': [1.0, 2.0]})
+    assert dict((k, e.message_key) for k, e in schema._raw_errors.items()) == {
+        'ints': 'invalid_dtype', 'floats': 'invalid_shape', 'grid': 'invalid_shape'}
+
+
+def test_numeric_array_encode():
+    class S(Schema):
+        values = fields.NumericArray()
+        items = fields.List(fields.Float())
+
+    data = {'values': array('d', [1.5]), 'items': memoryview(array('d', [2.5]))}
+    assert json.loads(S().encode(data)) == {'values': [1.5], 'items': [2.5]}
+    assert json.loads(''.join(S().iterencode(data))) == {'values': [1.5], 'items': [2.5]}
+
+
+def test_numpy_arrays():
+    np = pytest.importorskip('numpy')
+
+    class S(Schema):
+        ints = fields.List(fields.Integer())
+        values = fields.NumericArray(dtype='float32', shape=(None, 3), min=0)
+
+    ints = np.arange(5)
+    values = np.ones((4, 3), dtype='float32')
+    output = S().validate({'ints': ints, 'values': values})
+    assert output['ints'] is ints
+    assert np.shares_memory(output['values'], values)
+    assert S().encode({'ints': ints}) == '{"ints": [0, 1, 2, 3, 4]}'
+
+    schema = S()
+    with pytest.raises(ValidationError):
+        schema.validate({'values': np.ones((4, 3))})
+    assert schema._raw_errors['values'].message_key == 'invalid_dtype'
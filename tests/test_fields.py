@@ -0,0 +1,59 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
+
+from ciri import fields
+from ciri.core import Schema
+from ciri.exception import ValidationError
+
+import pytest
+
+
+class Node(Schema):
+    name = fields.String()
+
+
+@pytest.mark.parametrize("field", [
+    fields.String(), fields.Integer(), fields.Float(), fields.Boolean(), fields.Dict(),
+    fields.Date(), fields.DateTime(), fields.UUID(), fields.List(fields.String()),
+    fields.Schema(Node), fields.SelfReference(), fields.Child(fields.String(), path='a'),
+    fields.Any([fields.String()]), fields.Anything()
+])
+def test_fields_have_no_dict(field):
+    assert not hasattr(field, '__dict__')
+
+
+def test_message_table_shared():
+    assert fields.String().message is fields.String().message is fields.String.messages
+
+
+def test_message_override():
+    class S(Schema):
+        name = fields.String(messages={'invalid': 'Name must be text'})
+
+    schema = S()
+    with pytest.raises(ValidationError):
+        schema.validate({'name': 3})
+    assert schema.errors == {'name': {'msg': 'Name must be text'}}
+    assert fields.String().message.invalid == 'Field is not a valid String'
+
+
+def test_subclass_inherits_messages():
+    class Name(fields.String):
+        messages = {'short': 'Name is too short'}
+
+    assert Name().message.empty == fields.String().message.empty
+    assert Name().message.short == 'Name is too short'
+
+
+def test_subclass_initializers_run_in_order():
+    class Name(fields.String):
+        __slots__ = ['min_length']
+
+        def new(self, *args, **kwargs):
+            self.min_length = 0 if self.allow_empty else 1
+
+    assert Name().min_length == 0
+    assert Name(allow_empty=False).min_length == 1
+    assert not hasattr(Name(), '__dict__')
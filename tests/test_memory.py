@@ -0,0 +1,54 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
+
+from ciri import fields
+from ciri.core import Schema
+from ciri.memory import deep_sizeof, field_sizeof, instance_sizeof, memory_report, schema_sizeof
+
+
+class Track(Schema):
+    title = fields.String(required=True)
+    length = fields.Integer()
+
+
+class Album(Schema):
+    name = fields.String()
+    tracks = fields.List(fields.Schema(Track))
+
+
+def test_deep_sizeof_counts_shared_objects_once():
+    shared = ['x' * 1000]
+    outer = [shared, shared]
+    assert deep_sizeof(outer) == sys.getsizeof(outer) + deep_sizeof(shared)
+
+
+def test_deep_sizeof_skips_classes_and_functions():
+    assert deep_sizeof([Track, test_deep_sizeof_skips_classes_and_functions]) == sys.getsizeof([None, None])
+
+
+def test_field_sizeof_excludes_bound_schema():
+    field = Track._fields['title']
+    before = field_sizeof(field)
+    Track().deserialize({'title': 'x' * 10000})
+    assert field_sizeof(field) == before
+
+
+def test_instance_sizeof_grows_with_values():
+    empty = Album()
+    full = Album().deserialize({'name': 'x' * 1000, 'tracks': [{'title': 'y' * 1000}]})
+    assert instance_sizeof(full) > instance_sizeof(empty) + 2000
+
+
+def test_schema_sizeof():
+    report = schema_sizeof(Album)
+    assert set(report) == {'class', 'fields', 'metadata', 'total'}
+    assert report['total'] == report['class'] + report['fields'] + report['metadata']
+    assert schema_sizeof(Album()) == report
+
+
+def test_memory_report():
+    report = memory_report(Track, Album())
+    assert 'instance' not in report['Track']
+    assert report['Album']['instance'] > 0
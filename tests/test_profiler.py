@@ -0,0 +1,108 @@
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
+
+from ciri import fields
+from ciri.core import Schema, SchemaOptions
+from ciri.exception import FieldError, FieldValidationError, ValidationError
+from ciri.profiler import Profiler, active_profiler
+
+import pytest
+
+
+class Pet(Schema):
+    name = fields.String(required=True)
+
+
+def shout(value, **kwargs):
+    return value.upper()
+
+
+class Person(Schema):
+    name = fields.String(required=True, post_serialize=[shout])
+    age = fields.Integer()
+    pets = fields.List(fields.Schema(Pet))
+
+    class Meta:
+        pre_validate = ['noop']
+
+    def noop(self, data, **kwargs):
+        return data
+
+
+DATA = {'name': 'Harry', 'age': 17, 'pets': [{'name': 'Hedwig'}, {'name': 'Fang'}]}
+
+
+def test_profiler_context_manager():
+    with Profiler() as profiler:
+        assert active_profiler() is profiler
+        Person().serialize(DATA)
+    assert active_profiler() is None
+
+    stats = profiler.to_dict()
+    assert stats['schemas']['Person']['serialize']['calls'] == 1
+    assert stats['schemas']['Pet']['serialize']['calls'] == 2
+    assert stats['fields']['Person.name']['validate']['calls'] == 1
+    assert stats['fields']['Person.name']['serialize']['calls'] == 1
+    assert stats['fields']['Pet.name']['serialize']['calls'] == 2
+    assert stats['callables']['Person.name']['post_serialize']['calls'] == 1
+    field_stats = stats['fields']['Person.pets']['serialize']
+    assert field_stats['total'] >= field_stats['max'] > 0
+
+
+def test_profiler_schema_option():
+    profiler = Profiler()
+
+    class S(Schema):
+        __schema_options__ = SchemaOptions(profiler=profiler)
+        name = fields.String()
+
+    S().deserialize({'name': 'Harry'})
+    assert profiler.to_dict()['schemas']['S']['deserialize']['calls'] == 1
+    assert profiler.to_dict()['fields']['S.name']['deserialize']['calls'] == 1
+
+
+def test_profiler_records_errors():
+    with Profiler() as profiler:
+        with pytest.raises(ValidationError):
+            Person().validate({'name': 1})
+    stats = profiler.to_dict()
+    assert stats['schemas']['Person']['validate']['errors'] == 1
+    assert stats['fields']['Person.name']['validate']['errors'] == 1
+    assert stats['callables']['Person']['pre_validate']['calls'] == 1
+
+
+def test_profiler_disabled():
+    schema = Person()
+    schema.serialize(DATA)
+    assert schema._profiler is None
+    assert '_field_callables' not in vars(schema)
+
+
+def test_profiler_reset():
+    with Profiler() as profiler:
+        Person().serialize(DATA)
+    profiler.reset()
+    assert profiler.to_dict() == {'schemas': {}, 'fields': {}, 'callables': {}}
+
+
+def test_profiler_times_coroutine_callables():
+    async def slow(value, **kwargs):
+        await asyncio.sleep(0.05)
+        if value == 'bad':
+            raise FieldValidationError(FieldError(Pet._fields['name'], 'invalid'))
+        return value
+
+    class S(Schema):
+        name = fields.String(post_validate=[slow])
+
+    with Profiler() as profiler:
+        assert asyncio.run(S().avalidate({'name': 'Harry'})) == {'name': 'Harry'}
+        with pytest.raises(ValidationError):
+            asyncio.run(S().avalidate({'name': 'bad'}))
+    stats = profiler.to_dict()['callables']['S.name']['post_validate']
+    assert stats['calls'] == 2
+    assert stats['errors'] == 1
+    assert stats['max'] >= 0.05
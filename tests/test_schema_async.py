@@ -0,0 +1,413 @@
+import asyncio
+import json
+import os
+import sys
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
+
+import pytest
+
+from ciri import fields
+from ciri.core import PolySchema, Schema, SchemaOptions
+from ciri.exception import FieldError, FieldValidationError, SchemaException, ValidationError
+from ciri.profiler import Profiler
+
+
+class Item(Schema):
+
+    name = fields.String(required=True)
+    count = fields.Integer()
+
+
+class Order(Schema):
+
+    class Meta:
+        options = SchemaOptions(async_chunk_size=100, async_offload_size=None)
+
+    id = fields.Integer(required=True)
+    items = fields.List(fields.Schema(Item))
+    tags = fields.List(fields.String(), name='labels')
+
+
+class CountingExecutor(ThreadPoolExecutor):
+
+    def __init__(self):
+        super(CountingExecutor, self).__init__(max_workers=1)
+        self.calls = 0
+
+    def submit(self, *args, **kwargs):
+        self.calls += 1
+        return super(CountingExecutor, self).submit(*args, **kwargs)
+
+
+def make_order(size):
+    return {'id': 1, 'items': [{'name': 'item{}'.format(i), 'count': i} for i in range(size)],
+            'tags': ['t{}'.format(i) for i in range(size)]}
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+async def count_ticks(coro):
+    # counts how often the loop gets to run another task while `coro` runs
+    ticks = 0
+    task = asyncio.ensure_future(coro)
+    while not task.done():
+        ticks += 1
+        await asyncio.sleep(0)
+    return task.result(), ticks
+
+
+@pytest.mark.parametrize("size", [3, 250])
+def test_async_matches_sync(size):
+    data = make_order(size)
+    assert run(Order().avalidate(data)) == Order().validate(data)
+    assert run(Order().aserialize(data)) == Order().serialize(data)
+    assert run(Order().adeserialize(data)).serialize() == Order().deserialize(data).serialize()
+    assert json.loads(run(Order().aencode(data))) == json.loads(Order().encode(data))
+
+
+def test_async_yields_between_chunks():
+    output, ticks = run(count_ticks(Order().aserialize(make_order(1000))))
+    assert len(output['items']) == 1000
+    assert output['labels'][-1] == 't999'
+    assert ticks >= 20
+
+
+def test_async_errors_across_chunks():
+    data = make_order(300)
+    data['items'][5] = {'count': 1}
+    data['items'][250]['count'] = 'x'
+    schema = Order()
+    with pytest.raises(ValidationError):
+        run(schema.avalidate(data))
+    sync_schema = Order()
+    with pytest.raises(ValidationError):
+        sync_schema.validate(data)
+    assert schema.errors == sync_schema.errors
+    assert sorted(schema.errors['items']['errors']) == ['250', '5']
+
+
+def test_async_halt_on_error():
+    data = make_order(300)
+    data['id'] = 'x'
+    data['items'][5] = {}
+    data['items'][250] = {}
+    schema = Order()
+    with pytest.raises(ValidationError):
+        run(schema.avalidate(data, halt_on_error=True))
+    assert len(schema.errors) == 1
+
+
+def test_async_with_field_callables():
+    def reverse(value, schema, field):
+        return value[::-1]
+
+    class S(Order):
+        tags = fields.List(fields.String(), name='labels', post_serialize=[reverse])
+
+    data = make_order(250)
+    assert run(S().aserialize(data)) == S().serialize(data)
+
+
+def test_async_profiled_runs_are_not_chunked():
+    data = make_order(250)
+    with Profiler() as profiler:
+        assert run(count_ticks(Order().aserialize(data))) == (Order().serialize(data), 1)
+    assert profiler.to_dict()['fields']['Order.items']['serialize']['calls'] == 2
+
+    class S(Order):
+        class Meta:
+            options = SchemaOptions(async_chunk_size=100, async_offload_size=None, profiler=Profiler())
+
+    assert run(count_ticks(S().aserialize(data)))[1] == 1
+
+
+def test_async_offloads_large_inputs():
+    executor = CountingExecutor()
+
+    class S(Order):
+        class Meta:
+            options = SchemaOptions(async_offload_size=200, async_executor=executor)
+
+    assert run(S().aserialize(make_order(50))) == S().serialize(make_order(50))
+    assert executor.calls == 0
+    assert run(S().aserialize(make_order(150))) == S().serialize(make_order(150))
+    assert executor.calls == 1
+    executor.shutdown()
+
+
+def test_async_does_not_offload_by_default():
+    executor = CountingExecutor()
+
+    class S(Schema):
+        class Meta:
+            options = SchemaOptions(async_executor=executor)
+
+        tags = fields.List(fields.String())
+
+    data = {'tags': ['t'] * 50000}
+    assert run(S().aserialize(data)) == data
+    assert executor.calls == 0
+    executor.shutdown()
+
+
+def test_async_offloads_to_processes():
+    # the worker process creates its own `Order`
+    executor = ProcessPoolExecutor(max_workers=1)
+    options = {'options': SchemaOptions(async_offload_size=1, async_executor=executor)}
+    data = make_order(10)
+    schema = Order()
+    schema.config(options)
+    assert run(schema.aserialize(data)) == Order().serialize(data)
+    data['items'][3] = {}
+    with pytest.raises(ValidationError):
+        run(schema.avalidate(data))
+    assert schema.errors == {'items': {'msg': 'Invalid Item(s)', 'errors': {
+        '3': {'msg': 'Invalid Schema', 'errors': {'name': {'msg': 'Required Field'}}}}}}
+    error = schema._raw_errors['items']
+    assert error.field is Order._fields['items']
+    assert error.errors['3'].field is Order._fields['items'].field
+    assert error.errors['3'].errors['name'].field is Item._fields['name']
+    assert error.errors['3'].errors['name'].message_key == 'required'
+    executor.shutdown()
+
+
+def test_async_poly_schema():
+    class Shape(PolySchema):
+        class Meta:
+            options = SchemaOptions(async_chunk_size=10)
+
+        kind = fields.String(required=True)
+        __poly_on__ = kind
+
+    class Path(Shape):
+        __poly_id__ = 'path'
+        points = fields.List(fields.Integer())
+
+    data = {'kind': 'path', 'points': list(range(50))}
+    assert run(Shape().aserialize(data)) == data
+    schema = Shape()
+    with pytest.raises(ValidationError):
+        run(schema.avalidate({'kind': 'path', 'points': [1, 'x']}))
+    assert list(schema.errors) == ['points']
+
+
+class Registry(object):
+    """Stands in for a database, tracks the checks running at the same time"""
+
+    def __init__(self, taken=()):
+        self.taken = set(taken)
+        self.running = 0
+        self.most_running = 0
+
+    async def check(self, value, schema=None, field=None):
+        self.running += 1
+        self.most_running = max(self.most_running, self.running)
+        await asyncio.sleep(0.001)
+        self.running -= 1
+        if value in self.taken:
+            raise FieldValidationError(FieldError(field, 'invalid'))
+        return value
+
+
+def user_schemas(registry, **settings):
+    class User(Schema):
+        name = fields.String(required=True, post_validate=[registry.check])
+        email = fields.String()
+
+    class Group(Schema):
+        class Meta:
+            options = SchemaOptions(**settings)
+
+        owner = fields.String(post_validate=[registry.check])
+        users = fields.List(fields.Schema(User))
+
+    return User, Group
+
+
+def group(size):
+    return {'owner': 'root', 'users': [{'name': 'user{}'.format(i)} for i in range(size)]}
+
+
+def test_async_validators_run_concurrently():
+    registry = Registry()
+    User, Group = user_schemas(registry, async_concurrency=5)
+    assert run(Group().avalidate(group(20))) == group(20)
+    assert registry.most_running == 5
+
+
+def test_async_validator_errors_are_nested():
+    registry = Registry(taken=['root', 'user3', 'user7'])
+    User, Group = user_schemas(registry)
+    data = group(10)
+    data['users'][5] = {}
+    schema = Group()
+    with pytest.raises(ValidationError):
+        run(schema.avalidate(data))
+    invalid = {'msg': 'Field is not a valid String'}
+    assert schema.errors == {
+        'owner': invalid,
+        'users': {'msg': 'Invalid Item(s)', 'errors': {
+            '3': {'msg': 'Invalid Schema', 'errors': {'name': invalid}},
+            '5': {'msg': 'Invalid Schema', 'errors': {'name': {'msg': 'Required Field'}}},
+            '7': {'msg': 'Invalid Schema', 'errors': {'name': invalid}}}}}
+
+
+def test_async_validators_in_chunked_lists():
+    registry = Registry(taken=['user150'])
+    User, Group = user_schemas(registry, async_chunk_size=100, async_offload_size=None)
+    schema = Group()
+    with pytest.raises(ValidationError):
+        run(schema.aserialize(group(250)))
+    assert list(schema.errors['users']['errors']) == ['150']
+
+
+def test_async_validators_in_executor():
+    registry = Registry(taken=['user1'])
+    executor = ThreadPoolExecutor(max_workers=1)
+    User, Group = user_schemas(registry, async_offload_size=1, async_executor=executor)
+    schema = Group()
+    with pytest.raises(ValidationError):
+        run(schema.avalidate(group(3)))
+    assert list(schema.errors['users']['errors']) == ['1']
+    executor.shutdown()
+
+
+def test_async_validator_chain():
+    async def lower(value, **kwargs):
+        return value.lower()
+
+    def strip_dots(value, **kwargs):
+        return value.replace('.', '')
+
+    class S(Schema):
+        email = fields.String(post_validate=[strip_dots, lower, strip_dots])
+
+    assert run(S().avalidate({'email': 'A.B@EXAMPLE.COM'})) == {'email': 'ab@examplecom'}
+    assert run(S().aserialize({'email': 'A.B'})) == {'email': 'ab'}
+
+
+def validated_posts(validator):
+    class Tag(Schema):
+        label = fields.String(post_validate=[validator], name='Label')
+
+    class Post(Schema):
+        class Meta:
+            options = SchemaOptions(async_chunk_size=2)
+
+        title = fields.String(post_validate=[validator], load='t')
+        tags = fields.List(fields.Schema(Tag))
+
+    return Post
+
+
+@pytest.mark.parametrize("size", [1, 5])
+def test_async_validator_values_are_serialized(size):
+    async def upper(value, **kwargs):
+        return value.upper()
+
+    def sync_upper(value, **kwargs):
+        return value.upper()
+
+    Post, SyncPost = validated_posts(upper), validated_posts(sync_upper)
+    data = {'title': 'r', 'tags': [{'label': 'tag{}'.format(i)} for i in range(size)]}
+    assert run(Post().aserialize(data)) == SyncPost().serialize(data)
+    assert run(Post().aserialize(data))['tags'][-1] == {'Label': 'TAG{}'.format(size - 1)}
+    assert json.loads(run(Post().aencode(data))) == json.loads(SyncPost().encode(data))
+    post = run(Post().adeserialize({'t': 'r', 'tags': data['tags']}))
+    assert post.title == 'R'
+    assert [tag.label for tag in post.tags] == ['TAG{}'.format(i) for i in range(size)]
+
+
+def test_async_validators_require_async_api():
+    registry = Registry()
+    User, Group = user_schemas(registry)
+    with pytest.raises(SchemaException):
+        Group().validate(group(1))
+    assert Group().serialize(group(1), skip_validation=True) == group(1)
+
+
+def meta_validated_schemas():
+    async def stamp(output, schema=None, context=None):
+        await asyncio.sleep(0)
+        return dict(output, stamp=schema.__class__.__name__)
+
+    async def upper(value, **kwargs):
+        return value.upper()
+
+    class Tag(Schema):
+        class Meta:
+            post_validate = [stamp]
+
+        label = fields.String(post_validate=[upper])
+
+    class Post(Schema):
+        class Meta:
+            post_validate = ['count_tags', stamp]
+
+        title = fields.String()
+        tags = fields.List(fields.Schema(Tag))
+
+        def count_tags(self, output, schema=None, context=None):
+            return dict(output, count=len(output['tags']))
+
+    return Post
+
+
+def test_async_schema_validators():
+    Post = meta_validated_schemas()
+    data = {'title': 'x', 'tags': [{'label': 'a'}, {'label': 'b'}]}
+    assert run(Post().avalidate(data)) == {
+        'title': 'x', 'count': 2, 'stamp': 'Post',
+        'tags': [{'label': 'A', 'stamp': 'Tag'}, {'label': 'B', 'stamp': 'Tag'}]}
+
+
+def test_async_schema_validators_require_async_api():
+    Post = meta_validated_schemas()
+    with pytest.raises(SchemaException):
+        Post().validate({'title': 'x', 'tags': []})
+    with pytest.raises(SchemaException):
+        Post().validate({'title': 'x', 'tags': [{'label': 'a'}]})
+
+
+class AsyncSuffix(object):
+
+    def __init__(self, suffix):
+        self.suffix = suffix
+
+    async def __call__(self, value, **kwargs):
+        await asyncio.sleep(0)
+        if isinstance(value, dict):
+            return dict(value, suffix=self.suffix)
+        return value + self.suffix
+
+
+async def add_suffix(value, suffix, **kwargs):
+    return value + suffix
+
+
+def test_async_callable_validators():
+    def upper(value, **kwargs):
+        return value.upper()
+
+    class S(Schema):
+        class Meta:
+            post_validate = [AsyncSuffix('!')]
+
+        a = fields.String(post_validate=[AsyncSuffix('.'), upper])
+        b = fields.String(post_validate=[partial(add_suffix, suffix='?')])
+
+    assert run(S().avalidate({'a': 'x', 'b': 'y'})) == {'a': 'X.', 'b': 'y?', 'suffix': '!'}
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        with pytest.raises(SchemaException):
+            S().validate({'a': 'x'})
@@ -0,0 +1,145 @@
+import datetime
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
+
+import pytest
+
+from ciri import fields
+from ciri.core import Schema, SchemaOptions
+from ciri.exception import ValidationError
+
+
+class Row(Schema):
+
+    name = fields.String(required=True)
+    age = fields.Integer()
+    score = fields.Float()
+    active = fields.Boolean(default=True, output_missing=True)
+    day = fields.Date()
+
+
+DAY = datetime.date(2020, 1, 1)
+
+
+def per_record(schema_cls, records):
+    output = []
+    for record in records:
+        schema = schema_cls()
+        try:
+            output.append(schema.validate(record))
+        except ValidationError:
+            output.append(None)
+    return output
+
+
+def test_batch_matches_per_record_validation():
+    records = [
+        {'name': 'a', 'age': 1, 'score': 1.5, 'active': False, 'day': DAY},
+        {'name': ' b ', 'age': 2, 'score': 2, 'active': True, 'day': DAY, 'extra': 1},
+        {'name': 'c'},
+        {'name': 'd', 'age': 3.0, 'active': True, 'day': '2020-01-02'},
+    ]
+    assert Row().validate_batch(records) == per_record(Row, records)
+
+
+def test_batch_errors_are_keyed_by_record():
+    records = [
+        {'name': 'a', 'age': 1},
+        {'age': 'x'},
+        {'name': 'c', 'age': 3},
+        {'name': 1},
+    ]
+    schema = Row()
+    with pytest.raises(ValidationError):
+        schema.validate_batch(records)
+    assert sorted(schema._raw_errors) == [1, 3]
+    assert schema.errors['1'] == {'msg': 'Invalid Schema',
+                                  'errors': {'name': {'msg': 'Required Field'},
+                                             'age': {'msg': 'Field is not a valid Integer'}}}
+    assert schema.errors['3'] == {'msg': 'Invalid Schema',
+                                  'errors': {'name': {'msg': 'Field is not a valid String'}}}
+
+
+def test_batch_halt_on_error():
+    schema = Row()
+    with pytest.raises(ValidationError):
+        schema.validate_batch([{'age': 1}, {'age': 2}, {'name': 'c'}], halt_on_error=True)
+    assert list(schema.errors) == ['0']
+
+
+def test_batch_without_raising():
+    class S(Row):
+        class Meta:
+            options = SchemaOptions(raise_errors=False)
+
+    schema = S()
+    output = schema.validate_batch([{'name': 'a', 'age': 1}, {'name': 'b', 'age': 'x'}])
+    assert output[0] == {'name': 'a', 'age': 1, 'active': True}
+    assert list(schema.errors) == ['1']
+
+
+def test_batch_string_rules():
+    class S(Schema):
+        name = fields.String(allow_empty=False)
+        raw = fields.String(trim=False)
+
+    schema = S()
+    assert schema.validate_batch([{'name': ' a ', 'raw': ' b '}]) == [{'name': 'a', 'raw': ' b '}]
+    with pytest.raises(ValidationError):
+        schema.validate_batch([{'name': 'a'}, {'name': ' '}])
+    assert list(schema.errors) == ['1']
+
+
+def test_batch_of_nested_schema_validates_each_record():
+    class Child(Schema):
+        name = fields.String(required=True)
+
+    class Parent(Schema):
+        child = fields.Schema(Child)
+        tags = fields.List(fields.String())
+
+    records = [{'child': {'name': 'a'}, 'tags': ['x']}, {'child': {}}]
+    schema = Parent()
+    with pytest.raises(ValidationError):
+        schema.validate_batch(records)
+    assert list(schema.errors) == ['1']
+    assert schema.errors['1']['errors']['child']['errors'] == {'name': {'msg': 'Required Field'}}
+
+
+def test_batch_of_objects():
+    class Obj(object):
+        def __init__(self, name):
+            self.name = name
+
+    assert Row().validate_batch([Obj('a'), {'name': 'b'}]) == [{'name': 'a', 'active': True},
+                                                               {'name': 'b', 'active': True}]
+
+
+def test_empty_batch():
+    assert Row().validate_batch([]) == []
+    assert Schema().validate_batch([{'a': 1}]) == [{}]
+
+
+def test_serialize_batch_matches_per_record_serialization():
+    class S(Row):
+        label = fields.String(name='title')
+
+    records = [
+        {'name': 'a', 'age': 1, 'score': 1.5, 'day': DAY, 'label': 'x'},
+        {'name': 'b', 'age': 2, 'active': False},
+        {'name': 'c', 'score': 2},
+    ]
+    expected = [S().serialize(record) for record in records]
+    assert S().serialize_batch(records) == expected
+    records.append({'name': 'd', 'age': None})
+    assert S().serialize_batch(records, skip_validation=True, exclude=['active']) == [
+        S().serialize(record, skip_validation=True, exclude=['active']) for record in records]
+
+
+def test_serialize_batch_validates_first():
+    schema = Row()
+    with pytest.raises(ValidationError):
+        schema.serialize_batch([{'name': 'a'}, {'age': 1}])
+    assert list(schema.errors) == ['1']
@@ -5,7 +5,7 @@ import json
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
 
 from ciri import fields
-from ciri.core import Schema, SchemaOptions
+from ciri.core import PolySchema, Schema, SchemaOptions
 from ciri.registry import SchemaRegistry, schema_registry
 from ciri.exception import ValidationError, SerializationError
 
@@ -32,3 +32,65 @@ def test_complex_json_encode():
     schema = Root(node=Node(label='testing', sub=S(name='bob')))
     encoded = schema.encode()
     assert json.loads(encoded) == json.loads('{"node": {"label": "testing", "sub": {"name": "bob"}}}')
+
+
+def test_iterencode_matches_encode():
+    class S(Schema):
+        name = fields.String()
+        tags = fields.List(fields.String())
+        sub = fields.Dict()
+
+    data = {'name': 'bob', 'tags': ['a', 'b'], 'sub': {'x': [1, 2.5, None, True]}}
+    schema = S()
+    assert ''.join(schema.iterencode(data)) == schema.encode(data)
+
+
+def test_iterencode_non_string_keys():
+    class S(Schema):
+        sub = fields.Dict()
+
+    data = {'sub': {True: 1, False: 2, None: 3, 4: 4, 2.5: 5, float('inf'): 6}}
+    schema = S()
+    assert ''.join(schema.iterencode(data)) == schema.encode(data)
+    with pytest.raises(TypeError):
+        ''.join(schema.iterencode({'sub': {(1, 2): 1}}))
+
+
+def test_iterencode_streams_lists():
+    class Row(Schema):
+        id = fields.Integer(required=True)
+
+    class S(Schema):
+        name = fields.String()
+        rows = fields.List(fields.Schema(Row), stream=True)
+
+    consumed = []
+
+    def rows():
+        for idx in range(3):
+            consumed.append(idx)
+            yield {'id': idx}
+
+    chunks = S().iterencode({'name': 'bob', 'rows': rows()})
+    assert consumed == []
+    assert json.loads(''.join(chunks)) == {'name': 'bob', 'rows': [{'id': 0}, {'id': 1}, {'id': 2}]}
+    assert consumed == [0, 1, 2]
+
+
+def test_encode_streamed_list():
+    class S(Schema):
+        rows = fields.List(fields.Integer(), stream=True)
+    assert S().encode({'rows': iter([1, 2])}) == '{"rows": [1, 2]}'
+
+
+def test_poly_iterencode():
+    class Parent(PolySchema):
+        kind = fields.String(required=True)
+        __poly_on__ = kind
+
+    class Child(Parent):
+        __poly_id__ = 'child'
+        name = fields.String()
+
+    data = {'kind': 'child', 'name': 'bob'}
+    assert json.loads(''.join(Parent().iterencode(data))) == data
@@ -0,0 +1,98 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
+
+from ciri import fields
+from ciri.core import PolySchema, Schema
+from ciri.exception import ValidationError
+
+import pytest
+
+
+class CountedString(fields.String):
+
+    calls = 0
+
+    def deserialize(self, value):
+        CountedString.calls += 1
+        return super(CountedString, self).deserialize(value)
+
+
+class Movie(Schema):
+    title = CountedString()
+
+
+class Actor(Schema):
+    name = fields.String(required=True)
+    movies = fields.List(fields.Schema(Movie))
+    agent = fields.Schema(Movie)
+
+
+DATA = {'name': 'Keanu', 'movies': [{'title': 'The Matrix'}, {'title': 'John Wick'}], 'agent': {'title': 'Ari'}}
+
+
+def setup_function(function):
+    CountedString.calls = 0
+
+
+def test_lazy_fields_deserialize_on_access():
+    actor = Actor().deserialize(DATA, lazy=True)
+    assert actor.name == 'Keanu'
+    assert CountedString.calls == 0
+    assert [m.title for m in actor.movies] == ['The Matrix', 'John Wick']
+    assert CountedString.calls == 2
+
+
+def test_lazy_fields_memoized():
+    actor = Actor().deserialize(DATA, lazy=True)
+    assert actor.movies is actor.movies
+    assert CountedString.calls == 2
+    assert 'movies' in vars(actor)
+
+
+def test_lazy_validates_eagerly():
+    with pytest.raises(ValidationError):
+        Actor().deserialize({'name': 'Keanu', 'movies': [{'title': 1}]}, lazy=True)
+
+
+def test_lazy_missing_attribute():
+    actor = Actor().deserialize({'name': 'Keanu'}, lazy=True)
+    with pytest.raises(AttributeError):
+        actor.movies
+
+
+def test_lazy_instance_serializes():
+    actor = Actor().deserialize(DATA, lazy=True)
+    assert actor.serialize() == DATA
+    assert actor == Actor().deserialize(DATA)
+
+
+def test_lazy_with_post_deserialize():
+    class S(Actor):
+        class Meta:
+            post_deserialize = ['count_movies']
+
+        def count_movies(self, data, **kwargs):
+            data['name'] = '{} ({})'.format(data['name'], len(data['movies']))
+            return data
+
+    actor = S().deserialize(DATA, lazy=True)
+    assert actor.name == 'Keanu (2)'
+
+
+def test_lazy_poly_round_trip():
+    class Pet(PolySchema):
+        kind = fields.String(required=True)
+
+        __poly_on__ = kind
+
+    class Dog(Pet):
+        __poly_id__ = 'dog'
+
+        toy = fields.Schema(Movie)
+        movies = fields.List(fields.Schema(Movie))
+
+    data = {'kind': 'dog', 'toy': {'title': 'Ball'}, 'movies': [{'title': 'Lassie'}]}
+    pet = Pet().deserialize(data, lazy=True)
+    assert Pet().serialize(pet) == data
@@ -0,0 +1,165 @@
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
+
+from ciri import fields
+from ciri.core import CompileOnAccess, PolySchema, Schema
+
+
+def is_compiled(schema):
+    return not isinstance(schema.__dict__['_fields'], CompileOnAccess)
+
+
+class LazyBase(Schema):
+    __schema_lazy__ = True
+
+
+def test_lazy_schema_compiles_on_instantiation():
+    class S(Schema):
+        class Meta:
+            lazy = True
+        name = fields.String(required=True)
+
+    assert not is_compiled(S)
+    assert S().serialize({'name': 'ciri'}) == {'name': 'ciri'}
+    assert is_compiled(S)
+
+
+def test_lazy_schema_compiles_on_class_access():
+    class S(LazyBase):
+        name = fields.String()
+
+    assert not is_compiled(S)
+    assert list(S._fields) == ['name']
+    assert is_compiled(S)
+
+
+def test_lazy_schema_compile():
+    class S(LazyBase):
+        name = fields.String()
+
+    assert S.compile() is S
+    assert is_compiled(S)
+    assert S.compile() is S
+
+
+def test_lazy_schema_inheritance():
+    class Parent(LazyBase):
+        name = fields.String()
+
+    class Child(Parent):
+        age = fields.Integer()
+
+    assert not is_compiled(Parent) and not is_compiled(Child)
+    assert Child().serialize({'name': 'ciri', 'age': 3}) == {'name': 'ciri', 'age': 3}
+    assert is_compiled(Parent)
+
+
+def test_eager_subclass_of_lazy_schema():
+    class Parent(LazyBase):
+        name = fields.String()
+
+    class Child(Parent):
+        __schema_lazy__ = False
+        age = fields.Integer()
+
+    assert is_compiled(Child) and is_compiled(Parent)
+    assert set(Child._fields) == {'name', 'age'}
+
+
+def test_lazy_sub_schema():
+    class Address(LazyBase):
+        city = fields.String()
+
+    class Person(Schema):
+        address = fields.Schema(Address)
+
+    assert not is_compiled(Address)
+    assert Person().serialize({'address': {'city': 'Novigrad'}}) == {'address': {'city': 'Novigrad'}}
+    assert is_compiled(Address)
+
+
+def test_lazy_schema_compose():
+    class Named(LazyBase):
+        name = fields.String()
+
+    class S(Schema):
+        class Meta:
+            compose = [Named]
+        age = fields.Integer()
+
+    assert set(S._fields) == {'name', 'age'}
+
+
+def test_lazy_poly_variants():
+    class Animal(PolySchema):
+        __schema_lazy__ = True
+        kind = fields.String(required=True)
+        __poly_on__ = kind
+
+    class Dog(Animal):
+        __poly_id__ = 'dog'
+        name = fields.String()
+
+    assert is_compiled(Animal)
+    assert not is_compiled(Dog)
+    assert Animal().serialize({'kind': 'dog', 'name': 'Fang'}) == {'kind': 'dog', 'name': 'Fang'}
+
+
+def test_lazy_schema_keeps_methods_bound_to_the_class():
+    class S(LazyBase):
+        name = fields.String(post_serialize=['shout'])
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+
+        def shout(self, value, **kwargs):
+            return self.__name__ + value
+
+    assert S().serialize({'name': '!'}) == {'name': 'S!'}
+
+
+def test_lazy_schema_compiles_once_across_threads():
+    interval = sys.getswitchinterval()
+    # switch threads as often as possible to hit the window while compiling
+    sys.setswitchinterval(1e-6)
+    try:
+        data = {'f0': 'x', 'f29': 'y'}
+        for _ in range(50):
+            S = type('S', (LazyBase,), dict(('f{}'.format(i), fields.String()) for i in range(30)))
+            barrier = threading.Barrier(4)
+            outputs = []
+
+            def serialize():
+                barrier.wait()
+                outputs.append(S().serialize(data))
+
+            threads = [threading.Thread(target=serialize) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert outputs == [data] * 4
+    finally:
+        sys.setswitchinterval(interval)
+
+
+def test_lazy_schema_compiles_in_place():
+    calls = []
+
+    class Base(LazyBase):
+        def __init_subclass__(cls, **kwargs):
+            super().__init_subclass__(**kwargs)
+            calls.append(cls.__name__)
+
+    class S(Base):
+        name = fields.String()
+
+    subclasses = Base.__subclasses__()
+    assert subclasses == [S]
+    S.compile()
+    assert calls == ['S']
+    assert Base.__subclasses__() == subclasses
+    assert S().serialize({'name': 'ciri'}) == {'name': 'ciri'}
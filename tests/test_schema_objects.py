@@ -0,0 +1,152 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
+
+import ipaddress
+import uuid
+from collections import namedtuple
+from dataclasses import dataclass
+from fractions import Fraction
+
+from ciri import fields
+from ciri.core import Schema, PolySchema
+from ciri.exception import ValidationError
+
+import pytest
+
+
+class Person(Schema):
+    name = fields.String(required=True)
+    age = fields.Integer()
+
+
+class SlottedPerson(object):
+    __slots__ = ['name', 'age']
+
+    def __init__(self, name, age=None):
+        self.name = name
+        if age is not None:
+            self.age = age
+
+
+@dataclass
+class DataPerson:
+    name: str
+    age: int
+
+
+class PropertyPerson(object):
+
+    def __init__(self, first, last):
+        self.first = first
+        self.last = last
+
+    @property
+    def name(self):
+        return '{} {}'.format(self.first, self.last)
+
+
+NamedPerson = namedtuple('NamedPerson', ['name', 'age'])
+
+
+@pytest.mark.parametrize("data, expected", [
+    [SlottedPerson('Harry', 17), {'name': 'Harry', 'age': 17}],
+    [SlottedPerson('Harry'), {'name': 'Harry'}],
+    [DataPerson('Harry', 17), {'name': 'Harry', 'age': 17}],
+    [NamedPerson('Harry', 17), {'name': 'Harry', 'age': 17}],
+    [PropertyPerson('Harry', 'Potter'), {'name': 'Harry Potter'}],
+])
+def test_serialize_objects(data, expected):
+    assert Person().serialize(data) == expected
+
+
+def test_validate_slotted_object_missing_required():
+    obj = SlottedPerson('Harry')
+    del obj.name
+    schema = Person()
+    with pytest.raises(ValidationError):
+        schema.validate(obj)
+    assert schema.errors == {'name': {'msg': fields.String().message.required}}
+
+
+def test_properties_are_read_once():
+    calls = []
+
+    class Lazy(object):
+        @property
+        def name(self):
+            calls.append('name')
+            return 'Harry'
+
+        @property
+        def age(self):
+            calls.append('age')
+            return 17
+
+    assert Person().serialize(Lazy(), exclude=['age']) == {'name': 'Harry'}
+    assert calls == ['name']
+
+
+def test_deserialize_slotted_object():
+    person = Person().deserialize(SlottedPerson('Harry', 17))
+    assert (person.name, person.age) == ('Harry', 17)
+
+
+def test_getters_cached_per_type():
+    schema = Person()
+    schema.serialize(SlottedPerson('Harry', 17))
+    schema.serialize(SlottedPerson('Ron', 17))
+    schema.serialize(NamedPerson('Hermione', 17))
+    assert {SlottedPerson, NamedPerson} <= set(Person._input_getters)
+    assert Person._input_getters[NamedPerson]['age'](NamedPerson('Ron', 17)) == 17
+
+
+def test_subschema_slotted_object():
+    class House(Schema):
+        head = fields.Schema(Person)
+        members = fields.List(fields.Schema(Person))
+
+    data = {'head': SlottedPerson('Minerva'), 'members': [DataPerson('Harry', 17)]}
+    assert House().serialize(data) == {'head': {'name': 'Minerva'}, 'members': [{'name': 'Harry', 'age': 17}]}
+
+
+def test_poly_schema_object():
+    @dataclass
+    class Pet:
+        kind: str
+        name: str
+
+    class Animal(PolySchema):
+        kind = fields.String(required=True)
+        __poly_on__ = kind
+
+    class Dog(Animal):
+        __poly_id__ = 'dog'
+        name = fields.String()
+
+    assert Animal().serialize(Pet('dog', 'Fang')) == {'kind': 'dog', 'name': 'Fang'}
+
+
+def test_pre_serialize_receives_dict():
+    class S(Person):
+        class Meta:
+            pre_serialize = ['upper']
+
+        def upper(self, data, **kwargs):
+            data['name'] = data['name'].upper()
+            return data
+
+    assert S().serialize(NamedPerson('Harry', 17)) == {'name': 'HARRY', 'age': 17}
+
+
+@pytest.mark.parametrize("value", [uuid.UUID(int=1), Fraction(1, 2), ipaddress.ip_address('127.0.0.1')])
+def test_slotted_values_are_not_objects(value):
+    class Group(Schema):
+        leader = fields.Schema(Person)
+
+    schema = Group()
+    with pytest.raises(ValidationError):
+        schema.validate({'leader': value})
+    assert schema.errors == {'leader': {'msg': fields.Schema(Person).message.invalid_mapping}}
+    assert schema.validate({'leader': SlottedPerson('Harry')}) == {'leader': {'name': 'Harry'}}
@@ -0,0 +1,184 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
+
+from ciri import fields
+from ciri.core import PolySchema, Schema
+from ciri.exception import ValidationError, SerializationError
+
+import pytest
+
+
+class Movie(Schema):
+    title = fields.String(required=True)
+    year = fields.Integer()
+
+
+class Actor(Schema):
+    name = fields.String(required=True)
+    age = fields.Integer()
+    movies = fields.List(fields.Schema(Movie))
+    nicknames = fields.List(fields.String())
+    agent = fields.Schema(Movie)
+
+
+class Pet(PolySchema):
+    type = fields.String(required=True)
+    name = fields.String()
+
+    __poly_on__ = type
+
+
+class Dog(Pet):
+    __poly_id__ = 'dog'
+
+    barks = fields.Boolean()
+
+
+class Cat(Pet):
+    __poly_id__ = 'cat'
+
+    lives = fields.Integer()
+
+
+class Owner(Schema):
+    pet = fields.Schema(Pet)
+    pets = fields.List(fields.Schema(Pet))
+
+
+BASE = {'name': 'Keanu', 'age': 56, 'movies': [{'title': 'The Matrix', 'year': 1999}], 'nicknames': ['Neo']}
+
+
+def test_partial_skips_required_checks():
+    assert Actor().validate_partial({'age': 57}) == {'age': 57}
+
+
+def test_partial_applies_to_base():
+    base = dict(BASE)
+    output = Actor().validate_partial({'age': 57}, base=base)
+    assert output == dict(BASE, age=57)
+    assert base == BASE
+    assert output['movies'] is BASE['movies']
+
+
+def test_partial_invalid_value():
+    schema = Actor()
+    with pytest.raises(ValidationError):
+        schema.validate_partial({'age': 'old', 'name': 'Keanu'}, base=BASE)
+    assert schema.errors == {'age': {'msg': fields.Integer().message.invalid}}
+
+
+def test_partial_nested_path():
+    output = Actor().validate_partial({'movies.0.year': 2000}, base=BASE)
+    assert output['movies'] == [{'title': 'The Matrix', 'year': 2000}]
+    assert BASE['movies'][0]['year'] == 1999
+
+
+def test_partial_nested_path_errors():
+    schema = Actor()
+    with pytest.raises(ValidationError):
+        schema.validate_partial({'movies.0.year': 'x', 'movies.1.title': 5, 'agent.title': 5}, base=BASE)
+    assert schema.errors == {
+        'movies': {'msg': fields.List().message.invalid_item, 'errors': {
+            '0': {'msg': fields.Schema(Movie).message.invalid, 'errors': {
+                'year': {'msg': fields.Integer().message.invalid}}},
+            '1': {'msg': fields.Schema(Movie).message.invalid, 'errors': {
+                'title': {'msg': fields.String().message.invalid}}}}},
+        'agent': {'msg': fields.Schema(Movie).message.invalid, 'errors': {
+            'title': {'msg': fields.String().message.invalid}}}
+    }
+
+
+def test_partial_list_item():
+    schema = Actor()
+    assert schema.validate_partial({'nicknames.0': 'The One'}, base=BASE)['nicknames'] == ['The One']
+    with pytest.raises(ValidationError):
+        schema.validate_partial({'nicknames.0': 1}, base=BASE)
+
+
+def test_partial_json_patch():
+    ops = [
+        {'op': 'replace', 'path': '/name', 'value': 'Keanu Reeves'},
+        {'op': 'add', 'path': '/movies/-', 'value': {'title': 'John Wick', 'year': 2014}},
+        {'op': 'add', 'path': '/nicknames/0', 'value': 'John'},
+        {'op': 'remove', 'path': '/age'},
+    ]
+    output = Actor().validate_partial(ops, base=BASE)
+    assert output == {
+        'name': 'Keanu Reeves',
+        'movies': [{'title': 'The Matrix', 'year': 1999}, {'title': 'John Wick', 'year': 2014}],
+        'nicknames': ['John', 'Neo']
+    }
+
+
+def test_partial_json_patch_validates_added_item():
+    schema = Actor()
+    with pytest.raises(ValidationError):
+        schema.validate_partial([{'op': 'add', 'path': '/movies/-', 'value': {'year': 2014}}], base=BASE)
+    assert schema._raw_errors['movies'].errors['-'].errors['title'].message == fields.String().message.required
+
+
+def test_partial_remove_required():
+    schema = Actor()
+    with pytest.raises(ValidationError):
+        schema.validate_partial([{'op': 'remove', 'path': '/name'}], base=BASE)
+    assert schema.errors == {'name': {'msg': fields.String().message.required}}
+
+
+def test_partial_unsupported_operation():
+    with pytest.raises(SerializationError):
+        Actor().validate_partial([{'op': 'move', 'from': '/name', 'path': '/age'}], base=BASE)
+
+
+def test_partial_invalid_path():
+    with pytest.raises(SerializationError):
+        Actor().validate_partial({'movies.5.year': 2000}, base=BASE)
+
+
+def test_partial_unknown_key():
+    with pytest.raises(SerializationError):
+        Actor().validate_partial({'rating': 5}, base=BASE)
+    with pytest.raises(SerializationError):
+        Actor().validate_partial({'agent.rating': 5}, base=BASE)
+
+
+def test_partial_poly_variant_field():
+    base = {'pet': {'type': 'dog', 'barks': True}, 'pets': [{'type': 'cat', 'lives': 9}]}
+    output = Owner().validate_partial({'pet.barks': False, 'pets.0.lives': 8}, base=base)
+    assert output == {'pet': {'type': 'dog', 'barks': False}, 'pets': [{'type': 'cat', 'lives': 8}]}
+
+    schema = Owner()
+    with pytest.raises(ValidationError):
+        schema.validate_partial({'pet.barks': 'notbool'}, base=base)
+    assert schema.errors == {'pet': {'msg': fields.Schema(Pet).message.invalid, 'errors': {
+        'barks': {'msg': fields.Boolean().message.invalid}}}}
+
+    # the fields of another variant are unknown
+    with pytest.raises(SerializationError):
+        Owner().validate_partial({'pet.lives': 3}, base=base)
+
+
+def test_partial_poly_variant_from_patch():
+    ops = [
+        {'op': 'replace', 'path': '/pet/type', 'value': 'cat'},
+        {'op': 'add', 'path': '/pet/lives', 'value': 9},
+    ]
+    output = Owner().validate_partial(ops, base={'pet': {'type': 'dog'}})
+    assert output == {'pet': {'type': 'cat', 'lives': 9}}
+
+
+def test_partial_poly_missing_key():
+    schema = Owner()
+    with pytest.raises(ValidationError):
+        schema.validate_partial({'pet.barks': True}, base={'pet': {'type': 'fish'}})
+    assert schema.errors == {'pet': {'msg': fields.Schema(Pet).message.invalid_polykey}}
+
+
+def test_partial_object_base_missing_attribute():
+    class Person(object):
+        __slots__ = ['name', 'age', 'movies', 'nicknames', 'agent']
+
+    base = Person()
+    base.name = 'Keanu'
+    assert Actor().validate_partial({'age': 57}, base=base) == {'name': 'Keanu', 'age': 57}
@@ -2,6 +2,8 @@ import os
 import sys
 import uuid
 import json
+import gc
+import weakref
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
 
@@ -434,6 +436,25 @@ def test_poly_sub_serialization_invalid():
     assert schema.errors == errors
 
 
+@pytest.mark.parametrize("poly_key", [['a'], {'a': 1}])
+def test_poly_sub_unhashable_key(poly_key):
+
+    class Poly(Schema):
+        type = fields.Anything(required=True)
+        __poly_on__ = type
+
+    class PolyA(Poly):
+        __poly_id__ = 'a'
+
+    class Sub(StandardSchema):
+        poly = fields.Schema(Poly)
+
+    schema = Sub()
+    with pytest.raises(ValidationError):
+        schema.validate({'poly': {'type': poly_key}})
+    assert schema.errors == {'poly': {'msg': fields.Schema(Poly).message.invalid_polykey}}
+
+
 def test_poly_deserialize_with_dynamic_load():
     class S(Schema):
         first_name = fields.String()
@@ -578,3 +599,124 @@ def test_poly_missing_identifier(test_input):
     with pytest.raises(SerializationError) as e:
         schema.deserialize(test_input)
     assert "Failed to find polymorphic identifier" in e.value.message
+
+
+def test_poly_unregister():
+    class Animal(Schema):
+        kind = fields.String(required=True)
+        __poly_on__ = kind
+
+    class Dog(Animal):
+        __poly_id__ = 'dog'
+
+    Animal.unregister('dog')
+    assert Animal.getpoly('dog') is None
+    with pytest.raises(SerializationError):
+        Animal().serialize({'kind': 'dog'})
+
+
+def test_poly_weak_mapping():
+    class Form(Schema):
+        __poly_weak__ = True
+        kind = fields.String(required=True)
+        __poly_on__ = kind
+
+    refs = []
+    for idx in range(1000):
+        variant = type('Form{}'.format(idx), (Form,), {'__poly_id__': 'form{}'.format(idx),
+                                                        'title': fields.String()})
+        assert Form().serialize({'kind': 'form{}'.format(idx), 'title': 'x'})
+        refs.append(weakref.ref(variant))
+    del variant
+    gc.collect()
+    # the parent's shared fields still point at the last variant used
+    assert sum(1 for ref in refs if ref() is not None) <= 1
+    assert len(Form.__poly_mapping__) <= 1
+
+
+def test_poly_weak_mapping_self_reference():
+    class Form(Schema):
+        __poly_weak__ = True
+        kind = fields.String(required=True)
+        parent = fields.SelfReference()
+        __poly_on__ = kind
+
+    refs = []
+    for idx in range(50):
+        kind = 'form{}'.format(idx)
+        variant = type('Form{}'.format(idx), (Form,), {'__poly_id__': kind})
+        data = {'kind': kind, 'parent': {'kind': kind}}
+        assert Form().serialize(data) == data
+        refs.append(weakref.ref(variant))
+    del variant
+    gc.collect()
+    assert sum(1 for ref in refs if ref() is not None) <= 1
+
+
+class Shape(Schema):
+    kind = fields.String(required=True)
+    label = fields.String()
+    __poly_on__ = kind
+
+
+class Circle(Shape):
+    __poly_id__ = 'circle'
+    radius = fields.Float(required=True)
+
+
+class Rect(Shape):
+    __poly_id__ = 'rect'
+    width = fields.Integer(required=True)
+    height = fields.Integer(required=True)
+    note = fields.String()
+
+
+class Drawing(StandardSchema):
+    shapes = fields.List(fields.Schema(Shape, exclude=['note']))
+
+
+SHAPES = [
+    {'kind': 'rect', 'width': 1, 'height': 2, 'note': 'x'},
+    {'kind': 'circle', 'radius': 1.5, 'label': 'c'},
+    {'kind': 'rect', 'width': 3, 'height': 4},
+    {'kind': 'circle', 'radius': 2},
+]
+
+
+def test_poly_list_keeps_item_order():
+    expected = [{'kind': 'rect', 'width': 1, 'height': 2},
+                {'kind': 'circle', 'radius': 1.5, 'label': 'c'},
+                {'kind': 'rect', 'width': 3, 'height': 4},
+                {'kind': 'circle', 'radius': 2.0}]
+    assert Drawing().validate({'shapes': SHAPES})['shapes'] == expected
+    assert Drawing().serialize({'shapes': SHAPES})['shapes'] == expected
+    shapes = Drawing().deserialize({'shapes': SHAPES}).shapes
+    assert [type(s) for s in shapes] == [Rect, Circle, Rect, Circle]
+    assert shapes[3].radius == 2.0
+
+
+def test_poly_list_errors_by_item():
+    schema = Drawing()
+    with pytest.raises(ValidationError):
+        schema.validate({'shapes': [{'kind': 'circle', 'radius': 'x'}, {'kind': 'rect', 'width': 1},
+                                    {'kind': 'circle', 'radius': 1}, {'kind': 'rect'}]})
+    errors = schema.errors['shapes']['errors']
+    assert list(errors) == ['0', '1', '3']
+    assert errors['0'] == {'msg': 'Invalid Schema', 'errors': {'radius': {'msg': 'Field is not a valid Float'}}}
+    assert errors['1'] == {'msg': 'Invalid Schema', 'errors': {'height': {'msg': 'Required Field'}}}
+    assert sorted(errors['3']['errors']) == ['height', 'width']
+
+
+def test_poly_list_item_errors_match_single_items():
+    class Item(StandardSchema):
+        shape = fields.Schema(Shape)
+
+    schema = Item()
+    with pytest.raises(ValidationError):
+        schema.validate({'shape': {'kind': 'rect', 'width': 1}})
+    assert schema.errors['shape'] == {'msg': 'Invalid Schema', 'errors': {'height': {'msg': 'Required Field'}}}
+
+
+def test_poly_list_unknown_identifier():
+    with pytest.raises(SerializationError):
+        Drawing().validate({'shapes': [{'kind': 'circle', 'radius': 1}, {'kind': 'hexagon'}]})
@@ -0,0 +1,168 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
+
+import pytest
+
+from ciri import fields
+from ciri.core import PolySchema, Schema, SchemaOptions
+from ciri.exception import ValidationError
+from ciri.registry import SchemaRegistry
+
+
+class Person(Schema):
+
+    name = fields.String(required=True)
+    age = fields.Integer()
+
+
+def test_init_creates_no_instance_state():
+    schema = Person()
+    assert vars(schema) == {}
+
+
+def test_state_is_created_on_first_use():
+    schema = Person()
+    assert schema.errors == {}
+    assert schema.context == {}
+    assert schema.halt_on_error is False
+    assert '_error_handler' in vars(schema)
+    assert '_error_handler' not in vars(Person())
+
+
+def test_init_with_values():
+    schema = Person(name='ciri', age=20, unknown=1)
+    assert vars(schema) == {'name': 'ciri', 'age': 20}
+    assert schema.serialize() == {'name': 'ciri', 'age': 20}
+
+
+def test_instances_keep_separate_errors():
+    first = Person()
+    second = Person()
+    with pytest.raises(ValidationError):
+        first.validate({'age': 1})
+    assert second.validate({'name': 'ciri'}) == {'name': 'ciri'}
+    assert first.errors == {'name': {'msg': 'Required Field'}}
+    assert second.errors == {}
+
+
+def test_inherited_fields_bind_to_the_running_instance():
+    class Parent(Schema):
+        name = fields.List(fields.String())
+
+    class Child(Parent):
+        class Meta:
+            options = SchemaOptions(allow_none=True)
+
+    parent = Parent()
+    child = Child()
+    assert child.validate({'name': [None]}) == {'name': [None]}
+    with pytest.raises(ValidationError):
+        parent.validate({'name': [None]})
+
+
+def test_inherited_self_reference_refers_to_the_running_schema():
+    class Node(Schema):
+        name = fields.String()
+        child = fields.SelfReference()
+
+    class ExtraNode(Node):
+        extra = fields.Integer(required=True)
+
+    data = {'name': 'x', 'child': {'name': 'y'}}
+    assert Node().validate(data) == data
+    schema = ExtraNode()
+    with pytest.raises(ValidationError):
+        schema.validate(dict(data, extra=1))
+    assert schema.errors == {'child': {'msg': 'Invalid Schema', 'errors': {'extra': {'msg': 'Required Field'}}}}
+    assert Node().validate(data) == data
+
+
+def test_pending_schema_resolves_on_first_use():
+    reg = SchemaRegistry()
+
+    class Node(Schema):
+        address = fields.Schema('address', registry=reg)
+
+    Node()
+    assert 'address' in Node._pending_schemas
+
+    class Address(Schema):
+        city = fields.String()
+
+    reg.add('address', Address)
+    assert Node().serialize({'address': {'city': 'Novigrad'}}) == {'address': {'city': 'Novigrad'}}
+    assert 'address' not in Node._pending_schemas
+
+
+def test_acquire_release_reuses_instances():
+    class S(Schema):
+        name = fields.String()
+
+    schema = S.acquire()
+    assert isinstance(schema, S)
+    schema.release()
+    assert S.acquire() is schema
+    assert S.acquire() is not schema
+
+
+def test_release_resets_instance():
+    class S(Schema):
+        name = fields.String(required=True)
+
+    schema = S.acquire()
+    schema.name = 'ciri'
+    schema.context['user'] = 1
+    with pytest.raises(ValidationError):
+        schema.validate({'age': 1}, halt_on_error=True)
+    schema.release()
+
+    schema = S.acquire()
+    assert 'name' not in vars(schema)
+    assert schema.errors == {}
+    assert schema.context == {}
+    assert schema.halt_on_error is False
+
+
+def test_release_respects_pool_size():
+    class S(Schema):
+        class Meta:
+            options = SchemaOptions(pool_size=2)
+        name = fields.String()
+
+    schemas = [S.acquire() for _ in range(3)]
+    for schema in schemas:
+        schema.release()
+    assert len(S._pool) == 2
+
+
+def test_pools_are_per_class():
+    class A(Schema):
+        name = fields.String()
+
+    class B(A):
+        pass
+
+    schema = A.acquire()
+    schema.release()
+    assert isinstance(B.acquire(), B)
+    assert A.acquire() is schema
+
+
+def test_release_poly_schema():
+    class Shape(PolySchema):
+        kind = fields.String(required=True)
+        __poly_on__ = kind
+
+    class Circle(Shape):
+        __poly_id__ = 'circle'
+        radius = fields.Integer()
+
+    data = {'kind': 'circle', 'radius': 2}
+    schema = Shape.acquire()
+    assert schema.validate(data) == data
+    schema.release()
+    schema = Shape.acquire()
+    assert schema.validate(data) == data
+    assert schema.serialize(data) == data
@@ -0,0 +1,78 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
+
+from ciri import fields
+from ciri.core import Schema
+from ciri.util.projection import compile_projection
+
+
+class Movie(Schema):
+    title = fields.String(required=True)
+    year = fields.Integer()
+
+
+class Actor(Schema):
+    first_name = fields.String()
+    last_name = fields.String()
+    movies = fields.List(fields.Schema(Movie))
+
+
+class Show(Schema):
+    title = fields.String()
+    rating = fields.Float()
+    cast = fields.List(fields.Schema(Actor))
+    lead = fields.Schema(Actor)
+
+
+DATA = {
+    'title': 'Witcher',
+    'rating': 8.2,
+    'cast': [{'first_name': 'Henry', 'last_name': 'Cavill',
+              'movies': [{'title': 'Man of Steel', 'year': 2013}]}],
+    'lead': {'first_name': 'Henry', 'last_name': 'Cavill'}
+}
+
+
+def test_compile_projection():
+    assert compile_projection(['title', 'cast.first_name', 'cast.movies.title']) == {
+        'title': None,
+        'cast': {'first_name': None, 'movies': {'title': None}}
+    }
+
+
+def test_compile_projection_whole_field_wins():
+    assert compile_projection(['cast', 'cast.first_name']) == {'cast': None}
+    assert compile_projection(['cast.first_name', 'cast']) == {'cast': None}
+
+
+def test_compile_projection_cached():
+    assert compile_projection(['title', 'cast.first_name']) is compile_projection(('title', 'cast.first_name'))
+
+
+def test_serialize_projection():
+    output = Show().serialize(DATA, projection=['title', 'cast.first_name', 'cast.movies.title', 'lead.last_name'])
+    assert output == {
+        'title': 'Witcher',
+        'cast': [{'first_name': 'Henry', 'movies': [{'title': 'Man of Steel'}]}],
+        'lead': {'last_name': 'Cavill'}
+    }
+
+
+def test_serialize_projection_whole_subtree():
+    output = Show().serialize(DATA, projection=['lead'])
+    assert output == {'lead': {'first_name': 'Henry', 'last_name': 'Cavill'}}
+
+
+def test_projection_skips_unrequested_subtrees():
+    data = dict(DATA, rating='not a float', cast=[{'first_name': 1}])
+    assert Show().serialize(data, projection=['title']) == {'title': 'Witcher'}
+
+
+def test_projection_unknown_keys_ignored():
+    assert Show().serialize(DATA, projection=['title', 'nope']) == {'title': 'Witcher'}
+
+
+def test_encode_projection():
+    assert Show().encode(DATA, projection=['cast.last_name']) == '{"cast": [{"last_name": "Cavill"}]}'
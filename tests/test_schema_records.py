@@ -0,0 +1,92 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
+
+from ciri import fields
+from ciri.core import Schema, SchemaOptions, Record, FrozenRecord
+
+import pytest
+
+
+class Person(Schema):
+    __schema_options__ = SchemaOptions(record_output=True)
+
+    name = fields.String(required=True)
+    age = fields.Integer()
+
+
+class FrozenPerson(Schema):
+    __schema_options__ = SchemaOptions(record_output=True, frozen_records=True)
+
+    name = fields.String(required=True)
+    age = fields.Integer()
+
+
+def test_deserialize_record():
+    person = Person().deserialize({'name': 'Harry', 'age': 17})
+    assert isinstance(person, Record)
+    assert type(person) is Person.record_class()
+    assert (person.name, person.age) == ('Harry', 17)
+    assert not hasattr(person, '__dict__')
+
+
+def test_record_class_cached():
+    assert Person.record_class() is Person.record_class()
+    assert Person.record_class() is not Person.record_class(frozen=True)
+    assert Person.record_class().__schema__ is Person
+
+
+def test_record_missing_values():
+    person = Person().deserialize({'name': 'Harry'})
+    assert not hasattr(person, 'age')
+    assert person._asdict() == {'name': 'Harry'}
+
+
+def test_record_equality():
+    schema = Person()
+    assert schema.deserialize({'name': 'Harry'}) == schema.deserialize({'name': 'Harry'})
+    assert schema.deserialize({'name': 'Harry'}) != schema.deserialize({'name': 'Ron'})
+
+
+def test_record_is_mutable():
+    person = Person().deserialize({'name': 'Harry'})
+    person.age = 18
+    assert person.age == 18
+    with pytest.raises(AttributeError):
+        person.house = 'Gryffindor'
+
+
+def test_frozen_record():
+    person = FrozenPerson().deserialize({'name': 'Harry', 'age': 17})
+    assert isinstance(person, FrozenRecord)
+    with pytest.raises(AttributeError):
+        person.age = 18
+    with pytest.raises(AttributeError):
+        del person.name
+    assert hash(person) == hash(FrozenPerson().deserialize({'name': 'Harry', 'age': 17}))
+    assert person in {person}
+
+
+def test_record_serializes():
+    person = Person().deserialize({'name': 'Harry', 'age': 17})
+    assert Person().serialize(person) == {'name': 'Harry', 'age': 17}
+
+
+def test_nested_records():
+    class House(Schema):
+        __schema_options__ = SchemaOptions(record_output=True)
+
+        name = fields.String()
+        head = fields.Schema(Person)
+        members = fields.List(fields.Schema(Person))
+
+    house = House().deserialize({'name': 'Gryffindor',
+                                 'head': {'name': 'Minerva'},
+                                 'members': [{'name': 'Harry'}, {'name': 'Ron'}]})
+    assert type(house) is House.record_class()
+    assert type(house.head) is Person.record_class()
+    assert [m.name for m in house.members] == ['Harry', 'Ron']
+    assert House().serialize(house) == {'name': 'Gryffindor',
+                                        'head': {'name': 'Minerva'},
+                                        'members': [{'name': 'Harry'}, {'name': 'Ron'}]}
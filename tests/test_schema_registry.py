@@ -1,10 +1,13 @@
+import gc
 import os
 import sys
+import threading
+import weakref
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
 
-from ciri.fields import String, Schema as SubSchema
-from ciri.core import Schema
+from ciri.fields import List, String, Schema as SubSchema
+from ciri.core import PolySchema, Schema
 from ciri.registry import SchemaRegistry, schema_registry
 from ciri.exception import RegistryError
 
@@ -43,3 +46,148 @@ def test_custom_registry():
     schema = S()
     
     assert schema.serialize({'foo': {'bar': 'hello world'}}) == {'foo': {'bar': 'hello world'}}
+
+
+def test_registry_warmup():
+    reg = SchemaRegistry()
+
+    class Address(Schema):
+        city = String()
+
+    class Person(Schema):
+        address = SubSchema('address', registry=reg)
+        previous = List(SubSchema('address', registry=reg))
+
+    reg.add('person', Person)
+    reg.add('address', Address)
+    assert 'address' in Person._pending_schemas
+
+    assert reg.warmup() == [Person, Address]
+    assert Person._pending_schemas == {}
+    assert isinstance(Person._subschemas['address'], Address)
+    assert isinstance(Person._fields['previous'].field.cached, Address)
+
+
+def test_registry_warmup_poly_variants():
+    reg = SchemaRegistry()
+
+    class Animal(PolySchema):
+        kind = String(required=True)
+        __poly_on__ = kind
+
+    class Dog(Animal):
+        __poly_id__ = 'dog'
+
+    reg.add('animal', Animal)
+    assert reg.warmup() == [Animal, Dog]
+
+
+def test_registry_warmup_unresolved_reference():
+    reg = SchemaRegistry()
+
+    class Person(Schema):
+        address = SubSchema('address', registry=reg)
+
+    reg.add('person', Person)
+    with pytest.raises(RegistryError):
+        reg.warmup()
+
+
+def test_registry_warmup_freeze(monkeypatch):
+    frozen = []
+    monkeypatch.setattr(gc, 'freeze', lambda: frozen.append(True), raising=False)
+    SchemaRegistry().warmup(freeze=True)
+    assert frozen == [True]
+
+
+LAZY_MODULE = '''
+from ciri import fields
+from ciri.core import Schema
+
+
+class Address(Schema):
+    city = fields.String()
+'''
+
+
+@pytest.fixture
+def lazy_module(tmp_path, monkeypatch):
+    name = 'ciri_lazy_registry_{}'.format(tmp_path.name)
+    tmp_path.joinpath(name + '.py').write_text(LAZY_MODULE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield name
+    sys.modules.pop(name, None)
+
+
+def test_registry_lazy_import(lazy_module):
+    reg = SchemaRegistry()
+    reg.add('address', '{}:Address'.format(lazy_module))
+    assert lazy_module not in sys.modules
+
+    class Person(Schema):
+        address = SubSchema('address', registry=reg)
+
+    assert Person().serialize({'address': {'city': 'Oxenfurt'}}) == {'address': {'city': 'Oxenfurt'}}
+    assert reg.get('address') is sys.modules[lazy_module].Address
+
+
+def test_registry_lazy_import_threads(lazy_module):
+    reg = SchemaRegistry()
+    reg.add_lazy('address', '{}:Address'.format(lazy_module))
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(reg.get('address'))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(results) == 8
+    assert all(r is sys.modules[lazy_module].Address for r in results)
+
+
+def test_registry_lazy_import_error():
+    reg = SchemaRegistry()
+    reg.add('missing', 'ciri_does_not_exist:Missing')
+    with pytest.raises(RegistryError):
+        reg.get('missing')
+    with pytest.raises(ValueError):
+        reg.add('bad', 'no_class_name')
+
+
+def test_weak_registry():
+    reg = SchemaRegistry(weak=True)
+
+    class S(Schema):
+        foo = String()
+
+    reg.add('s', S)
+    assert reg.get('s') is S
+    ref = weakref.ref(S)
+    del S
+    gc.collect()
+    assert ref() is None
+    assert reg.get('s', default=None) is None
+
+
+def test_registry_unregister():
+    class S(Schema):
+        foo = String()
+
+    reg = SchemaRegistry()
+    reg.add('s', S)
+    reg.add('alias', S)
+    reg.unregister(S)
+    assert reg.names() == []
+
+
+def test_dynamic_schemas_are_collected():
+    reg = SchemaRegistry(weak=True)
+    refs = []
+    for idx in range(1000):
+        schema = type('Dynamic{}'.format(idx), (Schema,), {'name': String(required=True)})
+        reg.add('dynamic{}'.format(idx), schema)
+        schema().serialize({'name': 'form'})
+        refs.append(weakref.ref(schema))
+    del schema
+    gc.collect()
+    assert not any(ref() for ref in refs)
+    assert reg.names() == []
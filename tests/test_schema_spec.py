@@ -0,0 +1,143 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
+
+import asyncio
+import json
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+from ciri import fields, spec as spec_module
+from ciri.core import PolySchema, Schema, SchemaOptions
+from ciri.exception import ValidationError
+
+import pytest
+
+
+PERSON = {
+    'name': 'Person',
+    'fields': {
+        'name': {'type': 'string', 'required': True, 'allow_empty': False},
+        'age': {'type': 'integer'},
+        'tags': {'type': 'list', 'of': {'type': 'string'}},
+        'address': {'type': 'schema', 'schema': {'name': 'Address', 'fields': {'city': {'type': 'str'}}}},
+        'nickname': {'type': 'any', 'fieldset': [{'type': 'string'}, {'type': 'int'}]},
+    }
+}
+
+
+def test_from_spec():
+    Person = Schema.from_spec(PERSON)
+    assert Person.__name__ == 'Person'
+    assert isinstance(Person._fields['name'], fields.String)
+    assert Person._fields['name'].required is True
+    assert isinstance(Person._fields['tags'].field, fields.String)
+    data = {'name': 'Ciri', 'age': 21, 'tags': ['witcher'], 'address': {'city': 'Cintra'}, 'nickname': 3}
+    assert Person().serialize(data) == data
+
+
+def test_from_spec_validates():
+    schema = Schema.from_spec(PERSON)()
+    with pytest.raises(ValidationError):
+        schema.validate({'name': ''})
+    assert schema.errors == {'name': {'msg': fields.String().message.empty}}
+
+
+def test_from_spec_cached():
+    reordered = dict(reversed(list(PERSON.items())))
+    assert Schema.from_spec(PERSON) is Schema.from_spec(reordered)
+    assert Schema.from_spec(PERSON) is Schema.from_spec(json.dumps(PERSON))
+
+
+def test_from_spec_cache_eviction(monkeypatch):
+    monkeypatch.setattr(spec_module, 'SPEC_CACHE_SIZE', 2)
+    spec_module.clear_spec_cache()
+    first = Schema.from_spec({'name': 'A', 'fields': {'a': {'type': 'int'}}})
+    Schema.from_spec({'name': 'B', 'fields': {'b': {'type': 'int'}}})
+    Schema.from_spec({'name': 'C', 'fields': {'c': {'type': 'int'}}})
+    assert Schema.from_spec({'name': 'A', 'fields': {'a': {'type': 'int'}}}) is not first
+
+
+def test_from_spec_options():
+    S = Schema.from_spec({'options': {'allow_none': True}, 'fields': {'name': {'type': 'string'}}})
+    assert S().serialize({'name': None}) == {'name': None}
+
+
+def test_from_spec_poly():
+    Animal = Schema.from_spec({
+        'name': 'Animal',
+        'poly_on': 'kind',
+        'fields': {'kind': {'type': 'string', 'required': True}},
+        'variants': {
+            'dog': {'fields': {'barks': {'type': 'boolean'}}},
+            'cat': {'name': 'Cat', 'fields': {'lives': {'type': 'integer'}}},
+        }
+    })
+    assert issubclass(Animal, PolySchema)
+    assert Animal.getpoly('cat').__name__ == 'Cat'
+    assert Animal().serialize({'kind': 'dog', 'barks': True}) == {'kind': 'dog', 'barks': True}
+
+
+def test_from_spec_poly_nested_spec():
+    Animal = Schema.from_spec({
+        'poly_on': 'kind',
+        'fields': {'kind': {'type': 'string', 'required': True}},
+        'variants': {
+            'dog': {'fields': {'owner': {'type': 'schema', 'schema': {
+                'name': 'Owner', 'fields': {'name': {'type': 'string'}}}}}},
+        }
+    })
+    Owner = Animal.getpoly('dog')._fields['owner']._get_schema().__class__
+    assert not issubclass(Owner, PolySchema)
+    data = {'kind': 'dog', 'owner': {'name': 'ciri'}}
+    assert Animal().serialize(data) == data
+
+
+def test_from_spec_unknown_type():
+    with pytest.raises(ValueError):
+        Schema.from_spec({'fields': {'name': {'type': 'nope'}}})
+
+
+class Movie(Schema):
+    title = fields.String(required=True)
+
+
+def test_from_spec_schema_class():
+    spec = {'fields': {'movie': {'type': 'schema', 'schema': Movie}}}
+    S = Schema.from_spec(spec)
+    assert Schema.from_spec(spec) is S
+    assert S().serialize({'movie': {'title': 'Sapkowski'}}) == {'movie': {'title': 'Sapkowski'}}
+
+    class Other(Schema):  # same name, different class
+        title = fields.Integer()
+    Other.__name__ = Other.__qualname__ = 'Movie'
+    assert Schema.from_spec({'fields': {'movie': {'type': 'schema', 'schema': Other}}}) is not S
+
+
+def test_from_spec_invalid_value():
+    with pytest.raises(TypeError):
+        Schema.from_spec({'fields': {'name': {'type': 'string', 'default': object()}}})
+
+
+def test_from_spec_pickle():
+    Person = Schema.from_spec(PERSON)
+    assert Person.__module__ == 'ciri.spec'
+    assert pickle.loads(pickle.dumps(Person)) is Person
+    Animal = Schema.from_spec({
+        'poly_on': 'kind',
+        'fields': {'kind': {'type': 'string', 'required': True}},
+        'variants': {'dog': {'fields': {'movie': {'type': 'schema', 'schema': Movie}}}}
+    })
+    Dog = Animal.getpoly('dog')
+    assert pickle.loads(pickle.dumps(Dog)) is Dog
+    assert pickle.loads(pickle.dumps(Movie)) is Movie
+
+
+def test_from_spec_offloads_to_processes():
+    executor = ProcessPoolExecutor(max_workers=1)
+    schema = Schema.from_spec(PERSON)()
+    schema.config({'options': SchemaOptions(async_offload_size=1, async_executor=executor)})
+    data = {'name': 'Ciri', 'tags': ['witcher'], 'address': {'city': 'Cintra'}}
+    assert asyncio.run(schema.aserialize(data)) == data
+    executor.shutdown()
@@ -0,0 +1,132 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/../')  # noqa
+
+from ciri import fields
+from ciri.core import Schema, SchemaOptions
+from ciri.exception import ValidationError
+
+import pytest
+
+
+class CountedString(fields.String):
+
+    calls = 0
+
+    def serialize(self, value, **kwargs):
+        CountedString.calls += 1
+        return super(CountedString, self).serialize(value, **kwargs)
+
+
+TRACKED = SchemaOptions(track_changes=True)
+
+
+class Pet(Schema):
+    __schema_options__ = TRACKED
+
+    name = CountedString(required=True)
+
+
+class Person(Schema):
+    __schema_options__ = TRACKED
+
+    name = CountedString(required=True)
+    house = CountedString()
+    pet = fields.Schema(Pet)
+    pets = fields.List(fields.Schema(Pet))
+
+
+def setup_function(function):
+    CountedString.calls = 0
+
+
+def test_tracks_changes():
+    person = Person(name='Harry')
+    assert person.has_changes()
+    person.serialize()
+    assert not person.has_changes()
+    person.house = 'Gryffindor'
+    assert person.has_changes()
+    assert person._changed_keys() == {'house'}
+
+
+def test_untracked_attributes_ignored():
+    person = Person(name='Harry')
+    person.serialize()
+    person.context = {'user': 1}
+    assert not person.has_changes()
+
+
+def test_serialize_reuses_clean_fields():
+    person = Person(name='Harry', house='Gryffindor')
+    assert person.serialize() == {'name': 'Harry', 'house': 'Gryffindor'}
+    assert CountedString.calls == 2
+    assert person.serialize() == {'name': 'Harry', 'house': 'Gryffindor'}
+    assert CountedString.calls == 2
+    person.house = 'Slytherin'
+    assert person.serialize() == {'name': 'Harry', 'house': 'Slytherin'}
+    assert CountedString.calls == 3
+
+
+def test_serialize_deleted_field():
+    person = Person(name='Harry', house='Gryffindor')
+    person.serialize()
+    del person.house
+    assert person.serialize() == {'name': 'Harry'}
+
+
+def test_serialize_invalid_change():
+    person = Person(name='Harry', house='Gryffindor')
+    person.serialize()
+    person.name = 5
+    with pytest.raises(ValidationError):
+        person.serialize()
+    assert person.errors == {'name': {'msg': CountedString().message.invalid}}
+    person.name = 'Ron'
+    assert person.serialize() == {'name': 'Ron', 'house': 'Gryffindor'}
+
+
+def test_serialize_nested_changes():
+    person = Person(name='Harry', pet=Pet(name='Hedwig'), pets=[Pet(name='Fang'), Pet(name='Crookshanks')])
+    assert person.serialize() == {'name': 'Harry', 'pet': {'name': 'Hedwig'},
+                                  'pets': [{'name': 'Fang'}, {'name': 'Crookshanks'}]}
+    calls = CountedString.calls
+    person.pets[1].name = 'Scabbers'
+    assert person.has_changes()
+    assert person.serialize() == {'name': 'Harry', 'pet': {'name': 'Hedwig'},
+                                  'pets': [{'name': 'Fang'}, {'name': 'Scabbers'}]}
+    assert CountedString.calls == calls + 1
+
+
+def test_serialize_nested_invalid_change():
+    person = Person(name='Harry', pets=[Pet(name='Fang')])
+    person.serialize()
+    person.pets[0].name = 1
+    with pytest.raises(ValidationError):
+        person.serialize()
+    assert person.errors['pets']['errors']['0']['errors'] == {'name': {'msg': CountedString().message.invalid}}
+
+
+def test_mark_changed():
+    person = Person(name='Harry', pets=[Pet(name='Fang')])
+    person.serialize()
+    person.pets.append(Pet(name='Hedwig'))
+    person.mark_changed('pets')
+    assert person.serialize()['pets'] == [{'name': 'Fang'}, {'name': 'Hedwig'}]
+
+
+def test_serialize_with_options_bypasses_cache():
+    person = Person(name='Harry', house='Gryffindor')
+    person.serialize()
+    assert person.serialize(exclude=['house']) == {'name': 'Harry'}
+    assert person.serialize({'name': 'Ron'}) == {'name': 'Ron'}
+
+
+def test_serialize_lazy_deserialized():
+    data = {'name': 'Harry', 'pet': {'name': 'Hedwig'}, 'pets': [{'name': 'Scabbers'}]}
+    person = Person().deserialize(data, lazy=True)
+    assert person.serialize() == data
+    assert not person.has_changes()
+    person.pet.name = 'Fang'
+    assert person.serialize() == dict(data, pet={'name': 'Fang'})